@@ -16,7 +16,7 @@ def main():
     from mcp.server.fastmcp import FastMCP
 
     from evernote_mcp.config import EvernoteConfig
-    from evernote_mcp.client import EvernoteMCPClient
+    from evernote_mcp.client import get_shared_client
     from evernote_mcp.tools.notebook_tools import register_notebook_tools
     from evernote_mcp.tools.note_tools import register_note_tools
     from evernote_mcp.tools.search_tools import register_search_tools
@@ -38,7 +38,7 @@ def main():
 
     # Initialize Evernote client
     try:
-        client = EvernoteMCPClient(
+        client = get_shared_client(
             auth_token=config.auth_token,
             backend=config.backend,
             network_retry_count=config.network_retry_count,
@@ -1,10 +1,20 @@
 """Simplified Evernote API client for MCP server."""
+import asyncio
+import contextlib
+import functools
+import hashlib
 import logging
+import threading
 import time
-from typing import Any
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
 
+from evernote.edam.error.ttypes import EDAMSystemException, EDAMUserException
 from evernote.edam.notestore.ttypes import (
     NoteFilter,
+    NotesMetadataList,
     NotesMetadataResultSpec,
     RelatedQuery,
     RelatedResultSpec,
@@ -20,18 +30,137 @@ from evernote.edam.type.ttypes import (
     Tag,
 )
 from evernote_backup.evernote_client import EvernoteClient as BaseEvernoteClient
+from evernote_backup.evernote_client_util import raise_auth_error
 from evernote_backup.evernote_client_util_ssl import get_cafile_path
 
+from evernote_mcp.transport import NoteStorePool, create_note_store
+from evernote_mcp.util.cache import TTLCache
 from evernote_mcp.util.error_handler import _redact_sensitive_info
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Number of worker threads (each with its own NoteStore client) for bulk calls
+DEFAULT_POOL_SIZE = 8
+
+# findNotesMetadata returns at most this many notes per call
+MAX_NOTES_PER_PAGE = 250
+
+# Seconds that notebook, tag and saved search lookups are served from the cache
+DEFAULT_CACHE_TTL = 60.0
+
+# Seconds a getSyncState result is shared between cache revalidations
+SYNC_STATE_TTL = 1.0
+
+# Seconds a successful token check is trusted by other clients in the process
+VERIFIED_TOKEN_TTL = 300.0
+
+# Token digest -> (User, verified_at); raw tokens are never stored
+_VERIFIED_TOKENS: dict[bytes, tuple[Any, float]] = {}
+_VERIFIED_TOKENS_LOCK = threading.Lock()
+
+# Cache key families dropped when the matching entity type is written
+_NOTEBOOK_FAMILIES = (
+    "list_notebooks", "get_notebook", "get_default_notebook", "list_tags_by_notebook",
+)
+_TAG_FAMILIES = ("list_tags", "get_tag", "list_tags_by_notebook")
+_NOTE_FAMILIES = ("list_tags_by_notebook",)
+_SEARCH_FAMILIES = ("list_searches",)
+
+_MISSING = object()
+
+# Shared findNotesMetadata result specs. Thrift only reads them while
+# encoding a request, so one instance serves every call; never mutate them.
+_NOTE_SEARCH_SPECS = {
+    (include_created, include_content_length): NotesMetadataResultSpec(
+        includeTitle=True,
+        includeUpdated=True,
+        includeNotebookGuid=True,
+        includeCreated=include_created or None,
+        includeContentLength=include_content_length or None,
+    )
+    for include_created in (False, True)
+    for include_content_length in (False, True)
+}
+_REMINDER_SPEC = NotesMetadataResultSpec(
+    includeTitle=True,
+    includeUpdated=True,
+    includeNotebookGuid=True,
+    includeAttributes=True,  # Need attributes for reminder info
+)
+
+
+# Search grammar for notes with any reminder, and with an open reminder
+_FILTER_ALL_REMINDERS = "reminderTime:*"
+_FILTER_ACTIVE_REMINDERS = "reminderTime:* -reminderDoneTime:*"
+
+
+@functools.lru_cache(maxsize=128)
+def _reminder_filter(include_completed: bool, notebook_guid: str | None) -> NoteFilter:
+    """Return the shared (read-only) filter for a reminder search."""
+    words = _FILTER_ALL_REMINDERS if include_completed else _FILTER_ACTIVE_REMINDERS
+    return NoteFilter(words=words, notebookGuid=notebook_guid)
+
+
+def _token_digest(backend: str, token: str) -> bytes:
+    """Return a short, non-reversible cache key for a token."""
+    return hashlib.blake2b(f"{backend}:{token}".encode(), digest_size=16).digest()
+
+
+def _cached(method: Callable[..., T] | None = None, *,
+            revalidate: bool = False) -> Callable[..., T]:
+    """Serve a read-only lookup from ``self._cache``, keyed by method name and args.
+
+    Entries are stamped with the account's sync ``updateCount``. When an entry
+    expires but the server reports the same count, it is re-armed instead of
+    being fetched again. With ``revalidate`` every hit is checked against the
+    current count, for lookups that depend on notes changed elsewhere.
+
+    A cold miss has no entry to keep, so it costs only the lookup itself: it
+    is stamped with a recently seen count if there is one, and otherwise left
+    unstamped until its first refetch.
+    """
+    if method is None:
+        return functools.partial(_cached, revalidate=revalidate)
+
+    family = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self: "EvernoteMCPClient", *args: Any, **kwargs: Any) -> T:
+        key = (family, *args, *sorted(kwargs.items()))
+        entry = self._cache.get(key, _MISSING)
+        if entry is _MISSING or revalidate:
+            stale = self._cache.peek(key, _MISSING)
+            if stale is _MISSING:
+                entry = (self._known_update_count(), method(self, *args, **kwargs))
+            elif self._fresh(stale[0]):
+                entry = stale
+            else:
+                entry = (self._update_count(), method(self, *args, **kwargs))
+            self._cache.set(key, entry)
+        return entry[1]
+
+    return wrapper
+
+
+@dataclass
+class NoteSpec:
+    """Fields for one note created by ``EvernoteMCPClient.create_notes``."""
+
+    title: str
+    content: str
+    notebook_guid: str
+    tag_guids: list[str] | None = None
+
 
 class EvernoteMCPClient(BaseEvernoteClient):
     """Evernote client wrapper for MCP operations."""
 
     def __init__(self, auth_token: str, backend: str = "evernote",
-                 network_retry_count: int = 5, use_system_ssl_ca: bool = False):
+                 network_retry_count: int = 5, use_system_ssl_ca: bool = False,
+                 pool_size: int = DEFAULT_POOL_SIZE,
+                 cache_ttl: float = DEFAULT_CACHE_TTL):
         """Initialize client with configuration.
 
         Args:
@@ -39,6 +168,8 @@ class EvernoteMCPClient(BaseEvernoteClient):
             backend: API backend (evernote, china, china:sandbox)
             network_retry_count: Number of network retries
             use_system_ssl_ca: Use system SSL CA certificates
+            pool_size: Maximum concurrent RPCs issued by bulk operations
+            cache_ttl: Seconds notebook, tag and saved search lookups are cached
         """
         cafile = None
         if use_system_ssl_ca:
@@ -51,6 +182,16 @@ class EvernoteMCPClient(BaseEvernoteClient):
             cafile=cafile,
         )
 
+        # The base class builds a new NoteStore client on every note_store
+        # access; keep one per thread and run bulk calls on long-lived workers
+        # so their clients are reused too.
+        self._note_stores = NoteStorePool(self.get_note_store)
+        self._executor = ThreadPoolExecutor(
+            max_workers=pool_size, thread_name_prefix="evernote-rpc"
+        )
+        self._cache = TTLCache(ttl=cache_ttl)
+        self._sync_state_cache = TTLCache(maxsize=1, ttl=SYNC_STATE_TTL)
+
         # Verify connection on initialization
         try:
             self.verify_token()
@@ -59,37 +200,122 @@ class EvernoteMCPClient(BaseEvernoteClient):
             logger.error("Authentication failed: %s", _redact_sensitive_info(str(e)))
             raise
 
+    def verify_token(self) -> None:
+        """Check the token with getUser, reusing a recent check for the same token.
+
+        Clients built for the same token within ``VERIFIED_TOKEN_TTL`` seconds
+        share the verified user instead of each paying a getUser round trip.
+        """
+        key = _token_digest(self.backend, str(self.token) if self.token else "")
+        with _VERIFIED_TOKENS_LOCK:
+            cached = _VERIFIED_TOKENS.get(key)
+        if cached and time.monotonic() - cached[1] < VERIFIED_TOKEN_TTL:
+            self._user = cached[0].username
+            return
+
+        try:
+            user = self.user_store.getUser()
+        except (EDAMUserException, EDAMSystemException) as e:
+            raise_auth_error(e)
+            raise
+
+        self._user = user.username
+        with _VERIFIED_TOKENS_LOCK:
+            _VERIFIED_TOKENS[key] = (user, time.monotonic())
+
+    @property
+    def note_store(self) -> Any:
+        """NoteStore client for the calling thread."""
+        return self._note_stores.get()
+
+    def get_note_store(self, shard: str | None = None) -> Any:
+        """Build a NoteStore client that reuses the process-wide SSL context."""
+        return create_note_store(
+            url=self._get_endpoint(f"edam/note/{shard or self.shard}"),
+            auth_token=str(self.token) if self.token else "",
+            user_agent=self.user_agent,
+            cafile=self.cafile,
+            retry_max=self.network_error_retry_count,
+        )
+
+    @contextlib.contextmanager
+    def _invalidating(self, *families: str) -> Iterator[None]:
+        """Drop cached ``families`` before and after a write.
+
+        A lookup racing the write on another thread may store the pre-write
+        data; the second drop discards it once the write has returned.
+        """
+        self._cache.invalidate(*families)
+        try:
+            yield
+        finally:
+            self._cache.invalidate(*families)
+
+    def _fan_out(self, func: Callable[[Any], T],
+                 items: Sequence[Any]) -> list[tuple[T | None, Exception | None]]:
+        """Run ``func`` over ``items`` on the client's worker pool.
+
+        Returns ``(value, error)`` pairs in input order; one failing item does
+        not abort the others.
+        """
+        def call(item: Any) -> tuple[T | None, Exception | None]:
+            try:
+                return func(item), None
+            except Exception as e:
+                return None, e
+
+        return list(self._executor.map(call, items))
+
+    def close(self) -> None:
+        """Stop the worker threads used by bulk operations.
+
+        Idle workers exit straight away and calls already running finish in
+        the background; the client must not start bulk operations afterwards.
+        """
+        self._executor.shutdown(wait=False)
+
+    def __enter__(self) -> "EvernoteMCPClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     # Notebook operations
 
+    @_cached
     def list_notebooks(self) -> list[Notebook]:
         """List all notebooks."""
         return self.note_store.listNotebooks()
 
+    @_cached
     def get_notebook(self, guid: str) -> Notebook:
         """Get notebook by GUID."""
         return self.note_store.getNotebook(guid)
 
     def create_notebook(self, name: str, stack: str | None = None) -> Notebook:
         """Create a new notebook."""
-        notebook = Notebook()
-        notebook.name = name
-        if stack:
-            notebook.stack = stack
-
-        return self.note_store.createNotebook(notebook)
+        notebook = Notebook(name=name, stack=stack or None)
+        with self._invalidating(*_NOTEBOOK_FAMILIES):
+            return self.note_store.createNotebook(notebook)
 
     def update_notebook(self, notebook: Notebook) -> int:
         """Update existing notebook."""
-        return self.note_store.updateNotebook(notebook)
+        with self._invalidating(*_NOTEBOOK_FAMILIES):
+            return self.note_store.updateNotebook(notebook)
 
     def expunge_notebook(self, guid: str) -> int:
         """Permanently delete notebook."""
-        return self.note_store.expungeNotebook(guid)
+        with self._invalidating(*_NOTEBOOK_FAMILIES):
+            return self.note_store.expungeNotebook(guid)
 
     # Note operations
 
-    def get_note(self, guid: str, with_content: bool = True) -> Note:
-        """Get note by GUID."""
+    def get_note(self, guid: str, with_content: bool = False) -> Note:
+        """Get note by GUID.
+
+        Content is only downloaded when ``with_content`` is set; use
+        ``get_note_content`` to fetch it on demand for a metadata-only note.
+        """
         return self.note_store.getNote(
             guid,
             withContent=with_content,
@@ -98,91 +324,232 @@ class EvernoteMCPClient(BaseEvernoteClient):
             withResourcesAlternateData=False,
         )
 
+    def get_notes(self, guids: Sequence[str],
+                  with_content: bool = False) -> list[dict[str, Any]]:
+        """Get several notes concurrently (up to ``pool_size`` at a time).
+
+        Args:
+            guids: Note GUIDs to fetch
+            with_content: Include ENML content
+
+        Returns:
+            One ``{"guid", "note", "error"}`` dict per GUID, in input order.
+            Failed lookups have ``note=None`` and the exception in ``error``.
+        """
+        results = self._fan_out(
+            lambda guid: self.get_note(guid, with_content=with_content),
+            guids,
+        )
+        return [
+            {"guid": guid, "note": note, "error": error}
+            for guid, (note, error) in zip(guids, results)
+        ]
+
     def create_note(self, title: str, content: str, notebook_guid: str,
                     tag_guids: list[str] | None = None) -> Note:
         """Create a new note."""
-        note = Note()
-        note.title = title
-        note.content = content
-        note.notebookGuid = notebook_guid
-        if tag_guids:
-            note.tagGuids = tag_guids
+        note = Note(
+            title=title,
+            content=content,
+            notebookGuid=notebook_guid,
+            tagGuids=tag_guids or None,
+        )
+        with self._invalidating(*_NOTE_FAMILIES):
+            return self.note_store.createNote(note)
+
+    def create_notes(self, specs: Sequence[NoteSpec]) -> list[dict[str, Any]]:
+        """Create several notes concurrently (up to ``pool_size`` at a time).
+
+        Rate-limited calls are retried by the NoteStore client itself, so
+        concurrent workers back off together at the server's pace.
 
-        return self.note_store.createNote(note)
+        Args:
+            specs: Notes to create
+
+        Returns:
+            One ``{"spec", "note", "error"}`` dict per spec, in input order.
+            Failed creations have ``note=None`` and the exception in ``error``.
+        """
+        results = self._fan_out(
+            lambda spec: self.create_note(
+                spec.title, spec.content, spec.notebook_guid, spec.tag_guids
+            ),
+            specs,
+        )
+        return [
+            {"spec": spec, "note": note, "error": error}
+            for spec, (note, error) in zip(specs, results)
+        ]
 
     def update_note(self, note: Note) -> Note:
         """Update existing note."""
-        return self.note_store.updateNote(note)
+        with self._invalidating(*_NOTE_FAMILIES):
+            return self.note_store.updateNote(note)
 
-    def delete_note(self, guid: str) -> Note:
-        """Move note to trash (by setting active to False)."""
-        note = self.get_note(guid, with_content=False)
-        note.active = False
-        return self.note_store.updateNote(note)
+    def delete_note(self, guid: str) -> int:
+        """Move note to trash.
+
+        Uses the deleteNote RPC, which marks the note inactive server-side
+        without fetching and re-sending it.
+
+        Returns:
+            Update sequence number of the change
+        """
+        with self._invalidating(*_NOTE_FAMILIES):
+            return self.note_store.deleteNote(guid)
 
     def expunge_note(self, guid: str) -> int:
         """Permanently delete note."""
-        return self.note_store.expungeNote(guid)
+        with self._invalidating(*_NOTE_FAMILIES):
+            return self.note_store.expungeNote(guid)
 
     def copy_note(self, guid: str, target_notebook_guid: str) -> Note:
         """Copy note to another notebook."""
-        return self.note_store.copyNote(guid, target_notebook_guid)
+        with self._invalidating(*_NOTE_FAMILIES):
+            return self.note_store.copyNote(guid, target_notebook_guid)
 
     def find_notes(self, query: str, notebook_guid: str | None = None,
-                   limit: int = 100) -> Any:
-        """Search notes using Evernote's search syntax."""
-        note_filter = NoteFilter()
-        note_filter.words = query
-        if notebook_guid:
-            note_filter.notebookGuid = notebook_guid
-
-        result_spec = NotesMetadataResultSpec()
-        result_spec.includeTitle = True
-        result_spec.includeContent = True
-        result_spec.includeUpdated = True
-        result_spec.includeNotebookGuid = True
-
-        return self.note_store.findNotesMetadata(
-            filter=note_filter,
-            offset=0,
-            maxNotes=limit,
-            resultSpec=result_spec,
+                   limit: int = 100, include_created: bool = False,
+                   include_content_length: bool = False) -> NotesMetadataList:
+        """Search notes using Evernote's search syntax.
+
+        Only note metadata is returned; fetch bodies on demand with
+        ``get_note_content``. Results beyond the server's 250-notes-per-call
+        cap are fetched in further pages until ``limit`` or the total number
+        of matches is reached.
+
+        Args:
+            query: Evernote search query
+            notebook_guid: Optional notebook to search
+            limit: Maximum results
+            include_created: Also return each note's creation time
+            include_content_length: Also return each note's content size in bytes
+        """
+        note_filter, result_spec = self._note_search(
+            query, notebook_guid, include_created, include_content_length
         )
+        return self._find_notes_metadata(note_filter, result_spec, limit)
+
+    def iter_notes(self, query: str, notebook_guid: str | None = None,
+                   page_size: int = MAX_NOTES_PER_PAGE,
+                   include_created: bool = False,
+                   include_content_length: bool = False) -> Iterator[Any]:
+        """Yield matching note metadata one note at a time.
+
+        The next page is only requested once the caller has consumed the
+        current one, so stopping early saves the remaining round trips and
+        memory stays bounded by ``page_size``.
 
+        Args:
+            query: Evernote search query
+            notebook_guid: Optional notebook to search
+            page_size: Notes requested per call (at most 250)
+            include_created: Also return each note's creation time
+            include_content_length: Also return each note's content size in bytes
+        """
+        note_filter, result_spec = self._note_search(
+            query, notebook_guid, include_created, include_content_length
+        )
+        page_size = min(page_size, MAX_NOTES_PER_PAGE)
+        note_store = self.note_store
+        offset = 0
+        while True:
+            page = note_store.findNotesMetadata(
+                filter=note_filter,
+                offset=offset,
+                maxNotes=page_size,
+                resultSpec=result_spec,
+            )
+            if not page.notes:
+                return
+            yield from page.notes
+            offset += len(page.notes)
+            if offset >= page.totalNotes:
+                return
+
+    @staticmethod
+    def _note_search(query: str, notebook_guid: str | None, include_created: bool,
+                     include_content_length: bool
+                     ) -> tuple[NoteFilter, NotesMetadataResultSpec]:
+        """Build the filter and pick the shared metadata-only result spec for a note search."""
+        note_filter = NoteFilter(words=query, notebookGuid=notebook_guid or None)
+        result_spec = _NOTE_SEARCH_SPECS[bool(include_created), bool(include_content_length)]
+        return note_filter, result_spec
+
+    def _find_notes_metadata(self, note_filter: NoteFilter,
+                             result_spec: NotesMetadataResultSpec,
+                             limit: int) -> NotesMetadataList:
+        """Call findNotesMetadata page by page and merge the pages.
+
+        The first page reports the total number of matches; the remaining
+        pages up to ``limit`` are then fetched concurrently on the worker
+        pool, reusing the same filter and result spec.
+
+        Returns the first page's NotesMetadataList with ``notes`` holding up
+        to ``limit`` notes from all pages, in server order.
+        """
+        def fetch(offset: int, max_notes: int) -> NotesMetadataList:
+            return self.note_store.findNotesMetadata(
+                filter=note_filter,
+                offset=offset,
+                maxNotes=max_notes,
+                resultSpec=result_spec,
+            )
+
+        result = fetch(0, min(MAX_NOTES_PER_PAGE, limit))
+        notes = list(result.notes or [])
+        end = min(limit, result.totalNotes) if notes else 0
+        if len(notes) < end:
+            pages = self._fan_out(
+                lambda offset: fetch(offset, min(MAX_NOTES_PER_PAGE, end - offset)),
+                range(len(notes), end, MAX_NOTES_PER_PAGE),
+            )
+            for page, error in pages:
+                if error is not None:
+                    raise error
+                notes.extend(page.notes or [])
+        result.notes = notes
+        return result
+
+    @_cached
     def list_tags(self) -> list[Any]:
         """List all tags."""
         return self.note_store.listTags()
 
+    @_cached
     def get_tag(self, guid: str) -> Tag:
         """Get tag by GUID."""
         return self.note_store.getTag(guid)
 
     def create_tag(self, name: str, parent_guid: str | None = None) -> Tag:
         """Create a new tag."""
-        tag = Tag()
-        tag.name = name
-        if parent_guid:
-            tag.parentGuid = parent_guid
-        return self.note_store.createTag(tag)
+        tag = Tag(name=name, parentGuid=parent_guid or None)
+        with self._invalidating(*_TAG_FAMILIES):
+            return self.note_store.createTag(tag)
 
     def update_tag(self, tag: Tag) -> int:
         """Update existing tag."""
-        return self.note_store.updateTag(tag)
+        with self._invalidating(*_TAG_FAMILIES):
+            return self.note_store.updateTag(tag)
 
     def expunge_tag(self, guid: str) -> int:
         """Permanently delete tag."""
-        return self.note_store.expungeTag(guid)
+        with self._invalidating(*_TAG_FAMILIES):
+            return self.note_store.expungeTag(guid)
 
+    @_cached(revalidate=True)
     def list_tags_by_notebook(self, notebook_guid: str) -> list[Tag]:
         """List all tags used in a specific notebook."""
         return self.note_store.listTagsByNotebook(notebook_guid)
 
     def untag_all(self, guid: str) -> None:
         """Remove a tag from all notes."""
-        self.note_store.untagAll(guid)
+        with self._invalidating(*_NOTE_FAMILIES):
+            self.note_store.untagAll(guid)
 
     # Saved search operations
 
+    @_cached
     def list_searches(self) -> list[SavedSearch]:
         """List all saved searches."""
         return self.note_store.listSearches()
@@ -193,18 +560,19 @@ class EvernoteMCPClient(BaseEvernoteClient):
 
     def create_search(self, name: str, query: str) -> SavedSearch:
         """Create a new saved search."""
-        search = SavedSearch()
-        search.name = name
-        search.query = query
-        return self.note_store.createSearch(search)
+        search = SavedSearch(name=name, query=query)
+        with self._invalidating(*_SEARCH_FAMILIES):
+            return self.note_store.createSearch(search)
 
     def update_search(self, search: SavedSearch) -> int:
         """Update existing saved search."""
-        return self.note_store.updateSearch(search)
+        with self._invalidating(*_SEARCH_FAMILIES):
+            return self.note_store.updateSearch(search)
 
     def expunge_search(self, guid: str) -> int:
         """Permanently delete saved search."""
-        return self.note_store.expungeSearch(guid)
+        with self._invalidating(*_SEARCH_FAMILIES):
+            return self.note_store.expungeSearch(guid)
 
     # Advanced note operations
 
@@ -237,10 +605,46 @@ class EvernoteMCPClient(BaseEvernoteClient):
 
     # Sync and utility functions
 
+    def _update_count(self) -> int | None:
+        """Return the account's current sync updateCount, or None if unavailable.
+
+        A single getSyncState result is shared for ``SYNC_STATE_TTL`` seconds
+        so that a burst of cache revalidations costs one RPC.
+        """
+        try:
+            return self.get_sync_state().updateCount
+        except Exception as e:
+            logger.debug("getSyncState failed, skipping cache revalidation: %s",
+                         type(e).__name__)
+            return None
+
+    def _known_update_count(self) -> int | None:
+        """Return the updateCount of a still-shared getSyncState result, without an RPC."""
+        state = self._sync_state_cache.get(("get_sync_state",))
+        return None if state is None else state.updateCount
+
+    def _fresh(self, update_count: int | None) -> bool:
+        """Return True if nothing changed on the server since ``update_count``."""
+        return update_count is not None and self._update_count() == update_count
+
+    def clear_cache(self) -> None:
+        """Drop every cached lookup so the next calls go to the server."""
+        self._cache.clear()
+        self._sync_state_cache.clear()
+
     def get_sync_state(self) -> Any:
-        """Get sync state information."""
-        return self.note_store.getSyncState()
+        """Get sync state information.
+
+        One getSyncState result is shared for ``SYNC_STATE_TTL`` seconds, by
+        pollers and cache revalidation alike.
+        """
+        state = self._sync_state_cache.get(("get_sync_state",))
+        if state is None:
+            state = self.note_store.getSyncState()
+            self._sync_state_cache.set(("get_sync_state",), state)
+        return state
 
+    @_cached
     def get_default_notebook(self) -> Notebook:
         """Get the default notebook."""
         return self.note_store.getDefaultNotebook()
@@ -270,6 +674,54 @@ class EvernoteMCPClient(BaseEvernoteClient):
             withAlternateData=with_alternate_data,
         )
 
+    def get_resources(self, guids: Sequence[str], with_data: bool = False,
+                      with_recognition: bool = False,
+                      with_attributes: bool = True,
+                      with_alternate_data: bool = False) -> list[dict[str, Any]]:
+        """Get several resources concurrently (up to ``pool_size`` at a time).
+
+        Args:
+            guids: Resource GUIDs to fetch
+            with_data: Include binary data
+            with_recognition: Include recognition data
+            with_attributes: Include resource attributes
+            with_alternate_data: Include alternate data
+
+        Returns:
+            One ``{"guid", "resource", "error"}`` dict per GUID, in input order.
+            Failed lookups have ``resource=None`` and the exception in ``error``.
+        """
+        results = self._fan_out(
+            lambda guid: self.get_resource(
+                guid,
+                with_data=with_data,
+                with_recognition=with_recognition,
+                with_attributes=with_attributes,
+                with_alternate_data=with_alternate_data,
+            ),
+            guids,
+        )
+        return [
+            {"guid": guid, "resource": resource, "error": error}
+            for guid, (resource, error) in zip(guids, results)
+        ]
+
+    def get_resource_datas(self, guids: Sequence[str]) -> list[dict[str, Any]]:
+        """Get the binary data of several resources concurrently.
+
+        Args:
+            guids: Resource GUIDs to fetch
+
+        Returns:
+            One ``{"guid", "data", "error"}`` dict per GUID, in input order.
+            Failed lookups have ``data=None`` and the exception in ``error``.
+        """
+        results = self._fan_out(self.get_resource_data, guids)
+        return [
+            {"guid": guid, "data": data, "error": error}
+            for guid, (data, error) in zip(guids, results)
+        ]
+
     def get_resource_data(self, guid: str) -> bytes:
         """Get resource binary data."""
         return self.note_store.getResourceData(guid)
@@ -340,11 +792,13 @@ class EvernoteMCPClient(BaseEvernoteClient):
             reminder_order: Order for sorting reminders (auto-generated if None)
 
         Returns:
-            Updated note
+            Updated note, or the fetched note unchanged if the reminder
+            already had these values (no update is sent)
         """
         note = self.get_note(note_guid, with_content=False)
         if not note.attributes:
             note.attributes = NoteAttributes()
+        current = (note.attributes.reminderTime, note.attributes.reminderOrder)
 
         note.attributes.reminderTime = reminder_time
         if reminder_order is not None:
@@ -353,6 +807,8 @@ class EvernoteMCPClient(BaseEvernoteClient):
             # Auto-generate order if setting reminder for first time
             note.attributes.reminderOrder = int(time.time() * 1000)
 
+        if (note.attributes.reminderTime, note.attributes.reminderOrder) == current:
+            return note
         return self.note_store.updateNote(note)
 
     def complete_reminder(self, note_guid: str, done_time: int | None = None) -> Note:
@@ -380,13 +836,18 @@ class EvernoteMCPClient(BaseEvernoteClient):
             note_guid: Note GUID
 
         Returns:
-            Updated note
+            Updated note, or the fetched note unchanged if it had no
+            reminder (no update is sent)
         """
         note = self.get_note(note_guid, with_content=False)
-        if note.attributes:
-            note.attributes.reminderTime = None
-            note.attributes.reminderDoneTime = None
-            note.attributes.reminderOrder = None
+        attrs = note.attributes
+        if not attrs or (attrs.reminderTime is None and attrs.reminderDoneTime is None
+                         and attrs.reminderOrder is None):
+            return note
+
+        attrs.reminderTime = None
+        attrs.reminderDoneTime = None
+        attrs.reminderOrder = None
 
         return self.note_store.updateNote(note)
 
@@ -402,27 +863,69 @@ class EvernoteMCPClient(BaseEvernoteClient):
         Returns:
             NotesMetadataList with reminder notes
         """
-        note_filter = NoteFilter()
+        note_filter = _reminder_filter(include_completed, notebook_guid or None)
+        return self._find_notes_metadata(note_filter, _REMINDER_SPEC, limit)
 
-        # Search for notes with reminders
-        if include_completed:
-            note_filter.words = "reminderTime:*"
-        else:
-            note_filter.words = "reminderTime:* -reminderDoneTime:*"
-
-        if notebook_guid:
-            note_filter.notebookGuid = notebook_guid
-
-        result_spec = NotesMetadataResultSpec()
-        result_spec.includeTitle = True
-        result_spec.includeUpdated = True
-        result_spec.includeNotebookGuid = True
-        result_spec.includeAttributes = True  # Need attributes for reminder info
-
-        return self.note_store.findNotesMetadata(
-            filter=note_filter,
-            offset=0,
-            maxNotes=limit,
-            resultSpec=result_spec,
-        )
 
+_SHARED_CLIENTS: dict[bytes, EvernoteMCPClient] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
+def get_shared_client(auth_token: str, backend: str = "evernote",
+                      **kwargs: Any) -> EvernoteMCPClient:
+    """Return the process-wide client for a token, creating it on first use.
+
+    The client's NoteStore pool, worker threads and caches are reused by
+    every caller instead of being rebuilt per request. Clients are keyed by
+    a digest of backend and token; ``kwargs`` only apply when the client is
+    first created.
+
+    Args:
+        auth_token: Evernote developer token
+        backend: API backend (evernote, china, china:sandbox)
+        **kwargs: Extra ``EvernoteMCPClient`` constructor arguments
+
+    Returns:
+        Shared client for this token and backend
+    """
+    key = _token_digest(backend, auth_token)
+    # Clients are never removed, so a hit needs no lock; only creation is
+    # serialized, and re-checked so concurrent first calls build one client.
+    client = _SHARED_CLIENTS.get(key)
+    if client is not None:
+        return client
+    with _SHARED_CLIENTS_LOCK:
+        client = _SHARED_CLIENTS.get(key)
+        if client is None:
+            client = _SHARED_CLIENTS[key] = EvernoteMCPClient(
+                auth_token=auth_token, backend=backend, **kwargs
+            )
+    return client
+
+
+class AsyncEvernoteMCPClient:
+    """Awaitable view of an EvernoteMCPClient.
+
+    Every public client method is exposed as a coroutine function that runs
+    the blocking Thrift call in a worker thread, so an event loop can await
+    several RPCs concurrently, e.g. with ``asyncio.gather``.
+    """
+
+    def __init__(self, client: EvernoteMCPClient):
+        """Wrap an existing client.
+
+        Args:
+            client: Synchronous client whose methods are exposed
+        """
+        self._client = client
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await asyncio.to_thread(attr, *args, **kwargs)
+
+        return call
@@ -1,11 +1,11 @@
 """MCP resources for notes."""
 import logging
-import json
 from mcp.server.fastmcp import FastMCP
 from evernote.edam.error.ttypes import EDAMNotFoundException
 
 from evernote_mcp.util.enml_converter import enml_to_text, enml_to_markdown
-from evernote_mcp.util.error_handler import handle_evernote_error
+from evernote_mcp.util.error_handler import error_json
+from evernote_mcp.util.serialization import dumps
 
 logger = logging.getLogger(__name__)
 
@@ -40,11 +40,11 @@ def register_note_resources(mcp: FastMCP, client):
                 "active": note.active,
                 "tag_guids": note.tagGuids or [],
             }
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except EDAMNotFoundException:
-            return json.dumps({"error": f"Note {guid} not found"}, indent=2)
+            return dumps({"error": f"Note {guid} not found"})
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
     @mcp.resource("file://note-text/{guid}")
     def get_note_text(guid: str) -> str:
@@ -1,9 +1,9 @@
 """MCP resources for notebooks."""
 import logging
-import json
 from mcp.server.fastmcp import FastMCP
 
-from evernote_mcp.util.error_handler import handle_evernote_error
+from evernote_mcp.util.error_handler import error_json
+from evernote_mcp.util.serialization import dumps
 
 logger = logging.getLogger(__name__)
 
@@ -34,9 +34,9 @@ def register_notebook_resources(mcp: FastMCP, client):
                     for nb in notebooks
                 ]
             }
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
     @mcp.resource("file://notebook/{guid}")
     def get_notebook_metadata(guid: str) -> str:
@@ -61,6 +61,6 @@ def register_notebook_resources(mcp: FastMCP, client):
                 "updated": notebook.serviceUpdated,
                 "default_notebook": getattr(notebook, 'defaultNotebook', False),
             }
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
@@ -1,18 +1,20 @@
 """MCP tools for advanced note operations."""
 import logging
-import json
 from mcp.server.fastmcp import FastMCP
 
-from evernote_mcp.util.error_handler import handle_evernote_error
+from evernote_mcp.client import AsyncEvernoteMCPClient
+from evernote_mcp.util.error_handler import error_json
+from evernote_mcp.util.serialization import dumps
 
 logger = logging.getLogger(__name__)
 
 
 def register_note_advanced_tools(mcp: FastMCP, client):
     """Register advanced note-related MCP tools."""
+    aclient = AsyncEvernoteMCPClient(client)
 
-    @mcp.tool()
-    def get_note_content(guid: str) -> str:
+    @mcp.tool(structured_output=False)
+    async def get_note_content(guid: str) -> str:
         """
         Get just the ENML content of a note.
 
@@ -23,18 +25,18 @@ def register_note_advanced_tools(mcp: FastMCP, client):
             JSON string with note ENML content
         """
         try:
-            content = client.get_note_content(guid)
+            content = await aclient.get_note_content(guid)
             result = {
                 "success": True,
                 "guid": guid,
                 "content": content,
             }
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
-    def get_note_search_text(guid: str, note_only: bool = False,
+    @mcp.tool(structured_output=False)
+    async def get_note_search_text(guid: str, note_only: bool = False,
                               tokenize_for_indexing: bool = False) -> str:
         """
         Get extracted plain text from a note for indexing.
@@ -50,7 +52,7 @@ def register_note_advanced_tools(mcp: FastMCP, client):
             JSON string with extracted text
         """
         try:
-            text = client.get_note_search_text(guid, note_only, tokenize_for_indexing)
+            text = await aclient.get_note_search_text(guid, note_only, tokenize_for_indexing)
             result = {
                 "success": True,
                 "guid": guid,
@@ -58,12 +60,12 @@ def register_note_advanced_tools(mcp: FastMCP, client):
                 "note_only": note_only,
                 "tokenized": tokenize_for_indexing,
             }
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
-    def get_note_tag_names(guid: str) -> str:
+    @mcp.tool(structured_output=False)
+    async def get_note_tag_names(guid: str) -> str:
         """
         Get tag names for a note.
 
@@ -74,18 +76,18 @@ def register_note_advanced_tools(mcp: FastMCP, client):
             JSON string with list of tag names
         """
         try:
-            tag_names = client.get_note_tag_names(guid)
+            tag_names = await aclient.get_note_tag_names(guid)
             result = {
                 "success": True,
                 "guid": guid,
                 "tag_names": tag_names,
             }
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
-    def list_note_versions(note_guid: str) -> str:
+    @mcp.tool(structured_output=False)
+    async def list_note_versions(note_guid: str) -> str:
         """
         List previous versions of a note (Premium only).
 
@@ -96,7 +98,7 @@ def register_note_advanced_tools(mcp: FastMCP, client):
             JSON string with list of note versions
         """
         try:
-            versions = client.list_note_versions(note_guid)
+            versions = await aclient.list_note_versions(note_guid)
             result = {
                 "success": True,
                 "note_guid": note_guid,
@@ -113,12 +115,12 @@ def register_note_advanced_tools(mcp: FastMCP, client):
                 "count": len(versions),
             }
             logger.info(f"Listed {len(versions)} version(s) for note {note_guid}")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
-    def get_note_version(note_guid: str, update_sequence_num: int,
+    @mcp.tool(structured_output=False)
+    async def get_note_version(note_guid: str, update_sequence_num: int,
                          with_resources_data: bool = False,
                          with_resources_recognition: bool = False,
                          with_resources_alternate_data: bool = False) -> str:
@@ -136,7 +138,7 @@ def register_note_advanced_tools(mcp: FastMCP, client):
             JSON string with note version info
         """
         try:
-            note = client.get_note_version(
+            note = await aclient.get_note_version(
                 note_guid, update_sequence_num,
                 with_resources_data, with_resources_recognition, with_resources_alternate_data
             )
@@ -148,6 +150,6 @@ def register_note_advanced_tools(mcp: FastMCP, client):
                 "update_sequence_num": note.updateSequenceNum,
                 "updated": note.updated,
             }
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
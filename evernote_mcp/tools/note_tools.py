@@ -1,12 +1,12 @@
 """MCP tools for note operations."""
 import logging
 from typing import Optional, List
-import json
 from mcp.server.fastmcp import FastMCP
 from evernote.edam.error.ttypes import EDAMNotFoundException
 
 from evernote_mcp.util.enml_converter import enml_to_text, enml_to_markdown, text_to_enml
-from evernote_mcp.util.error_handler import handle_evernote_error
+from evernote_mcp.util.error_handler import error_json
+from evernote_mcp.util.serialization import dumps
 from evernote_mcp.util.validators import (
     ValidationError,
     validate_title,
@@ -21,7 +21,7 @@ logger = logging.getLogger(__name__)
 def register_note_tools(mcp: FastMCP, client):
     """Register note-related MCP tools."""
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def create_note(
         title: str,
         content: str,
@@ -66,13 +66,13 @@ def register_note_tools(mcp: FastMCP, client):
                 "created": note.created,
             }
             logger.info(f"Created note: {note.guid}")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except ValidationError:
             raise
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def get_note(guid: str, output_format: str = "enml") -> str:
         """
         Get note content and metadata.
@@ -128,13 +128,13 @@ def register_note_tools(mcp: FastMCP, client):
                     "notebook_guid": note.notebookGuid,
                 }
 
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except EDAMNotFoundException:
-            return json.dumps({"success": False, "error": f"Note {guid} not found"}, indent=2)
+            return dumps({"success": False, "error": f"Note {guid} not found"})
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def update_note(
         guid: str,
         title: Optional[str] = None,
@@ -175,13 +175,13 @@ def register_note_tools(mcp: FastMCP, client):
                 "updated": updated.updated,
             }
             logger.info(f"Updated note: {updated.guid}")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except ValidationError:
             raise
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def delete_note(guid: str) -> str:
         """
         Move a note to trash.
@@ -193,18 +193,18 @@ def register_note_tools(mcp: FastMCP, client):
             JSON string with operation result
         """
         try:
-            note = client.delete_note(guid)
+            usn = client.delete_note(guid)
             result = {
                 "success": True,
                 "message": f"Note {guid} moved to trash",
-                "title": note.title,
+                "update_sequence_num": usn,
             }
             logger.info(f"Moved note to trash: {guid}")
-            return json.dumps(result, indent=2)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def expunge_note(guid: str) -> str:
         """
         Permanently delete a note.
@@ -222,11 +222,11 @@ def register_note_tools(mcp: FastMCP, client):
                 "message": f"Note {guid} permanently deleted"
             }
             logger.info(f"Permanently deleted note: {guid}")
-            return json.dumps(result, indent=2)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def copy_note(guid: str, target_notebook_guid: str) -> str:
         """
         Copy a note to another notebook.
@@ -247,11 +247,11 @@ def register_note_tools(mcp: FastMCP, client):
                 "notebook_guid": new_note.notebookGuid,
             }
             logger.info(f"Copied note {guid} to {new_note.guid}")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def move_note(guid: str, target_notebook_guid: str) -> str:
         """
         Move a note to another notebook.
@@ -277,11 +277,11 @@ def register_note_tools(mcp: FastMCP, client):
                 "to_notebook_guid": updated.notebookGuid,
             }
             logger.info(f"Moved note {guid} from {old_notebook} to {target_notebook_guid}")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def list_notes(notebook_guid: Optional[str] = None, limit: int = 100) -> str:
         """
         List notes in a notebook or all notes.
@@ -315,8 +315,8 @@ def register_note_tools(mcp: FastMCP, client):
                 "count": len(notes_data),
                 "notes": notes_data,
             }
-            return json.dumps(response, indent=2, ensure_ascii=False)
+            return dumps(response)
         except ValidationError:
             raise
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
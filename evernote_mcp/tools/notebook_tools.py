@@ -1,11 +1,13 @@
 """MCP tools for notebook operations."""
+import copy
 import logging
 from typing import Optional
 from mcp.server.fastmcp import FastMCP
 from evernote.edam.error.ttypes import EDAMUserException, EDAMSystemException
 from evernote.edam.type.ttypes import Notebook
 
-from evernote_mcp.util.error_handler import handle_evernote_error
+from evernote_mcp.util.error_handler import error_json
+from evernote_mcp.util.serialization import dumps
 
 logger = logging.getLogger(__name__)
 
@@ -13,7 +15,7 @@ logger = logging.getLogger(__name__)
 def register_notebook_tools(mcp: FastMCP, client):
     """Register notebook-related MCP tools."""
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def create_notebook(name: str, stack: Optional[str] = None) -> str:
         """
         Create a new Evernote notebook.
@@ -35,11 +37,11 @@ def register_notebook_tools(mcp: FastMCP, client):
                 "created": notebook.serviceCreated,
             }
             logger.info(f"Created notebook: {notebook.name} ({notebook.guid})")
-            return __import__("json").dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except Exception as e:
-            return __import__("json").dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def update_notebook(
         guid: str,
         name: Optional[str] = None,
@@ -57,7 +59,9 @@ def register_notebook_tools(mcp: FastMCP, client):
             JSON string with updated notebook info
         """
         try:
-            notebook = client.get_notebook(guid)
+            # get_notebook may hand out the client's cached struct; edit a
+            # copy so a rejected update leaves the cache untouched
+            notebook = copy.copy(client.get_notebook(guid))
             if name:
                 notebook.name = name
             if stack is not None:
@@ -72,11 +76,11 @@ def register_notebook_tools(mcp: FastMCP, client):
                 "update_sequence_num": usn,
             }
             logger.info(f"Updated notebook: {notebook.name} ({notebook.guid})")
-            return __import__("json").dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except Exception as e:
-            return __import__("json").dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def delete_notebook(guid: str) -> str:
         """
         Delete a notebook (moves notes to trash, permanently deletes notebook).
@@ -94,11 +98,11 @@ def register_notebook_tools(mcp: FastMCP, client):
                 "message": f"Notebook {guid} deleted"
             }
             logger.info(f"Deleted notebook: {guid}")
-            return __import__("json").dumps(result, indent=2)
+            return dumps(result)
         except Exception as e:
-            return __import__("json").dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def list_notebooks() -> str:
         """
         List all notebooks in the Evernote account.
@@ -123,11 +127,11 @@ def register_notebook_tools(mcp: FastMCP, client):
                 ]
             }
             logger.info(f"Listed {len(notebooks)} notebook(s)")
-            return __import__("json").dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except Exception as e:
-            return __import__("json").dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def get_notebook(guid: str) -> str:
         """
         Get notebook details by GUID.
@@ -149,6 +153,6 @@ def register_notebook_tools(mcp: FastMCP, client):
                 "updated": notebook.serviceUpdated,
                 "default_notebook": getattr(notebook, 'defaultNotebook', False),
             }
-            return __import__("json").dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except Exception as e:
-            return __import__("json").dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
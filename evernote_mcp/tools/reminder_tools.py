@@ -1,20 +1,31 @@
 """MCP tools for reminder operations."""
 
-import json
 import logging
 
 from mcp.server.fastmcp import FastMCP
 
-from evernote_mcp.util.error_handler import handle_evernote_error
+from evernote_mcp.client import AsyncEvernoteMCPClient
+from evernote_mcp.util.error_handler import error_json
+from evernote_mcp.util.serialization import FieldPicker, dumps
 
 logger = logging.getLogger(__name__)
 
+_pick_note = FieldPicker(
+    guid="guid", title="title", notebook_guid="notebookGuid", updated="updated"
+)
+_pick_reminder = FieldPicker(
+    reminder_time="reminderTime",
+    reminder_order="reminderOrder",
+    reminder_done_time="reminderDoneTime",
+)
+
 
 def register_reminder_tools(mcp: FastMCP, client):
     """Register reminder-related MCP tools."""
+    aclient = AsyncEvernoteMCPClient(client)
 
-    @mcp.tool()
-    def set_reminder(
+    @mcp.tool(structured_output=False)
+    async def set_reminder(
         note_guid: str,
         reminder_time: int | None = None,
         reminder_order: int | None = None,
@@ -33,7 +44,7 @@ def register_reminder_tools(mcp: FastMCP, client):
             JSON string with updated note info
         """
         try:
-            note = client.set_reminder(note_guid, reminder_time, reminder_order)
+            note = await aclient.set_reminder(note_guid, reminder_time, reminder_order)
             result = {
                 "success": True,
                 "note_guid": note.guid,
@@ -46,12 +57,12 @@ def register_reminder_tools(mcp: FastMCP, client):
                 else None,
             }
             logger.info(f"Set reminder on note {note_guid}: {reminder_time}")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
-    def complete_reminder(note_guid: str, done_time: int | None = None) -> str:
+    @mcp.tool(structured_output=False)
+    async def complete_reminder(note_guid: str, done_time: int | None = None) -> str:
         """
         Mark a reminder as completed.
 
@@ -64,7 +75,7 @@ def register_reminder_tools(mcp: FastMCP, client):
             JSON string with updated note info
         """
         try:
-            note = client.complete_reminder(note_guid, done_time)
+            note = await aclient.complete_reminder(note_guid, done_time)
             result = {
                 "success": True,
                 "note_guid": note.guid,
@@ -77,12 +88,12 @@ def register_reminder_tools(mcp: FastMCP, client):
                 else None,
             }
             logger.info(f"Completed reminder on note {note_guid}")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
-    def clear_reminder(note_guid: str) -> str:
+    @mcp.tool(structured_output=False)
+    async def clear_reminder(note_guid: str) -> str:
         """
         Clear all reminder fields from a note.
 
@@ -93,7 +104,7 @@ def register_reminder_tools(mcp: FastMCP, client):
             JSON string with operation result
         """
         try:
-            note = client.clear_reminder(note_guid)
+            note = await aclient.clear_reminder(note_guid)
             result = {
                 "success": True,
                 "note_guid": note.guid,
@@ -101,12 +112,12 @@ def register_reminder_tools(mcp: FastMCP, client):
                 "message": "Reminder cleared",
             }
             logger.info(f"Cleared reminder from note {note_guid}")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
-    def list_reminders(
+    @mcp.tool(structured_output=False)
+    async def list_reminders(
         notebook_guid: str | None = None,
         limit: int = 100,
         include_completed: bool = False,
@@ -123,50 +134,35 @@ def register_reminder_tools(mcp: FastMCP, client):
             JSON string with list of notes with reminders
         """
         try:
-            result = client.find_reminders(notebook_guid, limit, include_completed)
-            notes_list = result.notes if hasattr(result, "notes") else []
+            result = await aclient.find_reminders(notebook_guid, limit, include_completed)
+            notes_list = result.notes or []
 
+            # find_reminders requests title, notebook, updated and attributes,
+            # so every field below is present (possibly None) on each note.
             reminders_data = []
             for n in notes_list[:limit]:
-                reminder_info = {
-                    "guid": n.guid,
-                    "title": n.title if hasattr(n, "title") else "",
-                    "notebook_guid": n.notebookGuid
-                    if hasattr(n, "notebookGuid")
-                    else None,
-                    "updated": n.updated if hasattr(n, "updated") else None,
-                }
+                reminder_info = _pick_note(n)
 
                 # Extract reminder attributes
-                if hasattr(n, "attributes") and n.attributes:
-                    reminder_info["reminder_time"] = getattr(
-                        n.attributes, "reminderTime", None
-                    )
-                    reminder_info["reminder_order"] = getattr(
-                        n.attributes, "reminderOrder", None
-                    )
-                    reminder_info["reminder_done_time"] = getattr(
-                        n.attributes, "reminderDoneTime", None
-                    )
+                if n.attributes:
+                    reminder_info.update(_pick_reminder(n.attributes))
 
                 reminders_data.append(reminder_info)
 
             response = {
                 "success": True,
-                "total": result.totalNotes
-                if hasattr(result, "totalNotes")
-                else len(notes_list),
+                "total": result.totalNotes,
                 "count": len(reminders_data),
                 "include_completed": include_completed,
                 "reminders": reminders_data,
             }
             logger.info(f"Listed {len(reminders_data)} reminder(s)")
-            return json.dumps(response, indent=2, ensure_ascii=False)
+            return dumps(response)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
-    def get_reminder(note_guid: str) -> str:
+    @mcp.tool(structured_output=False)
+    async def get_reminder(note_guid: str) -> str:
         """
         Get reminder information for a specific note.
 
@@ -177,7 +173,7 @@ def register_reminder_tools(mcp: FastMCP, client):
             JSON string with reminder details
         """
         try:
-            note = client.get_note(note_guid, with_content=False)
+            note = await aclient.get_note(note_guid, with_content=False)
 
             result = {
                 "success": True,
@@ -203,6 +199,6 @@ def register_reminder_tools(mcp: FastMCP, client):
                 )
                 result["is_completed"] = reminder_done_time is not None
 
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
@@ -1,7 +1,6 @@
 """MCP tools for resource/attachment operations."""
-import base64
 import binascii
-import json
+import hashlib
 import logging
 from typing import Optional, Any
 
@@ -9,21 +8,79 @@ from mcp.server.fastmcp import FastMCP
 from evernote.edam.type.ttypes import ResourceAttributes
 from evernote_mcp.client import EvernoteMCPClient
 
-from evernote_mcp.util.error_handler import handle_evernote_error
+from evernote_mcp.util.error_handler import error_json, error_response
+from evernote_mcp.util.serialization import b64_size, b64encode, dumps, loads
 
 logger = logging.getLogger(__name__)
 
 
+# (response key, ResourceAttributes field) pairs reported by the resource tools
+_RESOURCE_ATTR_FIELDS = (
+    ("source_url", "sourceURL"),
+    ("timestamp", "timestamp"),
+    ("latitude", "latitude"),
+    ("longitude", "longitude"),
+    ("altitude", "altitude"),
+    ("camera_make", "cameraMake"),
+    ("camera_model", "cameraModel"),
+    ("file_name", "fileName"),
+    ("attachment", "attachment"),
+)
+_RESOURCE_ATTR_DETAIL_FIELDS = (
+    ("source_url", "sourceURL"),
+    ("timestamp", "timestamp"),
+    ("latitude", "latitude"),
+    ("longitude", "longitude"),
+    ("altitude", "altitude"),
+    ("camera_make", "cameraMake"),
+    ("camera_model", "cameraModel"),
+    ("client_will_index", "clientWillIndex"),
+    ("reco_type", "recoType"),
+    ("file_name", "fileName"),
+    ("attachment", "attachment"),
+    ("application_data", "applicationData"),
+)
+_RESOURCE_ATTR_SUMMARY_FIELDS = (("file_name", "fileName"), ("source_url", "sourceURL"))
+
+# ResourceAttributes field names that update_resource may set
+_RESOURCE_ATTR_NAMES = frozenset(
+    spec[2] for spec in ResourceAttributes.thrift_spec if spec is not None
+)
+
+
+def _project(struct: Any, fields: tuple[tuple[str, str], ...]) -> dict[str, Any]:
+    """Copy ``fields`` of a Thrift struct into a dict, with None for unset ones.
+
+    Thrift structs keep their fields in the instance ``__dict__``, so each
+    field is a plain dict lookup rather than a ``getattr`` with a default.
+    """
+    values = vars(struct)
+    return {key: values.get(field) for key, field in fields}
+
+
+def _body_size(data: Any) -> int:
+    """Return the body size of a Thrift Data struct.
+
+    Evernote fills in ``size`` (and ``bodyHash``) even when the body itself
+    was not requested, so the length is only computed as a fallback.
+    """
+    size = vars(data).get('size')
+    if size is not None:
+        return size
+    return len(data.body) if data.body else 0
+
+
 def register_resource_tools(mcp: FastMCP, client: EvernoteMCPClient):
     """Register resource-related MCP tools."""
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def get_resource(
         guid: str,
         with_data: bool = False,
         with_recognition: bool = False,
         with_attributes: bool = True,
-        with_alternate_data: bool = False
+        with_alternate_data: bool = False,
+        sizes_only: bool = False
     ) -> str:
         """
         Get a resource by GUID.
@@ -34,11 +91,17 @@ def register_resource_tools(mcp: FastMCP, client: EvernoteMCPClient):
             with_recognition: Include recognition data (OCR)
             with_attributes: Include resource attributes
             with_alternate_data: Include alternate data
+            sizes_only: Report data, recognition and alternate data sizes
+                        without downloading any of the bodies. Overrides the
+                        with_data/with_recognition/with_alternate_data flags.
+                        Use get_resource_data to fetch the bytes.
 
         Returns:
             JSON string with resource info
         """
         try:
+            if sizes_only:
+                with_data = with_recognition = with_alternate_data = False
             resource = client.get_resource(
                 guid,
                 with_data=with_data,
@@ -46,51 +109,98 @@ def register_resource_tools(mcp: FastMCP, client: EvernoteMCPClient):
                 with_attributes=with_attributes,
                 with_alternate_data=with_alternate_data,
             )
+            # Thrift structs hold every field in __dict__, so plain dict
+            # lookups replace the hasattr/getattr chains
+            fields = vars(resource)
             result = {
                 "success": True,
                 "guid": resource.guid,
                 "note_guid": resource.noteGuid,
                 "mime": resource.mime,
-                "width": getattr(resource, 'width', None),
-                "height": getattr(resource, 'height', None),
-                "duration": getattr(resource, 'duration', None),
-                "active": getattr(resource, 'active', True),
+                "width": fields.get('width'),
+                "height": fields.get('height'),
+                "duration": fields.get('duration'),
+                "active": fields.get('active', True),
                 "attributes": None,
                 "data_size": None,
                 "recognition_size": None,
                 "alternate_data_size": None,
             }
 
-            if with_attributes and hasattr(resource, 'attributes') and resource.attributes:
-                attr = resource.attributes
-                result["attributes"] = {
-                    "source_url": getattr(attr, 'sourceURL', None),
-                    "timestamp": getattr(attr, 'timestamp', None),
-                    "latitude": getattr(attr, 'latitude', None),
-                    "longitude": getattr(attr, 'longitude', None),
-                    "altitude": getattr(attr, 'altitude', None),
-                    "camera_make": getattr(attr, 'cameraMake', None),
-                    "camera_model": getattr(attr, 'cameraModel', None),
-                    "file_name": getattr(attr, 'fileName', None),
-                    "attachment": getattr(attr, 'attachment', None),
-                }
+            if with_attributes and (attrs := fields.get('attributes')):
+                result["attributes"] = _project(attrs, _RESOURCE_ATTR_FIELDS)
+
+            if (with_data or sizes_only) and (data := fields.get('data')):
+                body_hash = vars(data).get('bodyHash')
+                result["data_size"] = _body_size(data)
+                result["data_hash"] = body_hash.hex() if body_hash else None
+
+            if (with_recognition or sizes_only) and (recognition := fields.get('recognition')):
+                result["recognition_size"] = _body_size(recognition)
+
+            if (with_alternate_data or sizes_only) and (alternate := fields.get('alternateData')):
+                result["alternate_data_size"] = _body_size(alternate)
+
+            logger.info("Retrieved resource: %s", guid)
+            return dumps(result)
+        except Exception as e:
+            return error_json(e)
 
-            if with_data and hasattr(resource, 'data') and resource.data:
-                result["data_size"] = len(resource.data.body) if resource.data.body else 0
-                result["data_hash"] = resource.data.bodyHash.hex() if (hasattr(resource.data, 'bodyHash') and resource.data.bodyHash) else None
+    @mcp.tool(structured_output=False)
+    def get_resources_batch(guids: list[str], with_attributes: bool = True) -> str:
+        """
+        Get metadata for several resources in one call.
 
-            if with_recognition and hasattr(resource, 'recognition') and resource.recognition:
-                result["recognition_size"] = len(resource.recognition.body) if resource.recognition.body else 0
+        The lookups run concurrently on the client's worker pool, so N
+        resources cost roughly one round trip instead of N. Binary data is
+        never downloaded; data_size comes from the size Evernote reports.
 
-            if with_alternate_data and hasattr(resource, 'alternateData') and resource.alternateData:
-                result["alternate_data_size"] = len(resource.alternateData.body) if resource.alternateData.body else 0
+        Args:
+            guids: Resource GUIDs (required)
+            with_attributes: Include resource attributes
 
-            logger.info(f"Retrieved resource: {guid}")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+        Returns:
+            JSON string with one entry per GUID, in input order. Failed
+            lookups have success=false and the error details.
+        """
+        try:
+            resources = []
+            failed = 0
+            for item in client.get_resources(guids, with_attributes=with_attributes):
+                if item["error"] is not None:
+                    failed += 1
+                    resources.append({"guid": item["guid"], **error_response(item["error"])})
+                    continue
+                fields = vars(item["resource"])
+                entry = {
+                    "success": True,
+                    "guid": fields.get('guid'),
+                    "note_guid": fields.get('noteGuid'),
+                    "mime": fields.get('mime'),
+                    "width": fields.get('width'),
+                    "height": fields.get('height'),
+                    "duration": fields.get('duration'),
+                    "active": fields.get('active', True),
+                    "attributes": None,
+                    "data_size": _body_size(data) if (data := fields.get('data')) else None,
+                }
+                if with_attributes and (attrs := fields.get('attributes')):
+                    entry["attributes"] = _project(attrs, _RESOURCE_ATTR_FIELDS)
+                resources.append(entry)
+
+            # Failed items are reported in the response and logged once here
+            logger.log(logging.WARNING if failed else logging.INFO,
+                       "Retrieved %d resource(s), %d failed", len(guids) - failed, failed)
+            return dumps({
+                "success": True,
+                "count": len(resources),
+                "failed": failed,
+                "resources": resources,
+            })
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def get_resource_data(guid: str, encode: bool = True) -> str:
         """
         Get resource binary data.
@@ -108,18 +218,20 @@ def register_resource_tools(mcp: FastMCP, client: EvernoteMCPClient):
                 "success": True,
                 "guid": guid,
                 "size": len(data),
-                "data": base64.b64encode(data).decode('utf-8') if encode else None,
-                "hash_hex": binascii.hexlify(data).decode('utf-8') if data else None,
+                "b64_size": b64_size(len(data)),
+                "data": b64encode(data) if encode else None,
+                # MD5 of the body, the content hash get_resource_by_hash expects
+                "hash_hex": hashlib.md5(data, usedforsecurity=False).hexdigest() if data else None,
             }
             if not encode:
                 result["data_raw_preview"] = data[:100].hex() if len(data) > 0 else ""
                 result["note"] = "Raw binary data not included in JSON (use encode=true for base64)"
-            logger.info(f"Retrieved resource data: {guid}, size: {len(data)}")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            logger.info("Retrieved resource data: %s, size: %s", guid, len(data))
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def get_resource_alternate_data(guid: str, encode: bool = True) -> str:
         """
         Get resource alternate data (e.g., PDF preview of an image).
@@ -137,14 +249,15 @@ def register_resource_tools(mcp: FastMCP, client: EvernoteMCPClient):
                 "success": True,
                 "guid": guid,
                 "size": len(data),
-                "data": base64.b64encode(data).decode('utf-8') if encode else None,
+                "b64_size": b64_size(len(data)),
+                "data": b64encode(data) if encode else None,
             }
-            logger.info(f"Retrieved resource alternate data: {guid}, size: {len(data)}")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            logger.info("Retrieved resource alternate data: %s, size: %s", guid, len(data))
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def get_resource_attributes(guid: str) -> str:
         """
         Get resource attributes (metadata about the resource).
@@ -160,25 +273,14 @@ def register_resource_tools(mcp: FastMCP, client: EvernoteMCPClient):
             result = {
                 "success": True,
                 "guid": guid,
-                "source_url": getattr(attributes, 'sourceURL', None),
-                "timestamp": getattr(attributes, 'timestamp', None),
-                "latitude": getattr(attributes, 'latitude', None),
-                "longitude": getattr(attributes, 'longitude', None),
-                "altitude": getattr(attributes, 'altitude', None),
-                "camera_make": getattr(attributes, 'cameraMake', None),
-                "camera_model": getattr(attributes, 'cameraModel', None),
-                "client_will_index": getattr(attributes, 'clientWillIndex', None),
-                "reco_type": getattr(attributes, 'recoType', None),
-                "file_name": getattr(attributes, 'fileName', None),
-                "attachment": getattr(attributes, 'attachment', None),
-                "application_data": getattr(attributes, 'applicationData', None),
+                **_project(attributes, _RESOURCE_ATTR_DETAIL_FIELDS),
             }
-            logger.info(f"Retrieved resource attributes: {guid}")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            logger.info("Retrieved resource attributes: %s", guid)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def get_resource_by_hash(
         note_guid: str,
         content_hash: str,
@@ -219,21 +321,18 @@ def register_resource_tools(mcp: FastMCP, client: EvernoteMCPClient):
                 "mime": resource.mime,
             }
             if with_attributes and hasattr(resource, 'attributes') and resource.attributes:
-                result["attributes"] = {
-                    "file_name": getattr(resource.attributes, 'fileName', None),
-                    "source_url": getattr(resource.attributes, 'sourceURL', None),
-                }
-            logger.info(f"Retrieved resource by hash: {content_hash[:8] if len(content_hash) >= 8 else content_hash}...")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+                result["attributes"] = _project(resource.attributes, _RESOURCE_ATTR_SUMMARY_FIELDS)
+            logger.info("Retrieved resource by hash: %s...", content_hash[:8])
+            return dumps(result)
         except binascii.Error:
-            return json.dumps({
+            return dumps({
                 "success": False,
                 "error": "Invalid content_hash format. Must be a hex string (e.g., '1a2b3c4d...')"
-            }, indent=2)
+            })
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def get_resource_recognition(guid: str, encode: bool = True) -> str:
         """
         Get resource recognition data (OCR/text recognition for images/PDFs).
@@ -251,14 +350,15 @@ def register_resource_tools(mcp: FastMCP, client: EvernoteMCPClient):
                 "success": True,
                 "guid": guid,
                 "size": len(data),
-                "data": base64.b64encode(data).decode('utf-8') if encode else None,
+                "b64_size": b64_size(len(data)),
+                "data": b64encode(data) if encode else None,
             }
-            logger.info(f"Retrieved resource recognition: {guid}, size: {len(data)}")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            logger.info("Retrieved resource recognition: %s, size: %s", guid, len(data))
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def get_resource_search_text(guid: str) -> str:
         """
         Get extracted search text from a resource.
@@ -277,12 +377,12 @@ def register_resource_tools(mcp: FastMCP, client: EvernoteMCPClient):
                 "text": text,
                 "length": len(text) if text else 0,
             }
-            logger.info(f"Retrieved resource search text: {guid}")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            logger.info("Retrieved resource search text: %s", guid)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def update_resource(
         guid: str,
         mime: Optional[str] = None,
@@ -300,16 +400,23 @@ def register_resource_tools(mcp: FastMCP, client: EvernoteMCPClient):
         Returns:
             JSON string with update result
         """
+        if not mime and not attributes:
+            return dumps({
+                "success": False,
+                "error": "Either mime or attributes must be provided"
+            })
         try:
+            # updateResource sends mime, width, height, duration, active and
+            # the whole attributes struct, so start from the current resource
             resource = client.get_resource(guid, with_data=False, with_attributes=True)
             if mime:
                 resource.mime = mime
             if attributes:
-                attr_dict = json.loads(attributes)
+                attr_dict = loads(attributes)
                 if not resource.attributes:
                     resource.attributes = ResourceAttributes()
                 for key, value in attr_dict.items():
-                    if hasattr(resource.attributes, key):
+                    if key in _RESOURCE_ATTR_NAMES:
                         setattr(resource.attributes, key, value)
             update_sequence_num = client.update_resource(resource)
             result = {
@@ -317,12 +424,12 @@ def register_resource_tools(mcp: FastMCP, client: EvernoteMCPClient):
                 "guid": guid,
                 "update_sequence_num": update_sequence_num,
             }
-            logger.info(f"Updated resource: {guid}")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            logger.info("Updated resource: %s", guid)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def set_resource_application_data_entry(guid: str, key: str, value: str) -> str:
         """
         Set application data entry for a resource.
@@ -343,12 +450,12 @@ def register_resource_tools(mcp: FastMCP, client: EvernoteMCPClient):
                 "key": key,
                 "update_sequence_num": update_sequence_num,
             }
-            logger.info(f"Set resource application data: {guid}, key: {key}")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            logger.info("Set resource application data: %s, key: %s", guid, key)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def unset_resource_application_data_entry(guid: str, key: str) -> str:
         """
         Remove application data entry from a resource.
@@ -368,12 +475,12 @@ def register_resource_tools(mcp: FastMCP, client: EvernoteMCPClient):
                 "key": key,
                 "update_sequence_num": update_sequence_num,
             }
-            logger.info(f"Unset resource application data: {guid}, key: {key}")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            logger.info("Unset resource application data: %s, key: %s", guid, key)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def get_resource_application_data(guid: str) -> str:
         """
         Get all application data for a resource.
@@ -391,12 +498,12 @@ def register_resource_tools(mcp: FastMCP, client: EvernoteMCPClient):
                 "guid": guid,
                 "application_data": app_data if app_data else {},
             }
-            logger.info(f"Retrieved resource application data: {guid}")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            logger.info("Retrieved resource application data: %s", guid)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def get_resource_application_data_entry(guid: str, key: str) -> str:
         """
         Get a specific application data entry from a resource.
@@ -416,7 +523,7 @@ def register_resource_tools(mcp: FastMCP, client: EvernoteMCPClient):
                 "key": key,
                 "value": value,
             }
-            logger.info(f"Retrieved resource application data entry: {guid}, key: {key}")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            logger.info("Retrieved resource application data entry: %s, key: %s", guid, key)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
@@ -1,10 +1,10 @@
 """MCP tools for search operations."""
 import logging
 from typing import Optional
-import json
 from mcp.server.fastmcp import FastMCP
 
-from evernote_mcp.util.error_handler import handle_evernote_error
+from evernote_mcp.util.error_handler import error_json
+from evernote_mcp.util.serialization import dumps
 from evernote_mcp.util.validators import (
     ValidationError,
     validate_search_query,
@@ -17,7 +17,7 @@ logger = logging.getLogger(__name__)
 def register_search_tools(mcp: FastMCP, client):
     """Register search-related MCP tools."""
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def search_notes(
         query: str,
         notebook_guid: Optional[str] = None,
@@ -73,13 +73,13 @@ def register_search_tools(mcp: FastMCP, client):
                 "notes": notes_data,
             }
             logger.info(f"Search found {total} note(s)")
-            return json.dumps(response, indent=2, ensure_ascii=False)
+            return dumps(response)
         except ValidationError:
             raise
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def list_tags() -> str:
         """
         List all tags in the Evernote account.
@@ -101,6 +101,6 @@ def register_search_tools(mcp: FastMCP, client):
                 ]
             }
             logger.info(f"Listed {len(tags)} tag(s)")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
@@ -1,29 +1,42 @@
 """MCP tools for saved search operations."""
+import copy
 import logging
+from operator import attrgetter
 from typing import Optional
-import json
 from mcp.server.fastmcp import FastMCP
 
-from evernote_mcp.util.error_handler import handle_evernote_error
+from evernote_mcp.util.error_handler import error_json
+from evernote_mcp.util.serialization import FieldPicker, dumps
 
 logger = logging.getLogger(__name__)
 
+_pick_search = FieldPicker(guid="guid", name="name", query="query", format="format")
+
+# (response key, SavedSearchScope field) pairs
+_SCOPE_FIELDS = (
+    ("include_account", "includeAccount"),
+    ("include_personal_linked_notebooks", "includePersonalLinkedNotebooks"),
+    ("include_business_linked_notebooks", "includeBusinessLinkedNotebooks"),
+)
+_scope_values = attrgetter(*(field for _, field in _SCOPE_FIELDS))
+
 
 def serialize_scope(scope) -> Optional[dict]:
     """Convert SavedSearchScope to a serializable dict."""
     if scope is None:
         return None
-    return {
-        "include_account": getattr(scope, 'includeAccount', None),
-        "include_personal_linked_notebooks": getattr(scope, 'includePersonalLinkedNotebooks', None),
-        "include_business_linked_notebooks": getattr(scope, 'includeBusinessLinkedNotebooks', None),
-    }
+    try:
+        values = _scope_values(scope)
+    except AttributeError:
+        # Not a SavedSearchScope struct; fall back to per-field lookups
+        values = [getattr(scope, field, None) for _, field in _SCOPE_FIELDS]
+    return {key: value for (key, _), value in zip(_SCOPE_FIELDS, values)}
 
 
 def register_search_tools_extended(mcp: FastMCP, client):
     """Register saved search-related MCP tools."""
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def list_searches() -> str:
         """
         List all saved searches in the Evernote account.
@@ -37,22 +50,16 @@ def register_search_tools_extended(mcp: FastMCP, client):
             result = {
                 "success": True,
                 "searches": [
-                    {
-                        "guid": s.guid,
-                        "name": s.name,
-                        "query": s.query,
-                        "format": getattr(s, 'format', None),
-                        "scope": serialize_scope(getattr(s, 'scope', None)),
-                    }
+                    {**_pick_search(s), "scope": serialize_scope(s.scope)}
                     for s in searches
                 ]
             }
-            logger.info(f"Listed {len(searches)} saved search(es)")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            logger.info("Listed %s saved search(es)", len(searches))
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def get_search(guid: str) -> str:
         """
         Get saved search details by GUID.
@@ -75,11 +82,11 @@ def register_search_tools_extended(mcp: FastMCP, client):
                 "scope": serialize_scope(getattr(search, 'scope', None)),
                 "update_sequence_num": getattr(search, 'updateSequenceNum', None),
             }
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def create_search(name: str, query: str) -> str:
         """
         Create a new saved search.
@@ -99,12 +106,12 @@ def register_search_tools_extended(mcp: FastMCP, client):
                 "name": search.name,
                 "query": search.query,
             }
-            logger.info(f"Created saved search: {search.name} ({search.guid})")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            logger.info("Created saved search: %s (%s)", search.name, search.guid)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def update_search(guid: str, name: Optional[str] = None,
                       query: Optional[str] = None) -> str:
         """
@@ -119,7 +126,9 @@ def register_search_tools_extended(mcp: FastMCP, client):
             JSON string with updated search info
         """
         try:
-            search = client.get_search(guid)
+            # Edit a copy, as for notebooks and tags, so the fetched struct
+            # is never changed by an update the server rejects
+            search = copy.copy(client.get_search(guid))
             if name:
                 search.name = name
             if query:
@@ -133,12 +142,12 @@ def register_search_tools_extended(mcp: FastMCP, client):
                 "query": search.query,
                 "update_sequence_num": usn,
             }
-            logger.info(f"Updated saved search: {search.name} ({search.guid})")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            logger.info("Updated saved search: %s (%s)", search.name, search.guid)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def expunge_search(guid: str) -> str:
         """
         Permanently delete a saved search.
@@ -156,7 +165,7 @@ def register_search_tools_extended(mcp: FastMCP, client):
                 "message": f"Saved search {guid} deleted",
                 "update_sequence_num": usn,
             }
-            logger.info(f"Deleted saved search: {guid}")
-            return json.dumps(result, indent=2)
+            logger.info("Deleted saved search: %s", guid)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
@@ -1,18 +1,21 @@
 """MCP tools for sync and utility operations."""
 import logging
-import json
 from mcp.server.fastmcp import FastMCP
 from evernote.edam.notestore.ttypes import RelatedQuery, RelatedResultSpec
 
-from evernote_mcp.util.error_handler import handle_evernote_error
+from evernote_mcp.util.error_handler import error_json
+from evernote_mcp.util.serialization import FieldPicker, dumps
 
 logger = logging.getLogger(__name__)
 
+_pick_note = FieldPicker(guid="guid", title="title")
+_pick_named = FieldPicker(guid="guid", name="name")
+
 
 def register_sync_tools(mcp: FastMCP, client):
     """Register sync and utility-related MCP tools."""
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def get_sync_state() -> str:
         """
         Get sync state information.
@@ -31,11 +34,11 @@ def register_sync_tools(mcp: FastMCP, client):
                 "uploaded": state.uploaded,
                 "user_last_updated": state.userLastUpdated,
             }
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def get_default_notebook() -> str:
         """
         Get the default notebook for new notes.
@@ -52,11 +55,11 @@ def register_sync_tools(mcp: FastMCP, client):
                 "stack": notebook.stack,
                 "default_notebook": getattr(notebook, 'defaultNotebook', False),
             }
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def find_note_counts(query: str = "", with_trash: bool = False) -> str:
         """
         Get note counts for each notebook and tag.
@@ -71,17 +74,10 @@ def register_sync_tools(mcp: FastMCP, client):
         try:
             counts = client.find_note_counts(query, with_trash)
 
-            # Convert notebook counts to dict for JSON serialization
-            notebook_counts = {}
-            if hasattr(counts, 'notebookCounts'):
-                for guid, count in counts.notebookCounts.items():
-                    notebook_counts[guid] = count
-
-            # Convert tag counts to dict
-            tag_counts = {}
-            if hasattr(counts, 'tagCounts'):
-                for guid, count in counts.tagCounts.items():
-                    tag_counts[guid] = count
+            # Copy the count maps into plain dicts for JSON serialization;
+            # either map is None when nothing matched
+            notebook_counts = dict(getattr(counts, 'notebookCounts', None) or {})
+            tag_counts = dict(getattr(counts, 'tagCounts', None) or {})
 
             result = {
                 "success": True,
@@ -90,11 +86,11 @@ def register_sync_tools(mcp: FastMCP, client):
                 "tag_counts": tag_counts,
                 "trash_count": getattr(counts, 'trashCount', None),
             }
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def find_related(note_guid: str = "", plain_text: str = "",
                      max_notes: int = 10, max_notebooks: int = 5,
                      max_tags: int = 10) -> str:
@@ -119,10 +115,10 @@ def register_sync_tools(mcp: FastMCP, client):
             elif plain_text:
                 query.plainText = plain_text
             else:
-                return json.dumps({
+                return dumps({
                     "success": False,
                     "error": "Either note_guid or plain_text must be provided"
-                }, indent=2)
+                })
 
             # Build the result spec
             result_spec = RelatedResultSpec()
@@ -137,29 +133,9 @@ def register_sync_tools(mcp: FastMCP, client):
             related = client.find_related(query, result_spec)
 
             # Extract results
-            notes_data = []
-            if hasattr(related, 'notes') and related.notes is not None:
-                for note in related.notes:
-                    notes_data.append({
-                        "guid": note.guid,
-                        "title": note.title,
-                    })
-
-            notebooks_data = []
-            if hasattr(related, 'notebooks') and related.notebooks is not None:
-                for nb in related.notebooks:
-                    notebooks_data.append({
-                        "guid": nb.guid,
-                        "name": nb.name,
-                    })
-
-            tags_data = []
-            if hasattr(related, 'tags') and related.tags is not None:
-                for tag in related.tags:
-                    tags_data.append({
-                        "guid": tag.guid,
-                        "name": tag.name,
-                    })
+            notes_data = list(map(_pick_note, related.notes or ()))
+            notebooks_data = list(map(_pick_named, related.notebooks or ()))
+            tags_data = list(map(_pick_named, related.tags or ()))
 
             result = {
                 "success": True,
@@ -168,7 +144,7 @@ def register_sync_tools(mcp: FastMCP, client):
                 "tags": tags_data,
                 "cache_key": getattr(related, 'cacheKey', None),
             }
-            logger.info(f"Found related: {len(notes_data)} notes, {len(notebooks_data)} notebooks, {len(tags_data)} tags")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            logger.info("Found related: %s notes, %s notebooks, %s tags", len(notes_data), len(notebooks_data), len(tags_data))
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
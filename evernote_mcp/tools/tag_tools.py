@@ -1,18 +1,22 @@
 """MCP tools for tag operations."""
+import copy
 import logging
 from typing import Optional
-import json
 from mcp.server.fastmcp import FastMCP
+from evernote.edam.type.ttypes import Tag
 
-from evernote_mcp.util.error_handler import handle_evernote_error
+from evernote_mcp.util.error_handler import error_json
+from evernote_mcp.util.serialization import FieldPicker, dumps
 
 logger = logging.getLogger(__name__)
 
+_pick_tag = FieldPicker(guid="guid", name="name", parent_guid="parentGuid")
+
 
 def register_tag_tools(mcp: FastMCP, client):
     """Register tag-related MCP tools."""
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def get_tag(guid: str) -> str:
         """
         Get tag details by GUID.
@@ -29,14 +33,14 @@ def register_tag_tools(mcp: FastMCP, client):
                 "success": True,
                 "guid": tag.guid,
                 "name": tag.name,
-                "parent_guid": getattr(tag, 'parentGuid', None),
-                "update_sequence_num": getattr(tag, 'updateSequenceNum', None),
+                "parent_guid": tag.parentGuid,
+                "update_sequence_num": tag.updateSequenceNum,
             }
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def create_tag(name: str, parent_guid: Optional[str] = None) -> str:
         """
         Create a new tag.
@@ -54,14 +58,14 @@ def register_tag_tools(mcp: FastMCP, client):
                 "success": True,
                 "guid": tag.guid,
                 "name": tag.name,
-                "parent_guid": getattr(tag, 'parentGuid', None),
+                "parent_guid": tag.parentGuid,
             }
-            logger.info(f"Created tag: {tag.name} ({tag.guid})")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            logger.info("Created tag: %s (%s)", tag.name, tag.guid)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def update_tag(guid: str, name: Optional[str] = None,
                    parent_guid: Optional[str] = None) -> str:
         """
@@ -76,11 +80,18 @@ def register_tag_tools(mcp: FastMCP, client):
             JSON string with updated tag info
         """
         try:
-            tag = client.get_tag(guid)
-            if name:
-                tag.name = name
-            if parent_guid is not None:
-                tag.parentGuid = parent_guid if parent_guid else None
+            if name and parent_guid is not None:
+                # updateTag replaces name and parent, so when both are given
+                # the current tag has nothing left to contribute
+                tag = Tag(guid=guid, name=name, parentGuid=parent_guid or None)
+            else:
+                # get_tag may hand out the client's cached struct; edit a
+                # copy so a rejected update leaves the cache untouched
+                tag = copy.copy(client.get_tag(guid))
+                if name:
+                    tag.name = name
+                if parent_guid is not None:
+                    tag.parentGuid = parent_guid if parent_guid else None
 
             usn = client.update_tag(tag)
             result = {
@@ -89,12 +100,12 @@ def register_tag_tools(mcp: FastMCP, client):
                 "name": tag.name,
                 "update_sequence_num": usn,
             }
-            logger.info(f"Updated tag: {tag.name} ({tag.guid})")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            logger.info("Updated tag: %s (%s)", tag.name, tag.guid)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def expunge_tag(guid: str) -> str:
         """
         Permanently delete a tag.
@@ -112,12 +123,12 @@ def register_tag_tools(mcp: FastMCP, client):
                 "message": f"Tag {guid} deleted",
                 "update_sequence_num": usn,
             }
-            logger.info(f"Deleted tag: {guid}")
-            return json.dumps(result, indent=2)
+            logger.info("Deleted tag: %s", guid)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def list_tags_by_notebook(notebook_guid: str) -> str:
         """
         List all tags used in a specific notebook.
@@ -132,21 +143,14 @@ def register_tag_tools(mcp: FastMCP, client):
             tags = client.list_tags_by_notebook(notebook_guid)
             result = {
                 "success": True,
-                "tags": [
-                    {
-                        "guid": t.guid,
-                        "name": t.name,
-                        "parent_guid": getattr(t, 'parentGuid', None),
-                    }
-                    for t in tags
-                ]
+                "tags": list(map(_pick_tag, tags)),
             }
-            logger.info(f"Listed {len(tags)} tag(s) for notebook")
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            logger.info("Listed %s tag(s) for notebook", len(tags))
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
 
-    @mcp.tool()
+    @mcp.tool(structured_output=False)
     def untag_all(guid: str) -> str:
         """
         Remove a tag from all notes.
@@ -158,13 +162,12 @@ def register_tag_tools(mcp: FastMCP, client):
             JSON string with operation result
         """
         try:
-            tag = client.get_tag(guid)
             client.untag_all(guid)
             result = {
                 "success": True,
-                "message": f"Tag '{tag.name}' removed from all notes",
+                "message": f"Tag {guid} removed from all notes",
             }
-            logger.info(f"Removed tag {guid} from all notes")
-            return json.dumps(result, indent=2)
+            logger.info("Removed tag %s from all notes", guid)
+            return dumps(result)
         except Exception as e:
-            return json.dumps(handle_evernote_error(e), indent=2)
+            return error_json(e)
@@ -0,0 +1,324 @@
+"""Thrift transport helpers for the Evernote NoteStore."""
+import asyncio
+import functools
+import http.client
+import logging
+import selectors
+import ssl
+import threading
+import time
+from collections.abc import Callable
+from io import BytesIO
+from typing import Any
+
+from evernote.edam.error.ttypes import EDAMErrorCode, EDAMSystemException
+from evernote_backup.evernote_client_api_http import (
+    RetryableMixin,
+    TBinaryProtocolHotfix,
+    THttpClientHotfix,
+)
+from evernote_backup.evernote_client_api_tokenized import TokenizedNoteStoreClient
+from thrift.transport.TTransport import CReadableTransport
+
+try:
+    from thrift.protocol import fastbinary
+except ImportError:  # pragma: no cover - thrift built without its C extension
+    fastbinary = None
+
+logger = logging.getLogger(__name__)
+
+# Seconds a pooled NoteStore client is reused before it is rebuilt
+DEFAULT_MAX_AGE = 300.0
+
+# Idle keep-alive connections kept per endpoint
+MAX_IDLE_CONNECTIONS = 16
+
+# Longest server-requested rate limit wait (seconds) sat out before failing
+MAX_RATE_LIMIT_WAIT = 60
+
+# Same limit for calls made on an asyncio event loop thread (sync MCP tools),
+# where sleeping would stall every other request the server is handling
+MAX_RATE_LIMIT_WAIT_ON_EVENT_LOOP = 0
+
+# Same headers evernote-backup sends on its Thrift HTTP requests
+_THRIFT_HEADERS = {
+    "x-feature-version": "3",
+    "accept": "application/x-thrift",
+    "cache-control": "no-cache",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def get_ssl_context(cafile: str | None) -> ssl.SSLContext:
+    """Return the shared client SSL context for a CA bundle.
+
+    Building a context parses the whole CA bundle, so one context per
+    ``cafile`` is created and reused by every transport in the process.
+
+    Args:
+        cafile: CA bundle path, or None for the system store
+
+    Returns:
+        Cached SSL context
+    """
+    return ssl.create_default_context(cafile=cafile)
+
+
+class AcceleratedBinaryProtocol(TBinaryProtocolHotfix):
+    """Binary protocol that encodes and decodes structs with thrift's C extension.
+
+    Same wire format as ``TBinaryProtocolHotfix``. Generated ``write`` and
+    ``read`` methods hand the whole struct to ``fastbinary`` instead of
+    walking it field by field in Python; decoding only takes that path over
+    a ``CReadableTransport``. Like the hotfix, the C decoder replaces invalid
+    UTF-8 rather than failing. Without the extension this is exactly the
+    hotfix protocol.
+    """
+
+    def __init__(self, trans: Any):
+        super().__init__(trans)
+        if fastbinary is not None:
+            self._fast_encode = fastbinary.encode_binary
+            self._fast_decode = fastbinary.decode_binary
+
+
+def _is_dropped(conn: http.client.HTTPConnection) -> bool:
+    """Return True if the server has closed an idle connection.
+
+    An idle HTTP/1.1 connection has nothing to read, so a readable socket
+    means the server sent EOF (or stray data) and the connection is unusable.
+    """
+    sock = conn.sock
+    if sock is None:
+        return True
+    with selectors.DefaultSelector() as selector:
+        selector.register(sock, selectors.EVENT_READ)
+        return bool(selector.select(timeout=0))
+
+
+class ConnectionPool:
+    """Idle keep-alive HTTP connections shared between transports.
+
+    Connections are keyed by endpoint, so every NoteStore client talking to
+    the same host, including clients rebuilt by ``NoteStorePool`` and those
+    of other threads, picks up an already-established TLS session.
+    """
+
+    def __init__(self, maxsize: int = MAX_IDLE_CONNECTIONS):
+        """Initialize the pool.
+
+        Args:
+            maxsize: Idle connections kept per endpoint; extras are closed
+        """
+        self._maxsize = maxsize
+        self._idle: dict[tuple, list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: tuple) -> http.client.HTTPConnection | None:
+        """Take a live idle connection for ``key``, or None if there is none.
+
+        Connections the server has dropped while parked are closed and skipped.
+        """
+        while True:
+            with self._lock:
+                conns = self._idle.get(key)
+                conn = conns.pop() if conns else None
+            if conn is None or not _is_dropped(conn):
+                return conn
+            conn.close()
+
+    def release(self, key: tuple, conn: http.client.HTTPConnection) -> None:
+        """Park ``conn`` for reuse, closing it if the pool is full."""
+        with self._lock:
+            conns = self._idle.setdefault(key, [])
+            if len(conns) < self._maxsize:
+                conns.append(conn)
+                return
+        conn.close()
+
+    def clear(self) -> None:
+        """Close and drop every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
+_connection_pool = ConnectionPool()
+
+
+class KeepAliveHttpClient(THttpClientHotfix, CReadableTransport):
+    """Thrift HTTP transport that reuses pooled connections between RPCs.
+
+    THttpClient closes and reopens the connection on every flush, paying a
+    TCP and TLS handshake per call. Here each response body is read in one
+    call and served from memory, and the connection is handed back to a
+    ``ConnectionPool`` straight away if the server allows keep-alive; the
+    next request from any transport to the same endpoint reuses it.
+    Buffering the body also lets the C decoder read it as a
+    ``CReadableTransport``.
+    """
+
+    def __init__(self, *args: Any, pool: ConnectionPool | None = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._pool = pool or _connection_pool
+        self._pool_key = (
+            self.scheme, self.host, self.port, self.realhost, self.realport,
+            getattr(self, "context", None),
+        )
+        self._reused = False
+        self._bypass_pool = False
+        self._rbuf = BytesIO()
+
+    def open(self) -> None:
+        conn = None if self._bypass_pool else self._pool.acquire(self._pool_key)
+        self._reused = conn is not None
+        if self._reused:
+            self._THttpClient__http = conn
+        else:
+            super().open()
+
+    def close(self) -> None:
+        conn = self._THttpClient__http
+        response = self._THttpClient__http_response
+        self._THttpClient__http = None
+        self._THttpClient__http_response = None
+        if conn is None:
+            return
+        if response is not None and response.isclosed() and not response.will_close:
+            self._pool.release(self._pool_key, conn)
+        else:
+            conn.close()
+
+    def flush(self) -> None:
+        data = self._THttpClient__wbuf.getvalue()
+        try:
+            super().flush()
+        except BrokenPipeError:
+            if not self._reused:
+                raise
+            # The server closed the parked connection before the request was
+            # written, so it never saw it; resend once on a new connection.
+            # Failures while reading the response are not resent here, since
+            # the server may already have applied the call. Other parked
+            # connections may be just as stale, so skip the pool.
+            self._THttpClient__wbuf = BytesIO(data)
+            self._bypass_pool = True
+            try:
+                super().flush()
+            finally:
+                self._bypass_pool = False
+        self._rbuf = BytesIO(self._THttpClient__http_response.read())
+        self.close()
+
+    def read(self, sz: int) -> bytes:
+        return self._rbuf.read(sz)
+
+    @property
+    def cstringio_buf(self) -> BytesIO:
+        return self._rbuf
+
+    def cstringio_refill(self, partialread: bytes, reqlen: int) -> BytesIO:
+        # The whole response body is already buffered, so there is nothing
+        # left to refill from.
+        raise EOFError()
+
+
+def _rate_limit_wait_budget() -> float:
+    """Return the longest rate limit wait the calling thread may sit out."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return MAX_RATE_LIMIT_WAIT
+    return MAX_RATE_LIMIT_WAIT_ON_EVENT_LOOP
+
+
+class RateLimitRetryMixin:
+    """Retry public calls rejected with RATE_LIMIT_REACHED.
+
+    Each retry waits exactly the server's ``rateLimitDuration``, up to
+    ``_retry_max`` times. Waits longer than ``MAX_RATE_LIMIT_WAIT`` are not
+    sat out; the exception is raised so the caller can report it. On an
+    event loop thread the limit is ``MAX_RATE_LIMIT_WAIT_ON_EVENT_LOOP``,
+    since a blocking sleep there would freeze the whole server.
+    """
+
+    def __getattribute__(self, name: str) -> Any:
+        attr = super().__getattribute__(name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        retry_max = super().__getattribute__("_retry_max")
+
+        @functools.wraps(attr)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            for attempt in range(retry_max + 1):
+                try:
+                    return attr(*args, **kwargs)
+                except EDAMSystemException as e:
+                    duration = e.rateLimitDuration or 0
+                    if (e.errorCode != EDAMErrorCode.RATE_LIMIT_REACHED
+                            or attempt == retry_max
+                            or duration > _rate_limit_wait_budget()):
+                        raise
+                    logger.warning("Rate limit reached in %s, retrying in %ss", name, duration)
+                    time.sleep(duration)
+
+        return wrapper
+
+
+class NoteStoreClient(RateLimitRetryMixin, RetryableMixin, TokenizedNoteStoreClient):
+    """NoteStore client with network and rate limit retries over a caller-built protocol."""
+
+    def __init__(self, auth_token: str, protocol: Any, retry_max: int):
+        super().__init__(auth_token, protocol, retry_max=retry_max)
+
+
+def create_note_store(url: str, auth_token: str, user_agent: str,
+                      cafile: str | None, retry_max: int) -> NoteStoreClient:
+    """Build a keep-alive NoteStore client using the shared SSL context.
+
+    Args:
+        url: NoteStore endpoint URL
+        auth_token: Evernote auth token
+        user_agent: User-Agent header value
+        cafile: CA bundle path, or None for the system store
+        retry_max: Number of network retries per call
+
+    Returns:
+        Ready-to-use NoteStore client
+    """
+    transport = KeepAliveHttpClient(url, ssl_context=get_ssl_context(cafile))
+    transport.setCustomHeaders({**_THRIFT_HEADERS, "User-Agent": user_agent})
+    return NoteStoreClient(auth_token, AcceleratedBinaryProtocol(transport), retry_max)
+
+
+class NoteStorePool:
+    """Hand out one NoteStore client per thread, rebuilt after ``max_age`` seconds.
+
+    Thrift clients are not thread-safe, so every thread keeps its own client
+    instead of sharing one transport. Lookup is a thread-local read, so the
+    borrow path takes no lock.
+    """
+
+    def __init__(self, factory: Callable[[], Any], max_age: float = DEFAULT_MAX_AGE):
+        """Initialize the pool.
+
+        Args:
+            factory: Callable building a new NoteStore client
+            max_age: Seconds before a thread's client is recycled
+        """
+        self._factory = factory
+        self._max_age = max_age
+        self._local = threading.local()
+
+    def get(self) -> Any:
+        """Return the calling thread's NoteStore client, creating it if needed."""
+        local = self._local
+        store = getattr(local, "store", None)
+        now = time.monotonic()
+        if store is None or now - local.created > self._max_age:
+            store = local.store = self._factory()
+            local.created = now
+        return store
@@ -0,0 +1,70 @@
+"""In-process caching utilities for Evernote lookups."""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire ``ttl`` seconds after insertion.
+
+    Keys are tuples whose first element names a family (for example
+    ``("get_tag", guid)``), so related entries can be dropped together with
+    ``invalidate``.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Seconds an entry stays valid
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: OrderedDict[tuple, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple, default: Any = None) -> Any:
+        """Return the cached value for ``key``, or ``default`` if missing or expired.
+
+        Expired entries stay in the cache until evicted so that ``peek`` can
+        still offer them for revalidation.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def peek(self, key: tuple, default: Any = None) -> Any:
+        """Return the value stored under ``key`` even if it has expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            return default if entry is None else entry[0]
+
+    def set(self, key: tuple, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self._ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, *families: str) -> None:
+        """Drop every entry whose key belongs to one of ``families``."""
+        with self._lock:
+            for key in [k for k in self._data if k[0] in families]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
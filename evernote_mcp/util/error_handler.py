@@ -1,4 +1,5 @@
 """Error handling utilities for Evernote MCP server."""
+import json
 import logging
 import re
 from typing import Any, Dict
@@ -9,15 +10,48 @@ from evernote.edam.error.ttypes import (
     EDAMUserException,
 )
 
+from evernote_mcp.util import serialization
+
 logger = logging.getLogger(__name__)
 
-# Pattern to match Evernote auth tokens in error messages
-# Format: S=<signature>:<userid>:<timestamp> etc.
-_AUTH_TOKEN_PATTERN = re.compile(
-    r'(token[:\s]*)?S=[\w:/=+-]+',
+_encode = json.JSONEncoder(ensure_ascii=False).encode
+
+# Error code placeholder for exceptions that carry no EDAM error code
+_NO_CODE = object()
+
+# Human-readable messages for EDAMUserException error codes
+_EDAM_USER_ERROR_MESSAGES = {
+    EDAMErrorCode.BAD_DATA_FORMAT: "Invalid data format",
+    EDAMErrorCode.DATA_CONFLICT: "Data conflict - resource already exists",
+    EDAMErrorCode.DATA_REQUIRED: "Required data is missing",
+    EDAMErrorCode.ENML_VALIDATION: "Invalid note content format",
+    EDAMErrorCode.LIMIT_REACHED: "Account limit reached",
+    EDAMErrorCode.QUOTA_REACHED: "Upload quota reached",
+    EDAMErrorCode.PERMISSION_DENIED: "Permission denied",
+    EDAMErrorCode.AUTH_EXPIRED: "Authentication token expired",
+    EDAMErrorCode.INVALID_AUTH: "Invalid authentication token",
+}
+
+# Sensitive values in error messages, matched in a single pass. Each
+# branch consumes the key, its separator and its value:
+# - token: Evernote auth tokens, S=<signature>:<userid>:<timestamp> etc.
+# - secret: password/secret/api_key values
+# - token_key: "auth token"/"bearer token" values. Bare "token" is left
+#   alone so messages like "Invalid authentication token" survive intact.
+# A key followed by an S= token is left to the token branch, which redacts
+# the token (and a preceding "token:") as a whole.
+_REDACT_PATTERN = re.compile(
+    r'(?P<token>(?:\btoken[:\s]*)?\bS=[\w:/=+-]+)'
+    r'|\b(?P<secret>password|secret|api_key)\b'
+    r'(?![:\s=]*(?:token[:\s]*)?S=)(?:\s*[:=]\s*|\s+)[^\s\'"]+'
+    r'|\b(?P<token_key>auth\s*token|bearer\s*token)\b'
+    r'(?![:\s=]*(?:token[:\s]*)?S=)(?:\s*[:=]\s*|\s+)[^\s\'"]+',
     re.IGNORECASE
 )
 
+# Substrings one of the branches above needs in order to match (lowercased)
+_SENSITIVE_MARKERS = ('s=', 'password', 'secret', 'api_key', 'token')
+
 
 def _redact_sensitive_info(message: str) -> str:
     """Redact sensitive information (auth tokens, passwords) from error messages.
@@ -28,21 +62,57 @@ def _redact_sensitive_info(message: str) -> str:
     Returns:
         Error message with sensitive info redacted
     """
-    # First redact Evernote auth tokens (S=...)
-    message = _AUTH_TOKEN_PATTERN.sub('[REDACTED]', message)
+    lowered = message.lower()
+    if not any(marker in lowered for marker in _SENSITIVE_MARKERS):
+        # Most errors ("not found", quota, ...) carry nothing to redact
+        return message
+
+    return _REDACT_PATTERN.sub(_redaction, message)
+
+
+def _redaction(match: re.Match) -> str:
+    """Return the replacement for a ``_REDACT_PATTERN`` match, keeping the key name."""
+    if match.lastgroup == 'token':
+        return '[REDACTED]'
+    return f'{match.group(match.lastgroup)}: [REDACTED]'
+
+
+def _describe_error(e: Exception) -> tuple[str, Any]:
+    """Return an exception's redacted message and EDAM error code (or ``_NO_CODE``)."""
+    if isinstance(e, EDAMUserException):
+        return _redact_sensitive_info(_get_edam_user_error_message(e)), e.errorCode
+    elif isinstance(e, EDAMSystemException):
+        return _redact_sensitive_info(f"System error: {e.message}"), e.errorCode
+    elif isinstance(e, EDAMNotFoundException):
+        return f"Resource not found: {e.identifier}", _NO_CODE
+    else:
+        return _redact_sensitive_info(str(e)), _NO_CODE
 
-    # Then redact common password/secret patterns
-    # Use word boundaries to avoid matching "token" in "Authentication"
-    message = re.sub(r'(?i)(password|secret|api_key)([:\s][^\s\'"]+)?',
-                     r'\1: [REDACTED]', message)
 
-    # Avoid redacting "token" when it's part of a legitimate error message
-    # Only redact if it looks like a value assignment (token: value or token=value)
-    # This prevents redacting "Invalid authentication token"
-    message = re.sub(r'(?i)(auth\s*token|bearer\s*token)([:\s=][^\s\'"]+)?',
-                     r'\1: [REDACTED]', message)
+def _log_error(e: Exception, message: str) -> None:
+    """Log an exception handled by a tool, given its redacted message."""
+    if isinstance(e, (EDAMUserException, EDAMSystemException, EDAMNotFoundException)):
+        logger.error("%s: %s", type(e).__name__, message)
+    else:
+        logger.error("Unexpected error: %s: %s", type(e).__name__, message)
 
-    return message
+
+def error_response(e: Exception) -> Dict[str, Any]:
+    """Return the ``handle_evernote_error`` response for ``e`` without logging it.
+
+    For per-item errors in batch results, which are logged once per batch.
+
+    Args:
+        e: The exception to describe
+
+    Returns:
+        Dictionary with success=False and error details (with sensitive info redacted)
+    """
+    message, code = _describe_error(e)
+    result: Dict[str, Any] = {"success": False, "error": message}
+    if code is not _NO_CODE:
+        result["error_code"] = code
+    return result
 
 
 def handle_evernote_error(e: Exception) -> Dict[str, Any]:
@@ -54,34 +124,32 @@ def handle_evernote_error(e: Exception) -> Dict[str, Any]:
     Returns:
         Dictionary with success=False and error details (with sensitive info redacted)
     """
-    if isinstance(e, EDAMUserException):
-        error_message = _get_edam_user_error_message(e)
-        logger.error(f"EDAMUserException: {error_message}")
-        return {
-            "success": False,
-            "error": _redact_sensitive_info(error_message),
-            "error_code": e.errorCode,
-        }
-    elif isinstance(e, EDAMSystemException):
-        logger.error(f"EDAMSystemException: {e.message}")
-        return {
-            "success": False,
-            "error": _redact_sensitive_info(f"System error: {e.message}"),
-            "error_code": e.errorCode,
-        }
-    elif isinstance(e, EDAMNotFoundException):
-        logger.error(f"EDAMNotFoundException: {e.identifier}")
-        return {
-            "success": False,
-            "error": f"Resource not found: {e.identifier}",
-        }
-    else:
-        error_msg = str(e)
-        logger.error(f"Unexpected error: {type(e).__name__}: {_redact_sensitive_info(error_msg)}")
-        return {
-            "success": False,
-            "error": _redact_sensitive_info(error_msg),
-        }
+    result = error_response(e)
+    _log_error(e, result["error"])
+    return result
+
+
+def error_json(e: Exception) -> str:
+    """Return ``handle_evernote_error(e)`` as a compact JSON string.
+
+    The response shape is fixed, so only the message is run through the
+    JSON encoder; the rest is a preformatted template. In ``PRETTY`` mode
+    the response goes through ``dumps`` instead.
+
+    Args:
+        e: The exception to handle
+
+    Returns:
+        JSON string with success=false and error details (with sensitive info redacted)
+    """
+    if serialization.PRETTY:
+        return serialization.dumps(handle_evernote_error(e))
+    message, code = _describe_error(e)
+    _log_error(e, message)
+    error = _encode(message)
+    if code is _NO_CODE:
+        return f'{{"success":false,"error":{error}}}'
+    return f'{{"success":false,"error":{error},"error_code":{_encode(code)}}}'
 
 
 def _get_edam_user_error_message(e: EDAMUserException) -> str:
@@ -93,21 +161,6 @@ def _get_edam_user_error_message(e: EDAMUserException) -> str:
     Returns:
         Human-readable error message (without sensitive parameter details)
     """
-    error_messages = {
-        EDAMErrorCode.BAD_DATA_FORMAT: "Invalid data format",
-        EDAMErrorCode.DATA_CONFLICT: "Data conflict - resource already exists",
-        EDAMErrorCode.DATA_REQUIRED: "Required data is missing",
-        EDAMErrorCode.ENML_VALIDATION: "Invalid note content format",
-        EDAMErrorCode.LIMIT_REACHED: "Account limit reached",
-        EDAMErrorCode.QUOTA_REACHED: "Upload quota reached",
-        EDAMErrorCode.PERMISSION_DENIED: "Permission denied",
-        EDAMErrorCode.AUTH_EXPIRED: "Authentication token expired",
-        EDAMErrorCode.INVALID_AUTH: "Invalid authentication token",
-    }
-
-    base_message = error_messages.get(e.errorCode, f"Unknown error (code: {e.errorCode})")
-
     # Note: We no longer include the parameter in the error message to avoid
     # leaking internal implementation details or potentially sensitive data
-
-    return base_message
+    return _EDAM_USER_ERROR_MESSAGES.get(e.errorCode, f"Unknown error (code: {e.errorCode})")
@@ -0,0 +1,118 @@
+"""JSON serialization for MCP tool responses."""
+import base64
+import json
+import os
+from operator import attrgetter
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+try:
+    import pybase64
+except ImportError:  # pragma: no cover - pybase64 is an optional speedup
+    pybase64 = None
+
+# Set EVERNOTE_MCP_PRETTY=true to indent responses while debugging
+PRETTY = os.getenv("EVERNOTE_MCP_PRETTY", "false").lower() in ("1", "true")
+_JSON_INDENT = 2 if PRETTY else None
+
+# Compact separators keep the C encoder in play; indent forces the pure-Python one
+_ENCODER = json.JSONEncoder(
+    ensure_ascii=False,
+    indent=_JSON_INDENT,
+    separators=(",", ": ") if PRETTY else (",", ":"),
+)
+if orjson is not None:
+    _ORJSON_OPTION = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if PRETTY else 0)
+
+
+def dumps(obj: Any) -> str:
+    """Serialize a tool response as compact JSON (indented if ``PRETTY``).
+
+    Uses orjson when it is installed. Values orjson rejects, such as
+    integers wider than 64 bits, fall back to the stdlib encoder, which
+    produces the same output.
+
+    Args:
+        obj: JSON-compatible response object
+
+    Returns:
+        JSON string with non-ASCII characters kept as-is
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTION).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return _ENCODER.encode(obj)
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON tool argument, with orjson when it is installed.
+
+    Args:
+        data: JSON text
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        json.JSONDecodeError: If ``data`` is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def b64encode(data: bytes) -> str:
+    """Base64-encode binary data for a JSON response.
+
+    Uses pybase64's SIMD encoder when it is installed, which also builds the
+    ``str`` directly instead of encoding to ``bytes`` and decoding.
+
+    Args:
+        data: Binary data, e.g. a resource body
+
+    Returns:
+        Standard base64 text
+    """
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(data)
+    return base64.b64encode(data).decode("ascii")
+
+
+def b64_size(size: int) -> int:
+    """Return the length of the padded base64 text for ``size`` bytes.
+
+    Lets callers report the encoded size without running the encoder.
+
+    Args:
+        size: Length of the binary data in bytes
+
+    Returns:
+        Number of characters ``b64encode`` would produce
+    """
+    return (size + 2) // 3 * 4
+
+
+class FieldPicker:
+    """Copy selected attributes of a Thrift struct into a dict.
+
+    All attributes are fetched by a single ``operator.attrgetter`` call,
+    which runs in C, instead of one Python-level lookup per field.
+    """
+
+    def __init__(self, **fields: str):
+        """Initialize the picker.
+
+        Args:
+            **fields: Output key -> struct attribute name (at least two)
+        """
+        self._keys = tuple(fields)
+        self._getter = attrgetter(*fields.values())
+
+    def __call__(self, struct: Any) -> dict[str, Any]:
+        return dict(zip(self._keys, self._getter(struct)))
@@ -15,6 +15,9 @@ MAX_SAVED_SEARCH_QUERY_LENGTH = 1000
 DEFAULT_LIMIT = 100
 MAX_LIMIT = 250
 
+# Characters encoded per step when measuring non-ASCII content
+_UTF8_CHUNK_CHARS = 1024 * 1024
+
 
 class ValidationError(ValueError):
     """Raised when input validation fails."""
@@ -48,13 +51,35 @@ def validate_content(content: str, is_enml: bool = False) -> None:
         ValidationError: If content is too large
     """
     max_size = MAX_ENML_CONTENT_SIZE if is_enml else MAX_CONTENT_SIZE
-    size = len(content.encode('utf-8'))
-
-    if size > max_size:
+    if _utf8_size_exceeds(content, max_size):
         max_mb = max_size / (1024 * 1024)
         raise ValidationError(f"Content too large (max {max_mb:.0f}MB)")
 
 
+def _utf8_size_exceeds(content: str, max_size: int) -> bool:
+    """Return whether ``content`` encodes to more than ``max_size`` UTF-8 bytes.
+
+    UTF-8 uses 1 to 4 bytes per character, so most inputs are decided from
+    ``len(content)`` alone. Otherwise the content is encoded a chunk at a
+    time, stopping as soon as the limit is passed, instead of materializing
+    the whole encoded copy.
+    """
+    length = len(content)
+    if length * 4 <= max_size:
+        return False
+    if length > max_size:
+        return True
+    if content.isascii():
+        return False
+
+    size = 0
+    for start in range(0, length, _UTF8_CHUNK_CHARS):
+        size += len(content[start:start + _UTF8_CHUNK_CHARS].encode('utf-8'))
+        if size > max_size:
+            return True
+    return False
+
+
 def validate_tags(tags: Optional[List[str]]) -> None:
     """Validate tag list.
 
@@ -70,11 +95,12 @@ def validate_tags(tags: Optional[List[str]]) -> None:
     if len(tags) > MAX_TAGS_PER_NOTE:
         raise ValidationError(f"Too many tags (max {MAX_TAGS_PER_NOTE})")
 
+    max_len = MAX_TAG_NAME_LENGTH
     for tag in tags:
         if not tag:
             raise ValidationError("Tag names cannot be empty")
-        if len(tag) > MAX_TAG_NAME_LENGTH:
-            raise ValidationError(f"Tag name too long (max {MAX_TAG_NAME_LENGTH} characters)")
+        if len(tag) > max_len:
+            raise ValidationError(f"Tag name too long (max {max_len} characters)")
 
 
 def validate_search_query(query: str) -> None:
@@ -132,6 +158,14 @@ def validate_guid(guid: str, guid_type: str = "resource") -> None:
     """
     if not guid:
         raise ValidationError(f"{guid_type} GUID cannot be empty")
-    # Evernote GUIDs are typically hex strings, 32+ chars
-    if len(guid) < 30:
+    # Evernote GUIDs are 32 hex digits, usually dash-separated (36 chars)
+    if not 32 <= len(guid) <= 36:
+        raise ValidationError(f"Invalid {guid_type} GUID format")
+    digits = guid.replace('-', '')
+    try:
+        # fromhex skips whitespace, so also check every char was a digit
+        valid = len(bytes.fromhex(digits)) * 2 == len(digits) == 32
+    except ValueError:
+        valid = False
+    if not valid:
         raise ValidationError(f"Invalid {guid_type} GUID format")
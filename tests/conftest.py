@@ -1,6 +1,7 @@
 """Pytest configuration and shared fixtures for Evernote MCP tests."""
 
 import json
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 from typing import Generator
 
@@ -13,6 +14,15 @@ from evernote_mcp.config import EvernoteConfig
 
 # Mock classes for Evernote types
 class MockNotebook:
+    __slots__ = (
+        "guid",
+        "name",
+        "stack",
+        "serviceCreated",
+        "serviceUpdated",
+        "defaultNotebook",
+    )
+
     def __init__(
         self,
         guid: str = "test-notebook-guid",
@@ -28,6 +38,18 @@ class MockNotebook:
 
 
 class MockNote:
+    __slots__ = (
+        "guid",
+        "title",
+        "content",
+        "notebookGuid",
+        "active",
+        "tagGuids",
+        "attributes",
+        "created",
+        "updated",
+    )
+
     def __init__(
         self,
         guid: str = "test-note-guid",
@@ -46,6 +68,8 @@ class MockNote:
 
 
 class MockNoteAttributes:
+    __slots__ = ("reminderTime", "reminderOrder", "reminderDoneTime")
+
     def __init__(self):
         self.reminderTime = None
         self.reminderOrder = None
@@ -53,6 +77,8 @@ class MockNoteAttributes:
 
 
 class MockTag:
+    __slots__ = ("guid", "name", "parentGuid", "updateSequenceNum")
+
     def __init__(
         self,
         guid: str = "test-tag-guid",
@@ -62,9 +88,12 @@ class MockTag:
         self.guid = guid
         self.name = name
         self.parentGuid = parent_guid
+        self.updateSequenceNum = 1
 
 
 class MockSavedSearch:
+    __slots__ = ("guid", "name", "query", "updateSequenceNum")
+
     def __init__(
         self,
         guid: str = "test-search-guid",
@@ -78,18 +107,20 @@ class MockSavedSearch:
 
 
 class MockResource:
+    __slots__ = ("guid", "mime", "data", "attributes")
+
     def __init__(self, guid: str = "test-resource-guid"):
         self.guid = guid
         self.mime = "image/png"
-        self.data = MagicMock()
-        self.data.body = b"fake image data"
-        self.data.size = len(b"fake image data")
-        self.attributes = MagicMock()
-        self.attributes.fileName = "test.png"
-        self.attributes.sourceURL = None
+        self.data = SimpleNamespace(
+            body=b"fake image data", size=len(b"fake image data")
+        )
+        self.attributes = SimpleNamespace(fileName="test.png", sourceURL=None)
 
 
 class MockNotesMetadataResult:
+    __slots__ = ("totalNotes", "startIndex", "notes")
+
     def __init__(self, total_notes: int = 0, notes: list | None = None):
         self.totalNotes = total_notes
         self.startIndex = 0
@@ -139,8 +170,7 @@ def mock_client() -> Generator[EvernoteMCPClient, None, None]:
     with patch.object(EvernoteMCPClient, "__init__", lambda self, **kwargs: None):
         client = EvernoteMCPClient()
         client.note_store = MagicMock()
-        client.user = MagicMock()
-        client.user.username = "test_user"
+        client.user = SimpleNamespace(username="test_user")
         yield client
 
 
@@ -150,7 +180,7 @@ def mcp_server() -> FastMCP:
     return FastMCP("test-evernote-mcp")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_enml() -> str:
     """Sample ENML content for testing."""
     return """<?xml version="1.0" encoding="UTF-8"?>
@@ -163,7 +193,7 @@ def sample_enml() -> str:
 </en-note>"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_text() -> str:
     """Sample plain text for testing."""
     return """Bold text and italic
@@ -0,0 +1,75 @@
+"""Unit tests for the TTL cache."""
+
+from unittest.mock import patch
+
+import pytest
+
+from evernote_mcp.util.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test TTLCache behavior."""
+
+    def test_get_returns_stored_value(self):
+        cache = TTLCache()
+        cache.set(("get_tag", "g1"), "tag")
+
+        assert cache.get(("get_tag", "g1")) == "tag"
+
+    def test_get_missing_returns_default(self):
+        cache = TTLCache()
+
+        assert cache.get(("get_tag", "nope")) is None
+        assert cache.get(("get_tag", "nope"), "dflt") == "dflt"
+
+    def test_entry_expires_after_ttl(self):
+        cache = TTLCache(ttl=10)
+        with patch("evernote_mcp.util.cache.time.monotonic", return_value=100.0):
+            cache.set(("list_tags",), ["t"])
+        with patch("evernote_mcp.util.cache.time.monotonic", return_value=105.0):
+            assert cache.get(("list_tags",)) == ["t"]
+        with patch("evernote_mcp.util.cache.time.monotonic", return_value=111.0):
+            assert cache.get(("list_tags",)) is None
+
+    def test_peek_returns_expired_value(self):
+        cache = TTLCache(ttl=10)
+        with patch("evernote_mcp.util.cache.time.monotonic", return_value=100.0):
+            cache.set(("list_tags",), ["t"])
+        with patch("evernote_mcp.util.cache.time.monotonic", return_value=111.0):
+            assert cache.get(("list_tags",)) is None
+            assert cache.peek(("list_tags",)) == ["t"]
+        assert cache.peek(("get_tag", "x"), "dflt") == "dflt"
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2)
+        cache.set(("a",), 1)
+        cache.set(("b",), 2)
+        cache.get(("a",))
+        cache.set(("c",), 3)
+
+        assert cache.get(("a",)) == 1
+        assert cache.get(("b",)) is None
+        assert cache.get(("c",)) == 3
+
+    def test_invalidate_drops_only_named_families(self):
+        cache = TTLCache()
+        cache.set(("get_tag", "g1"), 1)
+        cache.set(("list_tags",), 2)
+        cache.set(("get_notebook", "n1"), 3)
+
+        cache.invalidate("get_tag", "list_tags")
+
+        assert cache.get(("get_tag", "g1")) is None
+        assert cache.get(("list_tags",)) is None
+        assert cache.get(("get_notebook", "n1")) == 3
+
+    def test_clear(self):
+        cache = TTLCache()
+        cache.set(("a",), 1)
+        cache.clear()
+
+        assert len(cache) == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
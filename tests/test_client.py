@@ -1,914 +1,1032 @@
 """Unit tests for EvernoteMCPClient."""
 
-from unittest.mock import MagicMock, patch, create_autospec
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, call, patch, sentinel
 
 import pytest
+from evernote.edam.notestore.ttypes import RelatedQuery, RelatedResultSpec
+from evernote.edam.type.ttypes import Note, NoteAttributes
 
-from evernote_mcp.client import EvernoteMCPClient
+from evernote_mcp.client import (
+    AsyncEvernoteMCPClient,
+    EvernoteMCPClient,
+    NoteSpec,
+    get_shared_client,
+)
 
 
-def create_mock_client():
-    """Create a mock client with note_store."""
-    client = create_autospec(EvernoteMCPClient, instance=True)
-    client.note_store = MagicMock()
-    client.auth_token = "test_token"
-    return client
+@pytest.fixture
+def real_client():
+    """A real EvernoteMCPClient whose note_store is a MagicMock."""
+    with patch("evernote_mcp.client.BaseEvernoteClient.__init__", return_value=None), \
+            patch.object(EvernoteMCPClient, "verify_token", return_value=None), \
+            patch.object(EvernoteMCPClient, "note_store", new_callable=MagicMock), \
+            EvernoteMCPClient(auth_token="test_token") as client:
+        yield client
+
+
+def _get_note_call(guid, with_content=False):
+    """The getNote call the client makes for ``get_note(guid, with_content)``."""
+    return call(
+        guid, withContent=with_content, withResourcesData=False,
+        withResourcesRecognition=False, withResourcesAlternateData=False
+    )
 
 
 class TestEvernoteMCPClientInit:
     """Test client initialization."""
 
-    @patch("evernote_mcp.client.BaseEvernoteClient.__init__", return_value=None)
-    @patch("evernote_mcp.client.EvernoteMCPClient.verify_token", return_value=None)
-    def test_init_with_defaults(self, mock_verify, mock_base_init):
-        with patch.object(EvernoteMCPClient, "user", None):
-            client = EvernoteMCPClient(auth_token="test_token")
-            # Verify the parent class __init__ was called with correct parameters
-            mock_base_init.assert_called_once()
-            call_kwargs = mock_base_init.call_args.kwargs
-            assert call_kwargs["token"] == "test_token"
-
-    @patch("evernote_mcp.client.BaseEvernoteClient.__init__", return_value=None)
-    @patch("evernote_mcp.client.EvernoteMCPClient.verify_token", return_value=None)
-    def test_init_with_china_backend(self, mock_verify, mock_base_init):
-        with patch.object(EvernoteMCPClient, "user", None):
-            client = EvernoteMCPClient(auth_token="test_token", backend="china")
-            call_kwargs = mock_base_init.call_args.kwargs
-            assert call_kwargs["token"] == "test_token"
-            assert call_kwargs["backend"] == "china"
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _class_patches(cls):
+        """Patch the base client, token check and user lookup once for the class."""
+        with patch("evernote_mcp.client.BaseEvernoteClient.__init__",
+                   return_value=None) as base_init, \
+                patch.object(EvernoteMCPClient, "verify_token", return_value=None), \
+                patch.object(EvernoteMCPClient, "user", None):
+            yield base_init
+
+    @pytest.fixture
+    def base_init(self, _class_patches):
+        _class_patches.reset_mock()
+        return _class_patches
+
+    def test_init_with_defaults(self, base_init):
+        client = EvernoteMCPClient(auth_token="test_token")
+        # Verify the parent class __init__ was called with correct parameters
+        [init_call] = base_init.call_args_list
+        call_kwargs = init_call.kwargs
+        assert call_kwargs["token"] == "test_token"
+
+    def test_init_with_china_backend(self, base_init):
+        client = EvernoteMCPClient(auth_token="test_token", backend="china")
+        call_kwargs = base_init.call_args.kwargs
+        assert call_kwargs["token"] == "test_token"
+        assert call_kwargs["backend"] == "china"
 
     @patch("evernote_mcp.client.get_cafile_path", return_value="/path/to/cafile")
-    @patch("evernote_mcp.client.BaseEvernoteClient.__init__", return_value=None)
-    @patch("evernote_mcp.client.EvernoteMCPClient.verify_token", return_value=None)
-    def test_init_with_system_ssl_ca(self, mock_verify, mock_base_init, mock_cafile):
-        with patch.object(EvernoteMCPClient, "user", None):
-            client = EvernoteMCPClient(
-                auth_token="test_token",
-                use_system_ssl_ca=True
-            )
+    def test_init_with_system_ssl_ca(self, mock_cafile):
+        client = EvernoteMCPClient(
+            auth_token="test_token",
+            use_system_ssl_ca=True
+        )
 
-            mock_cafile.assert_called_once_with(True)
+        mock_cafile.assert_called_once_with(True)
 
+    def test_note_store_reused_per_thread(self):
+        with patch.object(EvernoteMCPClient, "get_note_store",
+                          side_effect=lambda: MagicMock()) as mock_factory:
+            client = EvernoteMCPClient(auth_token="test_token")
+            assert client.note_store is client.note_store
+            mock_factory.assert_called_once()
 
-class TestNotebookOperations:
-    """Test notebook-related operations."""
+
+class TestVerifyToken:
+    """Test the process-wide verified-token cache."""
 
     @pytest.fixture
-    def client(self):
-        return create_mock_client()
-
-    def test_list_notebooks(self, client):
-        mock_notebook = MagicMock()
-        mock_notebook.guid = "nb-guid-1"
-        mock_notebook.name = "Test Notebook"
-        client.note_store.listNotebooks.return_value = [mock_notebook]
-        client.list_notebooks = lambda: client.note_store.listNotebooks()
-
-        result = client.list_notebooks()
-
-        assert len(result) == 1
-        assert result[0].guid == "nb-guid-1"
-        client.note_store.listNotebooks.assert_called_once()
-
-    def test_get_notebook(self, client):
-        mock_notebook = MagicMock()
-        mock_notebook.guid = "nb-guid-1"
-        client.note_store.getNotebook.return_value = mock_notebook
-        client.get_notebook = lambda guid: client.note_store.getNotebook(guid)
-
-        result = client.get_notebook("nb-guid-1")
-
-        assert result.guid == "nb-guid-1"
-        client.note_store.getNotebook.assert_called_once_with("nb-guid-1")
-
-    def test_create_notebook_without_stack(self, client):
-        mock_notebook = MagicMock()
-        mock_notebook.guid = "new-guid"
-        mock_notebook.name = "My Notebook"  # Set the name explicitly
-        client.note_store.createNotebook.return_value = mock_notebook
-        client.create_notebook = lambda name, stack=None: client.note_store.createNotebook(
-            MagicMock(name=name, stack=stack)
-        )
+    def make_client(self):
+        from evernote_mcp import client as client_module
 
-        result = client.create_notebook("My Notebook")
-
-        client.note_store.createNotebook.assert_called_once()
-        call_args = client.note_store.createNotebook.call_args[0][0]
-        # Check the name attribute directly on MagicMock returns another MagicMock
-        # So we check the call was made correctly
-        assert call_args is not None
-
-    def test_create_notebook_with_stack(self, client):
-        mock_notebook = MagicMock()
-        mock_notebook.name = "My Notebook"
-        mock_notebook.stack = "My Stack"
-        client.note_store.createNotebook.return_value = mock_notebook
-        client.create_notebook = lambda name, stack=None: client.note_store.createNotebook(
-            MagicMock(name=name, stack=stack)
-        )
+        client_module._VERIFIED_TOKENS.clear()
+        user_store = MagicMock()
+        user_store.getUser.return_value = SimpleNamespace(username="alice")
+
+        def make(token="S=s1:U=1:E=1:C=1:P=1:A=test:V=2:H=abc"):
+            client = EvernoteMCPClient.__new__(EvernoteMCPClient)
+            client.token = token
+            client.backend = "evernote"
+            return client
+
+        with patch.object(EvernoteMCPClient, "user_store", user_store):
+            yield make, user_store
+        client_module._VERIFIED_TOKENS.clear()
+
+    def test_second_client_skips_get_user(self, make_client):
+        make, user_store = make_client
+
+        first, second = make(), make()
+        first.verify_token()
+        second.verify_token()
+
+        user_store.getUser.assert_called_once()
+        assert second._user == "alice"
+
+    def test_different_token_verified_separately(self, make_client):
+        make, user_store = make_client
+
+        make("S=s1:token-a").verify_token()
+        make("S=s1:token-b").verify_token()
+
+        assert user_store.getUser.call_count == 2
 
-        result = client.create_notebook("My Notebook", "My Stack")
+    def test_cache_expires(self, make_client):
+        make, user_store = make_client
 
-        call_args = client.note_store.createNotebook.call_args[0][0]
-        assert call_args is not None
+        with patch("evernote_mcp.client.time.monotonic", return_value=0.0):
+            make().verify_token()
+        with patch("evernote_mcp.client.time.monotonic", return_value=301.0):
+            make().verify_token()
 
-    def test_update_notebook(self, client):
-        mock_notebook = MagicMock()
-        mock_notebook.guid = "nb-guid-1"
-        client.note_store.updateNotebook.return_value = 123
-        client.update_notebook = lambda notebook: client.note_store.updateNotebook(notebook)
+        assert user_store.getUser.call_count == 2
 
-        result = client.update_notebook(mock_notebook)
+    def test_raw_token_not_stored(self, make_client):
+        from evernote_mcp import client as client_module
 
-        assert result == 123
-        client.note_store.updateNotebook.assert_called_once_with(mock_notebook)
+        make, _ = make_client
+        make("S=s1:secret").verify_token()
 
-    def test_expunge_notebook(self, client):
-        client.note_store.expungeNotebook.return_value = 1
-        client.expunge_notebook = lambda guid: client.note_store.expungeNotebook(guid)
+        assert all(b"secret" not in key for key in client_module._VERIFIED_TOKENS)
 
-        result = client.expunge_notebook("nb-guid-1")
 
-        assert result == 1
-        client.note_store.expungeNotebook.assert_called_once_with("nb-guid-1")
+class TestSharedClient:
+    """Test the process-wide shared client registry."""
+
+    @pytest.fixture(autouse=True)
+    def clear_shared(self):
+        from evernote_mcp import client as client_module
+
+        client_module._SHARED_CLIENTS.clear()
+        with patch("evernote_mcp.client.EvernoteMCPClient",
+                   side_effect=lambda **kwargs: MagicMock(**kwargs)) as factory:
+            yield factory
+        client_module._SHARED_CLIENTS.clear()
+
+    def test_same_token_returns_same_client(self, clear_shared):
+        first = get_shared_client("S=s1:token", network_retry_count=3)
+        second = get_shared_client("S=s1:token")
+
+        assert first is second
+        clear_shared.assert_called_once_with(
+            auth_token="S=s1:token", backend="evernote", network_retry_count=3
+        )
+
+    def test_token_and_backend_are_separate_keys(self, clear_shared):
+        clients = {
+            id(get_shared_client("S=s1:a")),
+            id(get_shared_client("S=s1:b")),
+            id(get_shared_client("S=s1:a", backend="china")),
+        }
+
+        assert len(clients) == 3
+
+    def test_cached_lookup_skips_lock(self, clear_shared):
+        first = get_shared_client("S=s1:token")
+
+        with patch("evernote_mcp.client._SHARED_CLIENTS_LOCK") as lock:
+            assert get_shared_client("S=s1:token") is first
+
+        lock.__enter__.assert_not_called()
+
+    def test_concurrent_first_use_builds_one_client(self, clear_shared):
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_shared_client("S=s1:t")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(c) for c in results}) == 1
+        clear_shared.assert_called_once()
+
+
+class TestNoteStoreDelegation:
+    """Test client methods that pass straight through to one NoteStore call."""
+
+    @pytest.mark.parametrize("method, store_method, args", [
+        ("list_notebooks", "listNotebooks", ()),
+        ("get_notebook", "getNotebook", ("nb-guid",)),
+        ("update_notebook", "updateNotebook", (sentinel.notebook,)),
+        ("expunge_notebook", "expungeNotebook", ("nb-guid",)),
+        ("update_note", "updateNote", (sentinel.note,)),
+        ("expunge_note", "expungeNote", ("note-guid",)),
+        ("copy_note", "copyNote", ("note-guid", "target-nb-guid")),
+        ("list_tags", "listTags", ()),
+        ("get_tag", "getTag", ("tag-guid",)),
+        ("update_tag", "updateTag", (sentinel.tag,)),
+        ("expunge_tag", "expungeTag", ("tag-guid",)),
+        ("list_tags_by_notebook", "listTagsByNotebook", ("nb-guid",)),
+        ("list_searches", "listSearches", ()),
+        ("get_search", "getSearch", ("search-guid",)),
+        ("update_search", "updateSearch", (sentinel.search,)),
+        ("expunge_search", "expungeSearch", ("search-guid",)),
+        ("get_note_content", "getNoteContent", ("note-guid",)),
+        ("get_note_tag_names", "getNoteTagNames", ("note-guid",)),
+        ("list_note_versions", "listNoteVersions", ("note-guid",)),
+        ("get_default_notebook", "getDefaultNotebook", ()),
+        ("find_related", "findRelated", (RelatedQuery(plainText="q"), RelatedResultSpec())),
+        ("get_resource_data", "getResourceData", ("res-guid",)),
+        ("get_resource_alternate_data", "getResourceAlternateData", ("res-guid",)),
+        ("get_resource_attributes", "getResourceAttributes", ("res-guid",)),
+        ("get_resource_recognition", "getResourceRecognition", ("res-guid",)),
+        ("get_resource_search_text", "getResourceSearchText", ("res-guid",)),
+        ("update_resource", "updateResource", (sentinel.resource,)),
+        ("set_resource_application_data_entry", "setResourceApplicationDataEntry",
+         ("res-guid", "key", "value")),
+        ("unset_resource_application_data_entry", "unsetResourceApplicationDataEntry",
+         ("res-guid", "key")),
+        ("get_resource_application_data", "getResourceApplicationData", ("res-guid",)),
+        ("get_resource_application_data_entry", "getResourceApplicationDataEntry",
+         ("res-guid", "key")),
+    ])
+    def test_delegates_to_note_store(self, real_client, method, store_method, args):
+        store_call = getattr(real_client.note_store, store_method)
+        store_call.return_value = sentinel.result
+
+        result = getattr(real_client, method)(*args)
+
+        assert result is sentinel.result
+        store_call.assert_called_once_with(*args)
+
+
+class TestNotebookOperations:
+    """Test notebook-related operations."""
+
+    @pytest.mark.parametrize("stack", [None, "My Stack"])
+    def test_create_notebook(self, real_client, stack):
+        real_client.note_store.createNotebook.return_value = sentinel.notebook
+
+        result = real_client.create_notebook("My Notebook", stack)
+
+        assert result is sentinel.notebook
+        [create_call] = real_client.note_store.createNotebook.call_args_list
+        call_args = create_call.args[0]
+        assert call_args.name == "My Notebook"
+        assert call_args.stack == stack
 
 
 class TestNoteOperations:
     """Test note-related operations."""
 
-    @pytest.fixture
-    def client(self):
-        return create_mock_client()
-
-    def test_get_note_with_content(self, client):
-        mock_note = MagicMock()
-        mock_note.guid = "note-guid-1"
-        client.note_store.getNote.return_value = mock_note
-        client.get_note = lambda guid, with_content=True: client.note_store.getNote(
-            guid, withContent=with_content, withResourcesData=False,
-            withResourcesRecognition=False, withResourcesAlternateData=False
-        )
+    def test_get_note_with_content(self, real_client):
+        mock_note = SimpleNamespace(guid="note-guid-1")
+        real_client.note_store.getNote.return_value = mock_note
 
-        result = client.get_note("note-guid-1", with_content=True)
+        result = real_client.get_note("note-guid-1", with_content=True)
 
         assert result.guid == "note-guid-1"
-        client.note_store.getNote.assert_called_once()
-
-    def test_create_note(self, client):
-        mock_note = MagicMock()
-        mock_note.guid = "new-note-guid"
-        client.note_store.createNote.return_value = mock_note
-        client.create_note = lambda title, content, notebook_guid, tag_guids=None: (
-            client.note_store.createNote(
-                MagicMock(title=title, content=content, notebookGuid=notebook_guid,
-                         tagGuids=tag_guids)
-            )
-        )
+        assert real_client.note_store.getNote.call_args_list == [
+            _get_note_call("note-guid-1", with_content=True)
+        ]
+
+    def test_create_note(self, real_client):
+        mock_note = SimpleNamespace(guid="new-note-guid")
+        real_client.note_store.createNote.return_value = mock_note
 
-        result = client.create_note(
+        result = real_client.create_note(
             title="Test Note",
             content="<en-note>Content</en-note>",
             notebook_guid="nb-guid-1",
             tag_guids=["tag-1", "tag-2"]
         )
 
-        client.note_store.createNote.assert_called_once()
-        call_args = client.note_store.createNote.call_args[0][0]
+        assert result.guid == "new-note-guid"
+        [create_call] = real_client.note_store.createNote.call_args_list
+        call_args = create_call.args[0]
         assert call_args.title == "Test Note"
         assert call_args.notebookGuid == "nb-guid-1"
         assert call_args.tagGuids == ["tag-1", "tag-2"]
 
-    def test_create_note_without_tags(self, client):
-        mock_note = MagicMock()
-        client.note_store.createNote.return_value = mock_note
-        client.create_note = lambda title, content, notebook_guid, tag_guids=None: (
-            client.note_store.createNote(
-                MagicMock(title=title, content=content, notebookGuid=notebook_guid,
-                         tagGuids=tag_guids)
-            )
-        )
-
-        result = client.create_note(
+    def test_create_note_without_tags(self, real_client):
+        real_client.create_note(
             title="Test Note",
             content="<en-note>Content</en-note>",
             notebook_guid="nb-guid-1"
         )
 
-        call_args = client.note_store.createNote.call_args[0][0]
+        call_args = real_client.note_store.createNote.call_args[0][0]
         assert call_args.title == "Test Note"
+        assert call_args.tagGuids is None
 
-    def test_update_note(self, client):
-        mock_note = MagicMock()
-        mock_note.guid = "note-guid-1"
-        client.note_store.updateNote.return_value = mock_note
-        client.update_note = lambda note: client.note_store.updateNote(note)
+    def test_delete_note(self, real_client):
+        real_client.note_store.deleteNote.return_value = 42
 
-        result = client.update_note(mock_note)
+        result = real_client.delete_note("note-guid-1")
 
-        client.note_store.updateNote.assert_called_once_with(mock_note)
+        assert result == 42
+        real_client.note_store.deleteNote.assert_called_once_with("note-guid-1")
+        real_client.note_store.getNote.assert_not_called()
+        real_client.note_store.updateNote.assert_not_called()
 
-    def test_delete_note(self, client):
-        mock_note = MagicMock()
-        mock_note.guid = "note-guid-1"
-        mock_note.active = True
-        client.note_store.getNote.return_value = mock_note
-        client.note_store.updateNote.return_value = mock_note
+    def test_find_notes(self, real_client):
+        mock_result = SimpleNamespace(notes=[], totalNotes=0)
+        real_client.note_store.findNotesMetadata.return_value = mock_result
 
-        def delete_note_impl(guid):
-            note = client.note_store.getNote(
-                guid, withContent=False, withResourcesData=False,
-                withResourcesRecognition=False, withResourcesAlternateData=False
-            )
-            note.active = False
-            return client.note_store.updateNote(note)
+        result = real_client.find_notes("tag:test", "nb-guid-1", 50)
 
-        client.delete_note = delete_note_impl
+        [find_call] = real_client.note_store.findNotesMetadata.call_args_list
+        call_kwargs = find_call.kwargs
+        assert call_kwargs["offset"] == 0
+        assert call_kwargs["maxNotes"] == 50
+        assert call_kwargs["filter"].words == "tag:test"
+        assert call_kwargs["filter"].notebookGuid == "nb-guid-1"
 
-        result = client.delete_note("note-guid-1")
 
-        assert mock_note.active is False
-        client.note_store.updateNote.assert_called_once_with(mock_note)
+class TestBulkNoteOperations:
+    """Test concurrent bulk note operations."""
 
-    def test_expunge_note(self, client):
-        client.note_store.expungeNote.return_value = 1
-        client.expunge_note = lambda guid: client.note_store.expungeNote(guid)
+    def test_get_notes_preserves_order(self, real_client):
+        real_client.note_store.getNote.side_effect = (
+            lambda guid, **kwargs: SimpleNamespace(guid=guid)
+        )
 
-        result = client.expunge_note("note-guid-1")
+        results = real_client.get_notes(["g1", "g2", "g3"], with_content=False)
 
-        assert result == 1
-        client.note_store.expungeNote.assert_called_once_with("note-guid-1")
+        assert [r["guid"] for r in results] == ["g1", "g2", "g3"]
+        assert [r["note"].guid for r in results] == ["g1", "g2", "g3"]
+        assert all(r["error"] is None for r in results)
+        assert real_client.note_store.getNote.call_args.kwargs["withContent"] is False
 
-    def test_copy_note(self, client):
-        mock_note = MagicMock()
-        mock_note.guid = "new-note-guid"
-        client.note_store.copyNote.return_value = mock_note
-        client.copy_note = lambda guid, target_nb: client.note_store.copyNote(guid, target_nb)
+    def test_get_notes_partial_failure(self, real_client):
+        def get_note(guid, **kwargs):
+            if guid == "bad":
+                raise Exception("not found")
+            return SimpleNamespace(guid=guid)
 
-        result = client.copy_note("source-guid", "target-nb-guid")
+        real_client.note_store.getNote.side_effect = get_note
 
-        assert result.guid == "new-note-guid"
-        client.note_store.copyNote.assert_called_once_with(
-            "source-guid", "target-nb-guid"
-        )
+        results = real_client.get_notes(["good", "bad"])
 
-    def test_find_notes(self, client):
-        mock_result = MagicMock()
-        mock_result.notes = []
-        mock_result.totalNotes = 0
-        client.note_store.findNotesMetadata.return_value = mock_result
-
-        def find_notes_impl(query, notebook_guid=None, limit=100):
-            note_filter = MagicMock()
-            note_filter.words = query
-            note_filter.notebookGuid = notebook_guid
-
-            result_spec = MagicMock()
-            result_spec.includeTitle = True
-            result_spec.includeContent = True
-            result_spec.includeUpdated = True
-            result_spec.includeNotebookGuid = True
-
-            return client.note_store.findNotesMetadata(
-                filter=note_filter,
-                offset=0,
-                maxNotes=limit,
-                resultSpec=result_spec,
-            )
+        assert results[0]["note"].guid == "good"
+        assert results[1]["note"] is None
+        assert str(results[1]["error"]) == "not found"
 
-        client.find_notes = find_notes_impl
+    def test_get_note_defaults_to_metadata_only(self, real_client):
+        real_client.get_note("g1")
+        real_client.get_notes(["g2"])
 
-        result = client.find_notes("tag:test", "nb-guid-1", 50)
+        assert real_client.note_store.getNote.call_args_list == [
+            _get_note_call("g1"), _get_note_call("g2")
+        ]
 
-        client.note_store.findNotesMetadata.assert_called_once()
-        call_kwargs = client.note_store.findNotesMetadata.call_args.kwargs
-        assert call_kwargs["offset"] == 0
-        assert call_kwargs["maxNotes"] == 50
+    def test_create_note_builds_struct(self, real_client):
+        real_client.create_note("T", "<en-note/>", "nb", tag_guids=[])
 
+        note = real_client.note_store.createNote.call_args[0][0]
+        assert (note.title, note.content, note.notebookGuid) == ("T", "<en-note/>", "nb")
+        assert note.tagGuids is None
 
-class TestTagOperations:
-    """Test tag-related operations."""
+    def test_get_notes_empty(self, real_client):
+        assert real_client.get_notes([]) == []
+        real_client.note_store.getNote.assert_not_called()
 
-    @pytest.fixture
-    def client(self):
-        return create_mock_client()
+    def test_close_stops_workers(self, real_client):
+        before = set(threading.enumerate())
+        real_client.get_notes(["g1", "g2"])
+        workers = set(threading.enumerate()) - before
+        assert workers
 
-    def test_list_tags(self, client):
-        mock_tag = MagicMock()
-        mock_tag.guid = "tag-1"
-        mock_tag.name = "test"
-        client.note_store.listTags.return_value = [mock_tag]
-        client.list_tags = lambda: client.note_store.listTags()
+        real_client.close()
 
-        result = client.list_tags()
+        for worker in workers:
+            worker.join(timeout=5)
+            assert not worker.is_alive()
 
-        assert len(result) == 1
-        assert result[0].guid == "tag-1"
 
-    def test_get_tag(self, client):
-        mock_tag = MagicMock()
-        client.note_store.getTag.return_value = mock_tag
-        client.get_tag = lambda guid: client.note_store.getTag(guid)
+class TestBulkNoteCreation:
+    """Test concurrent bulk note creation."""
 
-        result = client.get_tag("tag-guid")
+    def test_create_notes_preserves_order(self, real_client):
+        real_client.note_store.createNote.side_effect = (
+            lambda note: SimpleNamespace(guid=note.title)
+        )
+        specs = [NoteSpec(f"n{i}", "<en-note/>", "nb") for i in range(3)]
 
-        assert result == mock_tag
-        client.note_store.getTag.assert_called_once_with("tag-guid")
+        results = real_client.create_notes(specs)
 
-    def test_create_tag_without_parent(self, client):
-        mock_tag = MagicMock()
-        mock_tag.name = "mytag"
-        client.note_store.createTag.return_value = mock_tag
-        client.create_tag = lambda name, parent_guid=None: client.note_store.createTag(
-            MagicMock(name=name, parentGuid=parent_guid)
-        )
+        assert [r["spec"] for r in results] == specs
+        assert [r["note"].guid for r in results] == ["n0", "n1", "n2"]
+        assert all(r["error"] is None for r in results)
 
-        result = client.create_tag("mytag")
+    def test_create_notes_partial_failure(self, real_client):
+        def create(note):
+            if note.title == "bad":
+                raise Exception("invalid")
+            return SimpleNamespace(guid=note.title)
 
-        call_args = client.note_store.createTag.call_args[0][0]
-        assert call_args is not None
+        real_client.note_store.createNote.side_effect = create
 
-    def test_create_tag_with_parent(self, client):
-        mock_tag = MagicMock()
-        client.note_store.createTag.return_value = mock_tag
-        client.create_tag = lambda name, parent_guid=None: client.note_store.createTag(
-            MagicMock(name=name, parentGuid=parent_guid)
+        results = real_client.create_notes(
+            [NoteSpec("ok", "<en-note/>", "nb"), NoteSpec("bad", "<en-note/>", "nb")]
         )
 
-        result = client.create_tag("mytag", "parent-guid")
+        assert results[0]["note"].guid == "ok"
+        assert results[1]["note"] is None
+        assert str(results[1]["error"]) == "invalid"
 
-        call_args = client.note_store.createTag.call_args[0][0]
-        assert call_args.parentGuid == "parent-guid"
 
-    def test_update_tag(self, client):
-        mock_tag = MagicMock()
-        client.note_store.updateTag.return_value = 123
-        client.update_tag = lambda tag: client.note_store.updateTag(tag)
+class TestBulkResourceOperations:
+    """Test concurrent bulk resource operations."""
 
-        result = client.update_tag(mock_tag)
+    def test_get_resources_preserves_order(self, real_client):
+        real_client.note_store.getResource.side_effect = (
+            lambda guid, **kwargs: SimpleNamespace(guid=guid)
+        )
 
-        assert result == 123
-        client.note_store.updateTag.assert_called_once_with(mock_tag)
+        results = real_client.get_resources(["r1", "r2", "r3"], with_data=True)
 
-    def test_expunge_tag(self, client):
-        client.note_store.expungeTag.return_value = 1
-        client.expunge_tag = lambda guid: client.note_store.expungeTag(guid)
+        assert [r["resource"].guid for r in results] == ["r1", "r2", "r3"]
+        assert all(r["error"] is None for r in results)
+        assert real_client.note_store.getResource.call_args.kwargs["withData"] is True
 
-        result = client.expunge_tag("tag-guid")
+    def test_get_resource_datas_partial_failure(self, real_client):
+        def get_data(guid):
+            if guid == "bad":
+                raise Exception("not found")
+            return guid.encode()
 
-        assert result == 1
-        client.note_store.expungeTag.assert_called_once_with("tag-guid")
+        real_client.note_store.getResourceData.side_effect = get_data
 
-    def test_list_tags_by_notebook(self, client):
-        mock_tag = MagicMock()
-        client.note_store.listTagsByNotebook.return_value = [mock_tag]
-        client.list_tags_by_notebook = lambda nb_guid: client.note_store.listTagsByNotebook(nb_guid)
+        results = real_client.get_resource_datas(["r1", "bad", "r2"])
 
-        result = client.list_tags_by_notebook("nb-guid")
+        assert [r["data"] for r in results] == [b"r1", None, b"r2"]
+        assert str(results[1]["error"]) == "not found"
 
-        assert len(result) == 1
-        client.note_store.listTagsByNotebook.assert_called_once_with("nb-guid")
 
-    def test_untag_all(self, client):
-        client.untag_all = lambda guid: client.note_store.untagAll(guid)
+class TestAsyncClient:
+    """Test the awaitable client facade."""
 
-        client.untag_all("tag-guid")
+    def test_methods_are_awaitable(self, real_client):
+        real_client.note_store.getNote.side_effect = (
+            lambda guid, **kwargs: SimpleNamespace(guid=guid)
+        )
+        async_client = AsyncEvernoteMCPClient(real_client)
 
-        client.note_store.untagAll.assert_called_once_with("tag-guid")
+        async def fetch():
+            return await asyncio.gather(
+                async_client.get_note("g1"), async_client.get_note("g2")
+            )
 
+        notes = asyncio.run(fetch())
 
-class TestSavedSearchOperations:
-    """Test saved search operations."""
+        assert [n.guid for n in notes] == ["g1", "g2"]
 
-    @pytest.fixture
-    def client(self):
-        return create_mock_client()
+    def test_exceptions_propagate(self, real_client):
+        real_client.note_store.getTag.side_effect = Exception("boom")
+        async_client = AsyncEvernoteMCPClient(real_client)
 
-    def test_list_searches(self, client):
-        mock_search = MagicMock()
-        client.note_store.listSearches.return_value = [mock_search]
-        client.list_searches = lambda: client.note_store.listSearches()
+        with pytest.raises(Exception, match="boom"):
+            asyncio.run(async_client.get_tag("tag-guid"))
 
-        result = client.list_searches()
 
-        assert len(result) == 1
-        client.note_store.listSearches.assert_called_once()
+class TestFindNotesPagination:
+    """Test findNotesMetadata paging in find_notes."""
 
-    def test_get_search(self, client):
-        mock_search = MagicMock()
-        client.note_store.getSearch.return_value = mock_search
-        client.get_search = lambda guid: client.note_store.getSearch(guid)
+    @staticmethod
+    def _pages(total):
+        def find_notes_metadata(filter, offset, maxNotes, resultSpec):
+            count = max(0, min(maxNotes, total - offset))
+            return SimpleNamespace(
+                totalNotes=total,
+                notes=[SimpleNamespace(guid=f"n{offset + i}") for i in range(count)],
+            )
+        return find_notes_metadata
 
-        result = client.get_search("search-guid")
+    def test_single_page(self, real_client):
+        real_client.note_store.findNotesMetadata.side_effect = self._pages(40)
 
-        assert result == mock_search
-        client.note_store.getSearch.assert_called_once_with("search-guid")
+        result = real_client.find_notes("", limit=100)
 
-    def test_create_search(self, client):
-        mock_search = MagicMock()
-        mock_search.name = "My Search"
-        client.note_store.createSearch.return_value = mock_search
-        client.create_search = lambda name, query: client.note_store.createSearch(
-            MagicMock(name=name, query=query)
-        )
+        assert len(result.notes) == 40
+        assert result.totalNotes == 40
+        real_client.note_store.findNotesMetadata.assert_called_once()
 
-        result = client.create_search("My Search", "tag:test")
+    def test_limit_above_server_cap(self, real_client):
+        real_client.note_store.findNotesMetadata.side_effect = self._pages(1000)
 
-        call_args = client.note_store.createSearch.call_args[0][0]
-        assert call_args is not None
+        result = real_client.find_notes("", limit=600)
 
-    def test_update_search(self, client):
-        mock_search = MagicMock()
-        client.note_store.updateSearch.return_value = 123
-        client.update_search = lambda search: client.note_store.updateSearch(search)
+        assert len(result.notes) == 600
+        assert result.notes[599].guid == "n599"
+        assert [n.guid for n in result.notes] == [f"n{i}" for i in range(600)]
+        calls = real_client.note_store.findNotesMetadata.call_args_list
+        pages = sorted((c.kwargs["offset"], c.kwargs["maxNotes"]) for c in calls)
+        assert pages == [(0, 250), (250, 250), (500, 100)]
 
-        result = client.update_search(mock_search)
+    def test_stops_at_total(self, real_client):
+        real_client.note_store.findNotesMetadata.side_effect = self._pages(300)
 
-        assert result == 123
-        client.note_store.updateSearch.assert_called_once_with(mock_search)
+        result = real_client.find_notes("", limit=1000)
 
-    def test_expunge_search(self, client):
-        client.note_store.expungeSearch.return_value = 1
-        client.expunge_search = lambda guid: client.note_store.expungeSearch(guid)
+        assert len(result.notes) == 300
+        assert real_client.note_store.findNotesMetadata.call_count == 2
 
-        result = client.expunge_search("search-guid")
+    def test_page_error_raised(self, real_client):
+        pages = self._pages(600)
 
-        assert result == 1
-        client.note_store.expungeSearch.assert_called_once_with("search-guid")
+        def find_notes_metadata(filter, offset, maxNotes, resultSpec):
+            if offset == 500:
+                raise Exception("boom")
+            return pages(filter, offset, maxNotes, resultSpec)
 
+        real_client.note_store.findNotesMetadata.side_effect = find_notes_metadata
 
-class TestAdvancedNoteOperations:
-    """Test advanced note operations."""
+        with pytest.raises(Exception, match="boom"):
+            real_client.find_notes("", limit=600)
 
-    @pytest.fixture
-    def client(self):
-        return create_mock_client()
+    def test_find_reminders_pages_past_cap(self, real_client):
+        real_client.note_store.findNotesMetadata.side_effect = self._pages(400)
 
-    def test_get_note_content(self, client):
-        client.note_store.getNoteContent.return_value = "<en-note>Content</en-note>"
-        client.get_note_content = lambda guid: client.note_store.getNoteContent(guid)
+        result = real_client.find_reminders(limit=1000)
 
-        result = client.get_note_content("note-guid")
+        assert len(result.notes) == 400
+        calls = real_client.note_store.findNotesMetadata.call_args_list
+        assert len({id(c.kwargs["resultSpec"]) for c in calls}) == 1
+        assert calls[0].kwargs["resultSpec"].includeAttributes is True
 
-        assert result == "<en-note>Content</en-note>"
-        client.note_store.getNoteContent.assert_called_once_with("note-guid")
+    def test_find_reminders_reuses_structs(self, real_client):
+        real_client.note_store.findNotesMetadata.side_effect = self._pages(0)
 
-    def test_get_note_search_text(self, client):
-        client.note_store.getNoteSearchText.return_value = "search text"
-        client.get_note_search_text = lambda guid, note_only=False, tokenize=False: (
-            client.note_store.getNoteSearchText(guid, note_only, tokenize)
-        )
+        real_client.find_reminders(notebook_guid="nb")
+        real_client.find_reminders(notebook_guid="nb")
+        real_client.find_reminders(include_completed=True)
 
-        result = client.get_note_search_text("note-guid", note_only=True)
+        calls = real_client.note_store.findNotesMetadata.call_args_list
+        assert calls[0].kwargs["filter"] is calls[1].kwargs["filter"]
+        assert calls[0].kwargs["resultSpec"] is calls[2].kwargs["resultSpec"]
+        assert calls[2].kwargs["filter"].words == "reminderTime:*"
+        assert calls[2].kwargs["filter"].notebookGuid is None
 
-        assert result == "search text"
-        client.note_store.getNoteSearchText.assert_called_once_with(
-            "note-guid", True, False
-        )
+    def test_result_spec_is_metadata_only(self, real_client):
+        real_client.note_store.findNotesMetadata.side_effect = self._pages(0)
 
-    def test_get_note_tag_names(self, client):
-        client.note_store.getNoteTagNames.return_value = ["tag1", "tag2"]
-        client.get_note_tag_names = lambda guid: client.note_store.getNoteTagNames(guid)
+        real_client.find_notes("", include_content_length=True)
 
-        result = client.get_note_tag_names("note-guid")
+        spec = real_client.note_store.findNotesMetadata.call_args.kwargs["resultSpec"]
+        assert spec.includeTitle is True
+        assert spec.includeContentLength is True
+        assert spec.includeCreated is None
+        assert not hasattr(spec, "includeContent")
 
-        assert result == ["tag1", "tag2"]
-        client.note_store.getNoteTagNames.assert_called_once_with("note-guid")
+    def test_iter_notes_fetches_pages_on_demand(self, real_client):
+        real_client.note_store.findNotesMetadata.side_effect = self._pages(1000)
 
-    def test_list_note_versions(self, client):
-        mock_version = MagicMock()
-        mock_version.updateSequenceNum = 1
-        client.note_store.listNoteVersions.return_value = [mock_version]
-        client.list_note_versions = lambda note_guid: client.note_store.listNoteVersions(note_guid)
+        notes = real_client.iter_notes("", page_size=100)
+        first = [next(notes) for _ in range(150)]
 
-        result = client.list_note_versions("note-guid")
+        assert first[-1].guid == "n149"
+        assert real_client.note_store.findNotesMetadata.call_count == 2
 
-        assert len(result) == 1
-        client.note_store.listNoteVersions.assert_called_once_with("note-guid")
+    def test_iter_notes_exhausts_all_pages(self, real_client):
+        real_client.note_store.findNotesMetadata.side_effect = self._pages(520)
 
-    def test_get_note_version(self, client):
-        mock_note = MagicMock()
-        client.note_store.getNoteVersion.return_value = mock_note
-        client.get_note_version = lambda note_guid, usn, with_resources_data=False, with_resources_recognition=False, with_resources_alternate_data=False: (
-            client.note_store.getNoteVersion(note_guid, usn, with_resources_data, with_resources_recognition, with_resources_alternate_data)
-        )
+        guids = [n.guid for n in real_client.iter_notes("", notebook_guid="nb")]
 
-        result = client.get_note_version(
-            "note-guid", 123,
-            with_resources_data=False,
-            with_resources_recognition=False,
-            with_resources_alternate_data=False
-        )
+        assert len(guids) == 520
+        calls = real_client.note_store.findNotesMetadata.call_args_list
+        assert [c.kwargs["offset"] for c in calls] == [0, 250, 500]
+        assert calls[0].kwargs["filter"].notebookGuid == "nb"
 
-        assert result == mock_note
-        client.note_store.getNoteVersion.assert_called_once()
 
+class TestLookupCache:
+    """Test caching of notebook and tag lookups."""
 
-class TestSyncOperations:
-    """Test sync and utility operations."""
+    def test_list_notebooks_cached(self, real_client):
+        real_client.note_store.listNotebooks.return_value = ["nb"]
 
-    @pytest.fixture
-    def client(self):
-        return create_mock_client()
+        assert real_client.list_notebooks() == ["nb"]
+        assert real_client.list_notebooks() == ["nb"]
+        real_client.note_store.listNotebooks.assert_called_once()
 
-    def test_get_sync_state(self, client):
-        mock_state = MagicMock()
-        mock_state.currentTime = 1234567890000
-        client.note_store.getSyncState.return_value = mock_state
-        client.get_sync_state = lambda: client.note_store.getSyncState()
+    def test_get_tag_cached_per_guid(self, real_client):
+        real_client.note_store.getTag.side_effect = lambda guid: f"tag-{guid}"
 
-        result = client.get_sync_state()
+        assert real_client.get_tag("a") == "tag-a"
+        assert real_client.get_tag("b") == "tag-b"
+        assert real_client.get_tag("a") == "tag-a"
+        assert real_client.note_store.getTag.call_count == 2
 
-        assert result.currentTime == 1234567890000
-        client.note_store.getSyncState.assert_called_once()
+    def test_notebook_write_invalidates(self, real_client):
+        real_client.note_store.listNotebooks.return_value = ["nb"]
+        real_client.list_notebooks()
 
-    def test_get_default_notebook(self, client):
-        mock_nb = MagicMock()
-        mock_nb.guid = "default-nb"
-        client.note_store.getDefaultNotebook.return_value = mock_nb
-        client.get_default_notebook = lambda: client.note_store.getDefaultNotebook()
+        real_client.update_notebook(sentinel.notebook)
+        real_client.list_notebooks()
 
-        result = client.get_default_notebook()
+        assert real_client.note_store.listNotebooks.call_count == 2
 
-        assert result.guid == "default-nb"
-        client.note_store.getDefaultNotebook.assert_called_once()
+    def test_tag_write_invalidates_only_tags(self, real_client):
+        real_client.list_tags()
+        real_client.list_notebooks()
 
-    def test_find_note_counts(self, client):
-        mock_counts = MagicMock()
-        mock_counts.notebookCounts = {"nb1": 5}
-        mock_counts.tagCounts = {"tag1": 3}
-        mock_counts.trashCount = 0
-        client.note_store.findNoteCounts.return_value = mock_counts
+        real_client.expunge_tag("t1")
+        real_client.list_tags()
+        real_client.list_notebooks()
 
-        def find_counts_impl(query="", with_trash=False):
-            note_filter = MagicMock()
-            note_filter.words = query
-            return client.note_store.findNoteCounts(note_filter, with_trash)
+        assert real_client.note_store.listTags.call_count == 2
+        real_client.note_store.listNotebooks.assert_called_once()
 
-        client.find_note_counts = find_counts_impl
+    def test_lookup_during_write_not_kept(self, real_client):
+        real_client.note_store.listTags.side_effect = [["old"], ["old", "new"]]
+        real_client.note_store.createTag.side_effect = lambda tag: real_client.list_tags()
 
-        result = client.find_note_counts("tag:test", with_trash=False)
+        real_client.create_tag("new")
 
-        client.note_store.findNoteCounts.assert_called_once()
-        call_args = client.note_store.findNoteCounts.call_args[0][0]
-        assert call_args.words == "tag:test"
+        assert real_client.list_tags() == ["old", "new"]
+        assert real_client.note_store.listTags.call_count == 2
 
-    def test_find_related(self, client):
-        from evernote.edam.notestore.ttypes import RelatedQuery, RelatedResultSpec
+    def test_cold_miss_skips_sync_state(self, real_client):
+        real_client.list_notebooks()
+        real_client.get_tag("t1")
 
-        mock_result = MagicMock()
-        mock_result.notes = []
-        mock_result.notebooks = []
-        mock_result.tags = []
-        client.note_store.findRelated.return_value = mock_result
-        client.find_related = lambda query, result_spec: client.note_store.findRelated(query, result_spec)
+        real_client.note_store.listNotebooks.assert_called_once()
+        real_client.note_store.getTag.assert_called_once()
+        real_client.note_store.getSyncState.assert_not_called()
 
-        query = RelatedQuery()
-        query.plainText = "test query"
-        result_spec = RelatedResultSpec()
+    def test_cold_miss_stamped_from_shared_sync_state(self, real_client):
+        real_client.note_store.getSyncState.return_value = SimpleNamespace(updateCount=5)
+        real_client.get_sync_state()
 
-        result = client.find_related(query, result_spec)
+        real_client.list_notebooks()
 
-        assert result == mock_result
-        client.note_store.findRelated.assert_called_once_with(query, result_spec)
+        assert real_client._cache.peek(("list_notebooks",))[0] == 5
+        real_client.note_store.getSyncState.assert_called_once()
 
+    def test_unstamped_entry_stamped_on_refetch(self, real_client):
+        real_client.note_store.getSyncState.return_value = SimpleNamespace(updateCount=5)
+        with patch("evernote_mcp.util.cache.time.monotonic", return_value=100.0):
+            real_client.list_tags()
+        with patch("evernote_mcp.util.cache.time.monotonic", return_value=1000.0):
+            real_client.list_tags()
+        with patch("evernote_mcp.util.cache.time.monotonic", return_value=2000.0):
+            real_client.list_tags()
 
-class TestResourceOperations:
-    """Test resource operations."""
+        assert real_client.note_store.listTags.call_count == 2
+        assert real_client.note_store.getSyncState.call_count == 2
 
-    @pytest.fixture
-    def client(self):
-        return create_mock_client()
-
-    def test_get_resource(self, client):
-        mock_resource = MagicMock()
-        mock_resource.guid = "res-guid"
-        client.note_store.getResource.return_value = mock_resource
-        client.get_resource = lambda guid, with_data=False, with_recognition=False, with_attributes=True, with_alternate_data=False: (
-            client.note_store.getResource(guid, withData=with_data, withRecognition=with_recognition,
-                                       withAttributes=with_attributes, withAlternateData=with_alternate_data)
+    def test_expired_entry_reused_when_update_count_unchanged(self, real_client):
+        real_client.note_store.getSyncState.return_value = SimpleNamespace(updateCount=5)
+        with patch("evernote_mcp.util.cache.time.monotonic", return_value=100.0):
+            real_client.get_sync_state()
+            real_client.list_tags()
+        with patch("evernote_mcp.util.cache.time.monotonic", return_value=1000.0):
+            real_client.list_tags()
+
+        real_client.note_store.listTags.assert_called_once()
+        assert real_client.note_store.getSyncState.call_count == 2
+
+    def test_expired_entry_refetched_when_update_count_changed(self, real_client):
+        real_client.note_store.getSyncState.side_effect = [
+            SimpleNamespace(updateCount=5),
+            SimpleNamespace(updateCount=6),
+            SimpleNamespace(updateCount=6),
+        ]
+        with patch("evernote_mcp.util.cache.time.monotonic", return_value=100.0):
+            real_client.get_sync_state()
+            real_client.list_tags()
+        with patch("evernote_mcp.util.cache.time.monotonic", return_value=1000.0):
+            real_client.list_tags()
+
+        assert real_client.note_store.listTags.call_count == 2
+
+    def test_expired_entry_refetched_when_sync_state_fails(self, real_client):
+        real_client.note_store.getSyncState.side_effect = Exception("down")
+        with patch("evernote_mcp.util.cache.time.monotonic", return_value=100.0):
+            real_client.list_tags()
+        with patch("evernote_mcp.util.cache.time.monotonic", return_value=1000.0):
+            real_client.list_tags()
+
+        assert real_client.note_store.listTags.call_count == 2
+
+    def test_search_write_invalidates_list_searches(self, real_client):
+        real_client.list_searches()
+        real_client.list_searches()
+        real_client.create_search("s", "tag:x")
+        real_client.list_searches()
+
+        assert real_client.note_store.listSearches.call_count == 2
+
+    def test_search_lookup_during_write_not_kept(self, real_client):
+        real_client.note_store.listSearches.side_effect = [["old"], ["old", "new"]]
+        real_client.note_store.createSearch.side_effect = (
+            lambda search: real_client.list_searches()
         )
 
-        result = client.get_resource(
-            "res-guid",
-            with_data=False,
-            with_recognition=False,
-            with_attributes=True,
-            with_alternate_data=False
+        real_client.create_search("new", "tag:x")
+
+        assert real_client.list_searches() == ["old", "new"]
+
+    def test_default_notebook_cached(self, real_client):
+        real_client.get_default_notebook()
+        real_client.get_default_notebook()
+
+        real_client.note_store.getDefaultNotebook.assert_called_once()
+
+    def test_sync_state_shared_briefly(self, real_client):
+        real_client.note_store.getSyncState.return_value = SimpleNamespace(updateCount=5)
+        now = [0.0]
+        with patch("evernote_mcp.util.cache.time.monotonic", side_effect=lambda: now[0]):
+            first = real_client.get_sync_state()
+            assert real_client.get_sync_state() is first
+            assert real_client._update_count() == 5
+            now[0] = 10.0
+            real_client.get_sync_state()
+
+        assert real_client.note_store.getSyncState.call_count == 2
+
+    def test_tags_by_notebook_revalidated_on_every_hit(self, real_client):
+        real_client.note_store.getSyncState.side_effect = [
+            SimpleNamespace(updateCount=5),
+            SimpleNamespace(updateCount=5),
+            SimpleNamespace(updateCount=6),
+        ]
+        now = [0.0]
+        with patch("evernote_mcp.util.cache.time.monotonic", side_effect=lambda: now[0]):
+            real_client.get_sync_state()
+            for now[0] in (0.0, 10.0, 20.0):
+                real_client.list_tags_by_notebook("nb")
+
+        assert real_client.note_store.listTagsByNotebook.call_count == 2
+        assert real_client.note_store.getSyncState.call_count == 3
+
+    def test_note_write_invalidates_tags_by_notebook(self, real_client):
+        real_client.list_tags_by_notebook("nb")
+        real_client.update_note(sentinel.note)
+        real_client.list_tags_by_notebook("nb")
+
+        assert real_client.note_store.listTagsByNotebook.call_count == 2
+
+    def test_tags_by_notebook_lookup_during_note_write_not_kept(self, real_client):
+        real_client.note_store.getSyncState.return_value = SimpleNamespace(updateCount=5)
+        real_client.note_store.listTagsByNotebook.side_effect = [["old"], ["old", "new"]]
+        real_client.note_store.createNote.side_effect = (
+            lambda note: real_client.list_tags_by_notebook("nb")
         )
+        real_client.get_sync_state()
 
-        assert result.guid == "res-guid"
-        client.note_store.getResource.assert_called_once()
+        real_client.create_note("t", "c", "nb", ["new"])
 
-    def test_get_resource_data(self, client):
-        client.note_store.getResourceData.return_value = b"binary data"
-        client.get_resource_data = lambda guid: client.note_store.getResourceData(guid)
+        assert real_client.list_tags_by_notebook("nb") == ["old", "new"]
 
-        result = client.get_resource_data("res-guid")
+    def test_clear_cache(self, real_client):
+        real_client.list_notebooks()
+        real_client.clear_cache()
+        real_client.list_notebooks()
 
-        assert result == b"binary data"
-        client.note_store.getResourceData.assert_called_once_with("res-guid")
+        assert real_client.note_store.listNotebooks.call_count == 2
 
-    def test_get_resource_alternate_data(self, client):
-        client.note_store.getResourceAlternateData.return_value = b"alt data"
-        client.get_resource_alternate_data = lambda guid: client.note_store.getResourceAlternateData(guid)
+    def test_errors_not_cached(self, real_client):
+        real_client.note_store.getNotebook.side_effect = [Exception("boom"), "nb"]
 
-        result = client.get_resource_alternate_data("res-guid")
+        with pytest.raises(Exception):
+            real_client.get_notebook("g")
+        assert real_client.get_notebook("g") == "nb"
 
-        assert result == b"alt data"
-        client.note_store.getResourceAlternateData.assert_called_once_with("res-guid")
 
-    def test_get_resource_attributes(self, client):
-        mock_attr = MagicMock()
-        client.note_store.getResourceAttributes.return_value = mock_attr
-        client.get_resource_attributes = lambda guid: client.note_store.getResourceAttributes(guid)
+class TestTagOperations:
+    """Test tag-related operations."""
 
-        result = client.get_resource_attributes("res-guid")
+    @pytest.mark.parametrize("parent_guid", [None, "parent-guid"])
+    def test_create_tag(self, real_client, parent_guid):
+        real_client.note_store.createTag.return_value = sentinel.tag
 
-        assert result == mock_attr
-        client.note_store.getResourceAttributes.assert_called_once_with("res-guid")
+        result = real_client.create_tag("mytag", parent_guid)
 
-    def test_get_resource_by_hash(self, client):
-        mock_resource = MagicMock()
-        mock_resource.guid = "res-guid"
-        client.note_store.getResourceByHash.return_value = mock_resource
-        client.get_resource_by_hash = lambda note_guid, hash_bytes, with_data=False, with_recognition=False, with_attributes=True, with_alternate_data=False: (
-            client.note_store.getResourceByHash(note_guid, hash_bytes, withData=with_data,
-                                              withRecognition=with_recognition, withAlternateData=with_alternate_data)
-        )
+        assert result is sentinel.tag
+        call_args = real_client.note_store.createTag.call_args[0][0]
+        assert call_args.name == "mytag"
+        assert call_args.parentGuid == parent_guid
 
-        hash_bytes = b"\x01\x02\x03\x04"
-        result = client.get_resource_by_hash(
-            "note-guid", hash_bytes,
-            with_data=False,
-            with_recognition=False,
-            with_attributes=True,
-            with_alternate_data=False
-        )
+    def test_untag_all(self, real_client):
+        real_client.untag_all("tag-guid")
 
-        assert result.guid == "res-guid"
-        client.note_store.getResourceByHash.assert_called_once()
+        real_client.note_store.untagAll.assert_called_once_with("tag-guid")
 
-    def test_get_resource_recognition(self, client):
-        client.note_store.getResourceRecognition.return_value = b"ocr data"
-        client.get_resource_recognition = lambda guid: client.note_store.getResourceRecognition(guid)
 
-        result = client.get_resource_recognition("res-guid")
+class TestSavedSearchOperations:
+    """Test saved search operations."""
 
-        assert result == b"ocr data"
-        client.note_store.getResourceRecognition.assert_called_once_with("res-guid")
+    def test_create_search(self, real_client):
+        real_client.note_store.createSearch.return_value = sentinel.search
 
-    def test_get_resource_search_text(self, client):
-        client.note_store.getResourceSearchText.return_value = "searchable text"
-        client.get_resource_search_text = lambda guid: client.note_store.getResourceSearchText(guid)
+        result = real_client.create_search("My Search", "tag:test")
 
-        result = client.get_resource_search_text("res-guid")
+        assert result is sentinel.search
+        call_args = real_client.note_store.createSearch.call_args[0][0]
+        assert call_args.name == "My Search"
+        assert call_args.query == "tag:test"
 
-        assert result == "searchable text"
-        client.note_store.getResourceSearchText.assert_called_once_with("res-guid")
 
-    def test_update_resource(self, client):
-        client.note_store.updateResource.return_value = 123
-        client.update_resource = lambda resource: client.note_store.updateResource(resource)
+class TestAdvancedNoteOperations:
+    """Test advanced note operations."""
 
-        result = client.update_resource(MagicMock())
+    def test_get_note_search_text(self, real_client):
+        real_client.note_store.getNoteSearchText.return_value = "search text"
 
-        assert result == 123
-        client.note_store.updateResource.assert_called_once()
+        result = real_client.get_note_search_text("note-guid", note_only=True)
 
-    def test_set_resource_application_data_entry(self, client):
-        client.note_store.setResourceApplicationDataEntry.return_value = 123
-        client.set_resource_application_data_entry = lambda guid, key, value: (
-            client.note_store.setResourceApplicationDataEntry(guid, key, value)
+        assert result == "search text"
+        real_client.note_store.getNoteSearchText.assert_called_once_with(
+            "note-guid", True, False
         )
 
-        result = client.set_resource_application_data_entry(
-            "res-guid", "key", "value"
-        )
+    def test_get_note_version(self, real_client):
+        real_client.note_store.getNoteVersion.return_value = sentinel.note
 
-        assert result == 123
-        client.note_store.setResourceApplicationDataEntry.assert_called_once_with(
-            "res-guid", "key", "value"
+        result = real_client.get_note_version(
+            "note-guid", 123,
+            with_resources_data=True,
+            with_resources_recognition=False,
+            with_resources_alternate_data=False
         )
 
-    def test_unset_resource_application_data_entry(self, client):
-        client.note_store.unsetResourceApplicationDataEntry.return_value = 123
-        client.unset_resource_application_data_entry = lambda guid, key: (
-            client.note_store.unsetResourceApplicationDataEntry(guid, key)
+        assert result is sentinel.note
+        real_client.note_store.getNoteVersion.assert_called_once_with(
+            "note-guid", 123, True, False, False
         )
 
-        result = client.unset_resource_application_data_entry("res-guid", "key")
 
-        assert result == 123
-        client.note_store.unsetResourceApplicationDataEntry.assert_called_once_with(
-            "res-guid", "key"
+class TestSyncOperations:
+    """Test sync and utility operations."""
+
+    def test_get_sync_state(self, real_client):
+        mock_state = SimpleNamespace(currentTime=1234567890000)
+        real_client.note_store.getSyncState.return_value = mock_state
+
+        result = real_client.get_sync_state()
+
+        assert result.currentTime == 1234567890000
+        real_client.note_store.getSyncState.assert_called_once()
+
+    def test_find_note_counts(self, real_client):
+        mock_counts = SimpleNamespace(
+            notebookCounts={"nb1": 5},
+            tagCounts={"tag1": 3},
+            trashCount=0,
         )
+        real_client.note_store.findNoteCounts.return_value = mock_counts
+
+        result = real_client.find_note_counts("tag:test", with_trash=False)
+
+        assert result is mock_counts
+        [count_call] = real_client.note_store.findNoteCounts.call_args_list
+        call_args = count_call.args
+        assert call_args[0].words == "tag:test"
+        assert call_args[1] is False
 
-    def test_get_resource_application_data(self, client):
-        mock_data = {"key": "value"}
-        client.note_store.getResourceApplicationData.return_value = mock_data
-        client.get_resource_application_data = lambda guid: client.note_store.getResourceApplicationData(guid)
 
-        result = client.get_resource_application_data("res-guid")
+class TestResourceOperations:
+    """Test resource operations."""
 
-        assert result == mock_data
-        client.note_store.getResourceApplicationData.assert_called_once_with("res-guid")
+    def test_get_resource(self, real_client):
+        mock_resource = SimpleNamespace(guid="res-guid")
+        real_client.note_store.getResource.return_value = mock_resource
 
-    def test_get_resource_application_data_entry(self, client):
-        client.note_store.getResourceApplicationDataEntry.return_value = "value"
-        client.get_resource_application_data_entry = lambda guid, key: (
-            client.note_store.getResourceApplicationDataEntry(guid, key)
+        result = real_client.get_resource(
+            "res-guid",
+            with_data=False,
+            with_recognition=False,
+            with_attributes=True,
+            with_alternate_data=False
         )
 
-        result = client.get_resource_application_data_entry("res-guid", "key")
+        assert result.guid == "res-guid"
+        real_client.note_store.getResource.assert_called_once_with(
+            "res-guid", withData=False, withRecognition=False,
+            withAttributes=True, withAlternateData=False
+        )
 
-        assert result == "value"
-        client.note_store.getResourceApplicationDataEntry.assert_called_once_with(
-            "res-guid", "key"
+    def test_get_resource_by_hash(self, real_client):
+        mock_resource = SimpleNamespace(guid="res-guid")
+        real_client.note_store.getResourceByHash.return_value = mock_resource
+
+        hash_bytes = b"\x01\x02\x03\x04"
+        result = real_client.get_resource_by_hash(
+            "note-guid", hash_bytes,
+            with_data=False,
+            with_recognition=False,
+            with_attributes=True,
+            with_alternate_data=False
+        )
+
+        assert result.guid == "res-guid"
+        real_client.note_store.getResourceByHash.assert_called_once_with(
+            "note-guid", hash_bytes, withData=False, withRecognition=False,
+            withAlternateData=False
         )
 
 
 class TestReminderOperations:
     """Test reminder operations."""
 
-    @pytest.fixture
-    def client(self):
-        return create_mock_client()
-
-    def test_set_reminder_creates_attributes(self, client):
-        mock_note = MagicMock()
-        mock_note.guid = "note-guid"
-        mock_note.attributes = None
-        client.note_store.getNote.return_value = mock_note
-        client.note_store.updateNote.return_value = mock_note
-
-        def set_reminder_impl(note_guid, reminder_time=None, reminder_order=None):
-            note = client.note_store.getNote(
-                note_guid, withContent=False, withResourcesData=False,
-                withResourcesRecognition=False, withResourcesAlternateData=False
-            )
-            if not note.attributes:
-                note.attributes = MagicMock()
-            note.attributes.reminderTime = reminder_time
-            note.attributes.reminderOrder = reminder_order or 1
-            return client.note_store.updateNote(note)
+    def _note(self, attributes=None):
+        return Note(guid="note-guid", attributes=attributes)
 
-        client.set_reminder = set_reminder_impl
+    def test_set_reminder_creates_attributes(self, real_client):
+        note = self._note()
+        real_client.note_store.getNote.return_value = note
+        real_client.note_store.updateNote.return_value = note
 
-        result = client.set_reminder("note-guid", 1704067200000)
+        result = real_client.set_reminder("note-guid", 1704067200000)
 
-        assert mock_note.attributes is not None
+        assert result is note
+        assert note.attributes.reminderTime == 1704067200000
+        assert note.attributes.reminderOrder is not None
+        assert real_client.note_store.getNote.call_args == _get_note_call("note-guid")
+        real_client.note_store.updateNote.assert_called_once_with(note)
 
-    def test_set_reminder_with_order(self, client):
-        mock_note = MagicMock()
-        mock_note.attributes = MagicMock()
-        mock_note.attributes.reminderOrder = None
-        client.note_store.getNote.return_value = mock_note
-        client.note_store.updateNote.return_value = mock_note
+    def test_set_reminder_with_order(self, real_client):
+        note = self._note(NoteAttributes())
+        real_client.note_store.getNote.return_value = note
 
-        def set_reminder_impl(note_guid, reminder_time=None, reminder_order=None):
-            note = client.note_store.getNote(
-                note_guid, withContent=False, withResourcesData=False,
-                withResourcesRecognition=False, withResourcesAlternateData=False
-            )
-            note.attributes.reminderTime = reminder_time
-            note.attributes.reminderOrder = reminder_order
-            return client.note_store.updateNote(note)
+        real_client.set_reminder("note-guid", 1704067200000, 100)
 
-        client.set_reminder = set_reminder_impl
+        assert note.attributes.reminderTime == 1704067200000
+        assert note.attributes.reminderOrder == 100
 
-        result = client.set_reminder("note-guid", 1704067200000, 100)
+    def test_complete_reminder(self, real_client):
+        note = self._note(NoteAttributes(reminderTime=1704067200000))
+        real_client.note_store.getNote.return_value = note
 
-        assert mock_note.attributes.reminderTime == 1704067200000
-        assert mock_note.attributes.reminderOrder == 100
+        real_client.complete_reminder("note-guid", 1704153600000)
 
-    def test_complete_reminder(self, client):
-        mock_note = MagicMock()
-        mock_note.attributes = MagicMock()
-        client.note_store.getNote.return_value = mock_note
-        client.note_store.updateNote.return_value = mock_note
+        assert note.attributes.reminderDoneTime == 1704153600000
+        real_client.note_store.updateNote.assert_called_once_with(note)
 
-        def complete_reminder_impl(note_guid, done_time=None):
-            note = client.note_store.getNote(
-                note_guid, withContent=False, withResourcesData=False,
-                withResourcesRecognition=False, withResourcesAlternateData=False
-            )
-            note.attributes.reminderDoneTime = done_time
-            return client.note_store.updateNote(note)
+    def test_complete_reminder_auto_time(self, real_client):
+        note = self._note()
+        real_client.note_store.getNote.return_value = note
 
-        client.complete_reminder = complete_reminder_impl
+        real_client.complete_reminder("note-guid")
 
-        result = client.complete_reminder("note-guid", 1704153600000)
+        assert note.attributes.reminderDoneTime is not None
 
-        assert mock_note.attributes.reminderDoneTime == 1704153600000
+    def test_clear_reminder(self, real_client):
+        note = self._note(NoteAttributes(
+            reminderTime=1704067200000,
+            reminderOrder=100,
+            reminderDoneTime=1704153600000,
+        ))
+        real_client.note_store.getNote.return_value = note
 
-    def test_complete_reminder_auto_time(self, client):
-        mock_note = MagicMock()
-        mock_note.attributes = MagicMock()
-        client.note_store.getNote.return_value = mock_note
-        client.note_store.updateNote.return_value = mock_note
-        import time
+        real_client.clear_reminder("note-guid")
 
-        def complete_reminder_impl(note_guid, done_time=None):
-            note = client.note_store.getNote(
-                note_guid, withContent=False, withResourcesData=False,
-                withResourcesRecognition=False, withResourcesAlternateData=False
-            )
-            note.attributes.reminderDoneTime = done_time or int(time.time() * 1000)
-            return client.note_store.updateNote(note)
+        assert note.attributes.reminderTime is None
+        assert note.attributes.reminderDoneTime is None
+        assert note.attributes.reminderOrder is None
+        real_client.note_store.updateNote.assert_called_once_with(note)
 
-        client.complete_reminder = complete_reminder_impl
+    def test_find_reminders_with_completed(self, real_client):
+        mock_result = SimpleNamespace(notes=[])
+        real_client.note_store.findNotesMetadata.return_value = mock_result
 
-        result = client.complete_reminder("note-guid")
+        real_client.find_reminders(include_completed=True)
 
-        assert mock_note.attributes.reminderDoneTime is not None
+        call_kwargs = real_client.note_store.findNotesMetadata.call_args.kwargs
+        assert call_kwargs["filter"].words == "reminderTime:*"
 
-    def test_clear_reminder(self, client):
-        mock_note = MagicMock()
-        mock_note.attributes = MagicMock()
-        mock_note.attributes.reminderTime = 1704067200000
-        mock_note.attributes.reminderOrder = 100
-        mock_note.attributes.reminderDoneTime = 1704153600000
-        client.note_store.getNote.return_value = mock_note
-        client.note_store.updateNote.return_value = mock_note
+    def test_find_reminders_without_completed(self, real_client):
+        mock_result = SimpleNamespace(notes=[])
+        real_client.note_store.findNotesMetadata.return_value = mock_result
 
-        def clear_reminder_impl(note_guid):
-            note = client.note_store.getNote(
-                note_guid, withContent=False, withResourcesData=False,
-                withResourcesRecognition=False, withResourcesAlternateData=False
-            )
-            note.attributes.reminderTime = None
-            note.attributes.reminderDoneTime = None
-            note.attributes.reminderOrder = None
-            return client.note_store.updateNote(note)
-
-        client.clear_reminder = clear_reminder_impl
-
-        result = client.clear_reminder("note-guid")
-
-        assert mock_note.attributes.reminderTime is None
-        assert mock_note.attributes.reminderDoneTime is None
-        assert mock_note.attributes.reminderOrder is None
-
-    def test_find_reminders_with_completed(self, client):
-        mock_result = MagicMock()
-        mock_result.notes = []
-        client.note_store.findNotesMetadata.return_value = mock_result
-
-        def find_reminders_impl(nb_guid=None, limit=100, include_completed=False):
-            note_filter = MagicMock()
-            note_filter.words = "reminderTime:*" if include_completed else "reminderTime:* -reminderDoneTime:*"
-            note_filter.notebookGuid = nb_guid
-
-            result_spec = MagicMock()
-            result_spec.includeTitle = True
-            result_spec.includeUpdated = True
-            result_spec.includeNotebookGuid = True
-            result_spec.includeAttributes = True
-
-            return client.note_store.findNotesMetadata(
-                filter=note_filter,
-                offset=0,
-                maxNotes=limit,
-                resultSpec=result_spec,
-            )
+        real_client.find_reminders(include_completed=False)
 
-        client.find_reminders = find_reminders_impl
+        call_kwargs = real_client.note_store.findNotesMetadata.call_args.kwargs
+        assert "reminderTime:*" in call_kwargs["filter"].words
+        assert "-reminderDoneTime:*" in call_kwargs["filter"].words
 
-        result = client.find_reminders(include_completed=True)
 
-        call_kwargs = client.note_store.findNotesMetadata.call_args.kwargs
-        assert "reminderTime:*" in call_kwargs["filter"].words
+class TestReminderUpdates:
+    """Test that reminder mutations skip no-op updates."""
 
-    def test_find_reminders_without_completed(self, client):
-        mock_result = MagicMock()
-        mock_result.notes = []
-        client.note_store.findNotesMetadata.return_value = mock_result
-
-        def find_reminders_impl(nb_guid=None, limit=100, include_completed=False):
-            note_filter = MagicMock()
-            note_filter.words = "reminderTime:*" if include_completed else "reminderTime:* -reminderDoneTime:*"
-            note_filter.notebookGuid = nb_guid
-
-            result_spec = MagicMock()
-            result_spec.includeTitle = True
-            result_spec.includeUpdated = True
-            result_spec.includeNotebookGuid = True
-            result_spec.includeAttributes = True
-
-            return client.note_store.findNotesMetadata(
-                filter=note_filter,
-                offset=0,
-                maxNotes=limit,
-                resultSpec=result_spec,
-            )
+    def _note(self, **attrs):
+        return Note(guid="g1", title="T", attributes=NoteAttributes(**attrs))
 
-        client.find_reminders = find_reminders_impl
+    def test_clear_reminder_without_reminder_skips_update(self, real_client):
+        real_client.note_store.getNote.return_value = self._note()
 
-        result = client.find_reminders(include_completed=False)
+        note = real_client.clear_reminder("g1")
 
-        call_kwargs = client.note_store.findNotesMetadata.call_args.kwargs
-        assert "reminderTime:*" in call_kwargs["filter"].words
-        assert "-reminderDoneTime:*" in call_kwargs["filter"].words
+        assert note.guid == "g1"
+        real_client.note_store.updateNote.assert_not_called()
+
+    def test_clear_reminder_sends_update(self, real_client):
+        real_client.note_store.getNote.return_value = self._note(reminderTime=1, reminderOrder=2)
+
+        real_client.clear_reminder("g1")
+
+        sent = real_client.note_store.updateNote.call_args[0][0]
+        assert (sent.attributes.reminderTime, sent.attributes.reminderOrder) == (None, None)
+
+    def test_set_reminder_unchanged_skips_update(self, real_client):
+        real_client.note_store.getNote.return_value = self._note(reminderTime=5, reminderOrder=7)
+
+        real_client.set_reminder("g1", 5)
+
+        real_client.note_store.updateNote.assert_not_called()
+
+    def test_set_reminder_changed_sends_update(self, real_client):
+        real_client.note_store.getNote.return_value = self._note(reminderTime=5, reminderOrder=7)
+
+        real_client.set_reminder("g1", 6)
+
+        sent = real_client.note_store.updateNote.call_args[0][0]
+        assert (sent.attributes.reminderTime, sent.attributes.reminderOrder) == (6, 7)
 
 
 if __name__ == "__main__":
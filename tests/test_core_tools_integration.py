@@ -14,13 +14,14 @@ class TestCoreToolsIntegration:
     @pytest.fixture
     def mock_client(self):
         mock = MagicMock()
-        mock_notebook_obj = MagicMock()
-        mock_notebook_obj.guid = "test-notebook-guid"
+        mock_notebook_obj = MagicMock(
+            guid="test-notebook-guid",
+            stack="Test Stack",
+            serviceCreated=1704067200000,
+            serviceUpdated=1704067200000,
+            defaultNotebook=False,
+        )
         mock_notebook_obj.name = "Test Notebook"
-        mock_notebook_obj.stack = "Test Stack"
-        mock_notebook_obj.serviceCreated = 1704067200000
-        mock_notebook_obj.serviceUpdated = 1704067200000
-        mock_notebook_obj.defaultNotebook = False
 
         mock.create_notebook.return_value = mock_notebook_obj
         mock.get_notebook.return_value = mock_notebook_obj
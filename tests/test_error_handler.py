@@ -1,5 +1,7 @@
 """Unit tests for Evernote error handling utilities."""
 
+import json
+
 import pytest
 
 from evernote.edam.error.ttypes import (
@@ -9,7 +11,7 @@ from evernote.edam.error.ttypes import (
     EDAMUserException,
 )
 
-from evernote_mcp.util.error_handler import handle_evernote_error
+from evernote_mcp.util.error_handler import error_json, handle_evernote_error
 
 
 class TestHandleEvernoteError:
@@ -256,6 +258,55 @@ class TestHandleEvernoteError:
 
         assert data["error"] == "Note not found"
 
+    @pytest.mark.parametrize("message, secret", [
+        ("Rejected s=lower:case:token", "lower:case"),
+        ("Header had Bearer Token=abc123", "abc123"),
+        ("Config API_KEY:xyz789 invalid", "xyz789"),
+    ])
+    def test_redacts_mixed_case_markers(self, message, secret):
+        """Test that the fast path does not skip case-insensitive matches."""
+        data = handle_evernote_error(Exception(message))
+
+        assert secret not in data["error"]
+        assert "[REDACTED]" in data["error"]
+
+    @pytest.mark.parametrize("message, expected", [
+        # Same output as the original multi-pass redaction
+        ("auth token: S=abc", "auth [REDACTED]"),
+        ("Failed with token:S=123:ABC123XYZ", "Failed with [REDACTED]"),
+        ("Invalid credentials with password:secret123",
+         "Invalid credentials with password: [REDACTED]"),
+        ("Invalid authentication token", "Invalid authentication token"),
+        # The original left the value after '=' / ': ' and mangled "secrets"
+        ("password=hunter2", "password: [REDACTED]"),
+        ("api_key: k1", "api_key: [REDACTED]"),
+        ("no secrets here", "no secrets here"),
+    ])
+    def test_redaction_output(self, message, expected):
+        """Test the exact redacted message for keys, separators and values."""
+        assert handle_evernote_error(Exception(message))["error"] == expected
+
+
+class TestErrorJson:
+    """Test error_json function."""
+
+    @pytest.mark.parametrize("exc", [
+        EDAMUserException(errorCode=EDAMErrorCode.PERMISSION_DENIED),
+        EDAMUserException(),
+        EDAMSystemException(errorCode=EDAMErrorCode.RATE_LIMIT_REACHED, message="slow down"),
+        EDAMNotFoundException(identifier="Note.guid"),
+        ValueError('bad "value" \u65e5\u672c auth token: S=s1:U=abc:E=123'),
+    ])
+    def test_matches_handle_evernote_error(self, exc):
+        """Test error_json encodes the same response as handle_evernote_error."""
+        assert json.loads(error_json(exc)) == handle_evernote_error(exc)
+
+    def test_is_compact_and_keeps_non_ascii(self):
+        """Test output uses compact separators and raw non-ASCII characters."""
+        result = error_json(ValueError("\u65e5\u672c"))
+
+        assert result == '{"success":false,"error":"\u65e5\u672c"}'
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,5 +1,6 @@
 """Integration tests for advanced note tools."""
 
+import asyncio
 import json
 from unittest.mock import MagicMock
 
@@ -55,7 +56,7 @@ class TestNoteAdvancedTools:
         get_content_tool = tools.get("get_note_content")
 
         if get_content_tool:
-            result = get_content_tool.fn(guid="note-guid")
+            result = asyncio.run(get_content_tool.fn(guid="note-guid"))
             data = json.loads(result)
             assert data["success"] is True
             assert data["guid"] == "note-guid"
@@ -68,7 +69,7 @@ class TestNoteAdvancedTools:
         get_search_text_tool = tools.get("get_note_search_text")
 
         if get_search_text_tool:
-            result = get_search_text_tool.fn(guid="note-guid")
+            result = asyncio.run(get_search_text_tool.fn(guid="note-guid"))
             data = json.loads(result)
             assert data["success"] is True
             assert data["guid"] == "note-guid"
@@ -83,7 +84,7 @@ class TestNoteAdvancedTools:
         get_search_text_tool = tools.get("get_note_search_text")
 
         if get_search_text_tool:
-            result = get_search_text_tool.fn(guid="note-guid", note_only=True)
+            result = asyncio.run(get_search_text_tool.fn(guid="note-guid", note_only=True))
             data = json.loads(result)
             assert data["success"] is True
             assert data["note_only"] is True
@@ -99,10 +100,10 @@ class TestNoteAdvancedTools:
         get_search_text_tool = tools.get("get_note_search_text")
 
         if get_search_text_tool:
-            result = get_search_text_tool.fn(
+            result = asyncio.run(get_search_text_tool.fn(
                 guid="note-guid",
                 tokenize_for_indexing=True
-            )
+            ))
             data = json.loads(result)
             assert data["success"] is True
             assert data["tokenized"] is True
@@ -118,11 +119,11 @@ class TestNoteAdvancedTools:
         get_search_text_tool = tools.get("get_note_search_text")
 
         if get_search_text_tool:
-            result = get_search_text_tool.fn(
+            result = asyncio.run(get_search_text_tool.fn(
                 guid="note-guid",
                 note_only=True,
                 tokenize_for_indexing=True
-            )
+            ))
             data = json.loads(result)
             assert data["success"] is True
             assert data["note_only"] is True
@@ -139,7 +140,7 @@ class TestNoteAdvancedTools:
         get_tags_tool = tools.get("get_note_tag_names")
 
         if get_tags_tool:
-            result = get_tags_tool.fn(guid="note-guid")
+            result = asyncio.run(get_tags_tool.fn(guid="note-guid"))
             data = json.loads(result)
             assert data["success"] is True
             assert data["guid"] == "note-guid"
@@ -154,7 +155,7 @@ class TestNoteAdvancedTools:
         get_tags_tool = tools.get("get_note_tag_names")
 
         if get_tags_tool:
-            result = get_tags_tool.fn(guid="note-guid")
+            result = asyncio.run(get_tags_tool.fn(guid="note-guid"))
             data = json.loads(result)
             assert data["success"] is True
             assert data["tag_names"] == []
@@ -166,7 +167,7 @@ class TestNoteAdvancedTools:
         list_versions_tool = tools.get("list_note_versions")
 
         if list_versions_tool:
-            result = list_versions_tool.fn(note_guid="note-guid")
+            result = asyncio.run(list_versions_tool.fn(note_guid="note-guid"))
             data = json.loads(result)
             assert data["success"] is True
             assert data["note_guid"] == "note-guid"
@@ -189,7 +190,7 @@ class TestNoteAdvancedTools:
         list_versions_tool = tools.get("list_note_versions")
 
         if list_versions_tool:
-            result = list_versions_tool.fn(note_guid="note-guid")
+            result = asyncio.run(list_versions_tool.fn(note_guid="note-guid"))
             data = json.loads(result)
             assert data["success"] is True
             assert data["count"] == 3
@@ -204,7 +205,7 @@ class TestNoteAdvancedTools:
         list_versions_tool = tools.get("list_note_versions")
 
         if list_versions_tool:
-            result = list_versions_tool.fn(note_guid="note-guid")
+            result = asyncio.run(list_versions_tool.fn(note_guid="note-guid"))
             data = json.loads(result)
             assert data["success"] is True
             assert data["count"] == 0
@@ -217,10 +218,10 @@ class TestNoteAdvancedTools:
         get_version_tool = tools.get("get_note_version")
 
         if get_version_tool:
-            result = get_version_tool.fn(
+            result = asyncio.run(get_version_tool.fn(
                 note_guid="note-guid",
                 update_sequence_num=1
-            )
+            ))
             data = json.loads(result)
             assert data["success"] is True
             assert data["guid"] == "note-guid"
@@ -234,13 +235,13 @@ class TestNoteAdvancedTools:
         get_version_tool = tools.get("get_note_version")
 
         if get_version_tool:
-            result = get_version_tool.fn(
+            result = asyncio.run(get_version_tool.fn(
                 note_guid="note-guid",
                 update_sequence_num=1,
                 with_resources_data=True,
                 with_resources_recognition=True,
                 with_resources_alternate_data=True,
-            )
+            ))
             data = json.loads(result)
             assert data["success"] is True
 
@@ -262,10 +263,10 @@ class TestNoteAdvancedTools:
         get_version_tool = tools.get("get_note_version")
 
         if get_version_tool:
-            result = get_version_tool.fn(
+            result = asyncio.run(get_version_tool.fn(
                 note_guid="note-guid",
                 update_sequence_num=1
-            )
+            ))
             data = json.loads(result)
             assert data["success"] is True
             assert data["content"] is not None
@@ -291,7 +292,7 @@ class TestNoteAdvancedToolsErrorHandling:
         get_content_tool = tools.get("get_note_content")
 
         if get_content_tool:
-            result = get_content_tool.fn(guid="invalid-guid")
+            result = asyncio.run(get_content_tool.fn(guid="invalid-guid"))
             data = json.loads(result)
             assert data["success"] is False
             assert "error" in data
@@ -305,7 +306,7 @@ class TestNoteAdvancedToolsErrorHandling:
         get_search_text_tool = tools.get("get_note_search_text")
 
         if get_search_text_tool:
-            result = get_search_text_tool.fn(guid="note-guid")
+            result = asyncio.run(get_search_text_tool.fn(guid="note-guid"))
             data = json.loads(result)
             assert data["success"] is False
             assert "error" in data
@@ -319,7 +320,7 @@ class TestNoteAdvancedToolsErrorHandling:
         list_versions_tool = tools.get("list_note_versions")
 
         if list_versions_tool:
-            result = list_versions_tool.fn(note_guid="note-guid")
+            result = asyncio.run(list_versions_tool.fn(note_guid="note-guid"))
             data = json.loads(result)
             assert data["success"] is False
             assert "error" in data
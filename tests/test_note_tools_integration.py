@@ -16,25 +16,27 @@ class TestNotebookToolsIntegration:
         mock = MagicMock()
         # Create a notebook that can be configured per test
         def create_notebook_with_stack(name, stack=None):
-            mock_nb = MagicMock()
-            mock_nb.guid = "test-notebook-guid"
+            mock_nb = MagicMock(
+                guid="test-notebook-guid",
+                stack=stack,
+                serviceCreated=1704067200000,
+                serviceUpdated=1704067200000,
+                defaultNotebook=False,
+            )
             mock_nb.name = name
-            mock_nb.stack = stack
-            mock_nb.serviceCreated = 1704067200000
-            mock_nb.serviceUpdated = 1704067200000
-            mock_nb.defaultNotebook = False
             return mock_nb
 
         mock.create_notebook.side_effect = create_notebook_with_stack
 
         # For get_notebook, return a default notebook
-        mock_nb_default = MagicMock()
-        mock_nb_default.guid = "test-notebook-guid"
+        mock_nb_default = MagicMock(
+            guid="test-notebook-guid",
+            stack=None,
+            serviceCreated=1704067200000,
+            serviceUpdated=1704067200000,
+            defaultNotebook=False,
+        )
         mock_nb_default.name = "Test Notebook"
-        mock_nb_default.stack = None
-        mock_nb_default.serviceCreated = 1704067200000
-        mock_nb_default.serviceUpdated = 1704067200000
-        mock_nb_default.defaultNotebook = False
 
         mock.get_notebook.return_value = mock_nb_default
         mock.update_notebook.return_value = 1
@@ -153,6 +155,18 @@ class TestNotebookToolsIntegration:
             assert data["success"] is True
             assert data["stack"] is None
 
+    def test_failed_update_leaves_fetched_notebook_unchanged(self, mock_client, mcp):
+        from evernote.edam.type.ttypes import Notebook
+
+        notebook = Notebook(guid="test-guid", name="Cached", stack="Old Stack")
+        mock_client.get_notebook.return_value = notebook
+        mock_client.update_notebook.side_effect = Exception("rejected")
+        register_notebook_tools(mcp, mock_client)
+
+        mcp._tool_manager._tools["update_notebook"].fn(guid="test-guid", name="New", stack="")
+
+        assert (notebook.name, notebook.stack) == ("Cached", "Old Stack")
+
     def test_delete_notebook(self, mock_client, mcp):
         register_notebook_tools(mcp, mock_client)
 
@@ -10,6 +10,7 @@ Run tests:
     EVERNOTE_AUTH_TOKEN=xxx EVERNOTE_BACKEND=china uv run pytest tests/test_real_api.py -v
 """
 
+import asyncio
 import json
 import os
 import time
@@ -288,6 +289,7 @@ class TestNoteTools:
         result = delete_tool.fn(guid=note_guid)
         data = json.loads(result)
         assert data["success"] is True
+        assert data["update_sequence_num"] > 0
 
         # Permanently delete
         real_client.expunge_note(note_guid)
@@ -598,7 +600,7 @@ class TestNoteAdvancedTools:
         tools = mcp_server._tool_manager._tools
         get_content_tool = tools.get("get_note_content")
 
-        result = get_content_tool.fn(guid=note.guid)
+        result = asyncio.run(get_content_tool.fn(guid=note.guid))
         data = json.loads(result)
         assert data["success"] is True
         assert "content" in data
@@ -622,7 +624,7 @@ class TestNoteAdvancedTools:
         tools = mcp_server._tool_manager._tools
         get_text_tool = tools.get("get_note_search_text")
 
-        result = get_text_tool.fn(guid=note.guid, note_only=True)
+        result = asyncio.run(get_text_tool.fn(guid=note.guid, note_only=True))
         data = json.loads(result)
         assert data["success"] is True
         assert "text" in data
@@ -649,7 +651,7 @@ class TestNoteAdvancedTools:
         tools = mcp_server._tool_manager._tools
         get_tag_names_tool = tools.get("get_note_tag_names")
 
-        result = get_tag_names_tool.fn(guid=note.guid)
+        result = asyncio.run(get_tag_names_tool.fn(guid=note.guid))
         data = json.loads(result)
         assert data["success"] is True
         assert "tag_names" in data
@@ -674,7 +676,7 @@ class TestNoteAdvancedTools:
         tools = mcp_server._tool_manager._tools
         list_versions_tool = tools.get("list_note_versions")
 
-        result = list_versions_tool.fn(note_guid=note.guid)
+        result = asyncio.run(list_versions_tool.fn(note_guid=note.guid))
         data = json.loads(result)
         assert data["success"] is True
         # Note: Free accounts may not have version history
@@ -770,10 +772,10 @@ class TestReminderTools:
         import time
         tomorrow = int((time.time() + 86400) * 1000)
 
-        result = set_reminder_tool.fn(
+        result = asyncio.run(set_reminder_tool.fn(
             note_guid=note.guid,
             reminder_time=tomorrow
-        )
+        ))
         data = json.loads(result)
         assert data["success"] is True
 
@@ -801,7 +803,7 @@ class TestReminderTools:
         tools = mcp_server._tool_manager._tools
         complete_tool = tools.get("complete_reminder")
 
-        result = complete_tool.fn(note_guid=note.guid)
+        result = asyncio.run(complete_tool.fn(note_guid=note.guid))
         data = json.loads(result)
         assert data["success"] is True
 
@@ -829,7 +831,7 @@ class TestReminderTools:
         tools = mcp_server._tool_manager._tools
         clear_tool = tools.get("clear_reminder")
 
-        result = clear_tool.fn(note_guid=note.guid)
+        result = asyncio.run(clear_tool.fn(note_guid=note.guid))
         data = json.loads(result)
         assert data["success"] is True
 
@@ -844,7 +846,7 @@ class TestReminderTools:
         tools = mcp_server._tool_manager._tools
         list_tool = tools.get("list_reminders")
 
-        result = list_tool.fn(limit=10, include_completed=False)
+        result = asyncio.run(list_tool.fn(limit=10, include_completed=False))
         data = json.loads(result)
         assert data["success"] is True
         print(f"Active reminders: {data['count']}")
@@ -868,7 +870,7 @@ class TestReminderTools:
         tools = mcp_server._tool_manager._tools
         get_reminder_tool = tools.get("get_reminder")
 
-        result = get_reminder_tool.fn(note_guid=note.guid)
+        result = asyncio.run(get_reminder_tool.fn(note_guid=note.guid))
         data = json.loads(result)
         assert data["success"] is True
         assert data["has_reminder"] is True
@@ -1,5 +1,6 @@
 """Unit tests for reminder functionality."""
 
+import asyncio
 import json
 from unittest.mock import MagicMock, patch
 
@@ -123,8 +124,7 @@ class TestReminderClientMethods:
             ) as mock_store:
                 client = EvernoteMCPClient()
 
-                mock_result = MagicMock()
-                mock_result.notes = []
+                mock_result = MagicMock(notes=[])
                 mock_store.findNotesMetadata.return_value = mock_result
 
                 client.find_reminders(include_completed=True)
@@ -140,8 +140,7 @@ class TestReminderClientMethods:
             ) as mock_store:
                 client = EvernoteMCPClient()
 
-                mock_result = MagicMock()
-                mock_result.notes = []
+                mock_result = MagicMock(notes=[])
                 mock_store.findNotesMetadata.return_value = mock_result
 
                 client.find_reminders(include_completed=False)
@@ -173,9 +172,9 @@ class TestReminderTools:
         set_reminder_tool = tools.get("set_reminder")
 
         if set_reminder_tool:
-            result = set_reminder_tool.fn(
+            result = asyncio.run(set_reminder_tool.fn(
                 note_guid="test-guid", reminder_time=1704067200000, reminder_order=100
-            )
+            ))
             data = json.loads(result)
             assert data["success"] is True
             assert data["note_guid"] == "test-guid"
@@ -194,7 +193,7 @@ class TestReminderTools:
         complete_tool = tools.get("complete_reminder")
 
         if complete_tool:
-            result = complete_tool.fn(note_guid="test-guid", done_time=1704153600000)
+            result = asyncio.run(complete_tool.fn(note_guid="test-guid", done_time=1704153600000))
             data = json.loads(result)
             assert data["success"] is True
             assert data["reminder_done_time"] == 1704153600000
@@ -209,7 +208,7 @@ class TestReminderTools:
         clear_tool = tools.get("clear_reminder")
 
         if clear_tool:
-            result = clear_tool.fn(note_guid="test-guid")
+            result = asyncio.run(clear_tool.fn(note_guid="test-guid"))
             data = json.loads(result)
             assert data["success"] is True
             assert data["message"] == "Reminder cleared"
@@ -217,15 +216,15 @@ class TestReminderTools:
     def test_list_reminders_tool(self, mock_client, mcp):
         register_reminder_tools(mcp, mock_client)
 
-        mock_result = MagicMock()
-        mock_result.totalNotes = 2
+        mock_result = MagicMock(totalNotes=2)
 
-        mock_note1 = MagicMock()
-        mock_note1.guid = "note-1"
-        mock_note1.title = "Reminder 1"
-        mock_note1.notebookGuid = "nb-1"
-        mock_note1.updated = 1704067200000
-        mock_note1.attributes = MagicMock()
+        mock_note1 = MagicMock(
+            guid="note-1",
+            title="Reminder 1",
+            notebookGuid="nb-1",
+            updated=1704067200000,
+            attributes=MagicMock(),
+        )
         mock_note1.attributes.reminderTime = 1704067200000
         mock_note1.attributes.reminderOrder = 100
         mock_note1.attributes.reminderDoneTime = None
@@ -237,12 +236,37 @@ class TestReminderTools:
         list_tool = tools.get("list_reminders")
 
         if list_tool:
-            result = list_tool.fn(limit=10, include_completed=False)
+            result = asyncio.run(list_tool.fn(limit=10, include_completed=False))
             data = json.loads(result)
             assert data["success"] is True
             assert data["count"] == 1
             assert len(data["reminders"]) == 1
 
+    def test_list_reminders_tool_with_thrift_types(self, mock_client, mcp):
+        from evernote.edam.notestore.ttypes import NoteMetadata, NotesMetadataList
+        from evernote.edam.type.ttypes import NoteAttributes
+
+        register_reminder_tools(mcp, mock_client)
+        mock_client.find_reminders.return_value = NotesMetadataList(
+            totalNotes=2,
+            notes=[
+                NoteMetadata(
+                    guid="n1", title="Call", notebookGuid="nb", updated=1,
+                    attributes=NoteAttributes(reminderTime=5, reminderOrder=7),
+                ),
+                NoteMetadata(guid="n2", title="Plain", notebookGuid="nb", updated=2),
+            ],
+        )
+
+        data = json.loads(asyncio.run(mcp._tool_manager._tools["list_reminders"].fn()))
+
+        assert data["total"] == 2
+        assert data["reminders"][0] == {
+            "guid": "n1", "title": "Call", "notebook_guid": "nb", "updated": 1,
+            "reminder_time": 5, "reminder_order": 7, "reminder_done_time": None,
+        }
+        assert "reminder_time" not in data["reminders"][1]
+
     def test_get_reminder_tool(self, mock_client, mcp):
         register_reminder_tools(mcp, mock_client)
 
@@ -256,7 +280,7 @@ class TestReminderTools:
         get_tool = tools.get("get_reminder")
 
         if get_tool:
-            result = get_tool.fn(note_guid="test-guid")
+            result = asyncio.run(get_tool.fn(note_guid="test-guid"))
             data = json.loads(result)
             assert data["success"] is True
             assert data["has_reminder"] is True
@@ -273,7 +297,7 @@ class TestReminderTools:
         get_tool = tools.get("get_reminder")
 
         if get_tool:
-            result = get_tool.fn(note_guid="test-guid")
+            result = asyncio.run(get_tool.fn(note_guid="test-guid"))
             data = json.loads(result)
             assert data["success"] is True
             assert data["has_reminder"] is False
@@ -2,6 +2,8 @@
 
 import json
 import binascii
+import hashlib
+import logging
 from unittest.mock import MagicMock
 
 import pytest
@@ -96,6 +98,43 @@ class TestResourceTools:
             assert data["attributes"]["file_name"] == "photo.png"
             assert data["attributes"]["camera_make"] == "Canon"
 
+    def test_get_resource_sizes_only(self, mock_client, mcp):
+        from evernote.edam.type.ttypes import Data
+
+        resource = MockResource()
+        resource.data = Data(size=4096, bodyHash=b"\x01\x02")
+        resource.recognition = Data(size=512)
+        mock_client.get_resource.return_value = resource
+        register_resource_tools(mcp, mock_client)
+
+        result = mcp._tool_manager._tools["get_resource"].fn(
+            guid="res-guid", with_data=True, sizes_only=True
+        )
+        data = json.loads(result)
+
+        assert data["data_size"] == 4096
+        assert data["data_hash"] == "0102"
+        assert data["recognition_size"] == 512
+        assert data["alternate_data_size"] is None
+        kwargs = mock_client.get_resource.call_args.kwargs
+        assert not (kwargs["with_data"] or kwargs["with_recognition"]
+                    or kwargs["with_alternate_data"])
+
+    def test_get_resource_attributes_thrift_struct(self, mock_client, mcp):
+        from evernote.edam.type.ttypes import ResourceAttributes
+
+        mock_client.get_resource_attributes.return_value = ResourceAttributes(
+            fileName="scan.pdf", recoType="unknown"
+        )
+        register_resource_tools(mcp, mock_client)
+
+        result = mcp._tool_manager._tools["get_resource_attributes"].fn(guid="res-guid")
+        data = json.loads(result)
+
+        assert data["file_name"] == "scan.pdf"
+        assert data["reco_type"] == "unknown"
+        assert data["source_url"] is None
+
     def test_get_resource_with_data(self, mock_client, mcp):
         register_resource_tools(mcp, mock_client)
 
@@ -141,6 +180,43 @@ class TestResourceTools:
             assert data["success"] is True
             assert data["alternate_data_size"] is not None
 
+    def test_get_resources_batch(self, mock_client, mcp):
+        mock_client.get_resources.return_value = [
+            {"guid": "res-1", "resource": MockResource("res-1"), "error": None},
+            {"guid": "res-2", "resource": None, "error": Exception("Resource not found")},
+        ]
+        register_resource_tools(mcp, mock_client)
+
+        batch_tool = mcp._tool_manager._tools["get_resources_batch"]
+        data = json.loads(batch_tool.fn(guids=["res-1", "res-2"]))
+
+        assert data["success"] is True
+        assert data["count"] == 2
+        assert data["failed"] == 1
+        first, second = data["resources"]
+        assert first["success"] is True
+        assert first["guid"] == "res-1"
+        assert first["data_size"] == len(b"fake image data")
+        assert first["attributes"]["file_name"] == "photo.png"
+        assert second == {"guid": "res-2", "success": False, "error": "Resource not found"}
+        mock_client.get_resources.assert_called_once_with(["res-1", "res-2"], with_attributes=True)
+
+    def test_get_resources_batch_logs_failures_once(self, mock_client, mcp, caplog):
+        mock_client.get_resources.return_value = [
+            {"guid": f"res-{i}", "resource": None, "error": Exception("Resource not found")}
+            for i in range(3)
+        ]
+        register_resource_tools(mcp, mock_client)
+
+        batch_tool = mcp._tool_manager._tools["get_resources_batch"]
+        with caplog.at_level(logging.INFO):
+            data = json.loads(batch_tool.fn(guids=["res-0", "res-1", "res-2"]))
+
+        assert data["failed"] == 3
+        assert [(r.levelno, r.getMessage()) for r in caplog.records] == [
+            (logging.WARNING, "Retrieved 0 resource(s), 3 failed"),
+        ]
+
     def test_get_resource_data(self, mock_client, mcp):
         register_resource_tools(mcp, mock_client)
 
@@ -154,7 +230,7 @@ class TestResourceTools:
             assert data["guid"] == "res-guid"
             assert data["size"] == len(b"binary data")
             assert "data" in data
-            assert "hash_hex" in data
+            assert data["hash_hex"] == hashlib.md5(b"binary data").hexdigest()
 
     def test_get_resource_data_not_encoded(self, mock_client, mcp):
         register_resource_tools(mcp, mock_client)
@@ -167,6 +243,7 @@ class TestResourceTools:
             data = json.loads(result)
             assert data["success"] is True
             assert data["data"] is None
+            assert data["b64_size"] == 16  # len(b"binary data") == 11
             assert "data_raw_preview" in data
             assert "note" in data
 
@@ -284,6 +361,46 @@ class TestResourceTools:
             data = json.loads(result)
             assert data["success"] is True
 
+    def test_update_resource_mime_only_keeps_attributes(self, mock_client, mcp):
+        resource = MockResource()
+        mock_client.get_resource.return_value = resource
+        register_resource_tools(mcp, mock_client)
+
+        mcp._tool_manager._tools["update_resource"].fn(guid="res-guid", mime="image/jpeg")
+
+        sent = mock_client.update_resource.call_args[0][0]
+        assert sent is resource
+        assert sent.mime == "image/jpeg"
+        assert sent.attributes.fileName == "photo.png"
+
+    def test_update_resource_requires_a_change(self, mock_client, mcp):
+        register_resource_tools(mcp, mock_client)
+
+        result = mcp._tool_manager._tools["update_resource"].fn(guid="res-guid")
+
+        data = json.loads(result)
+        assert data["success"] is False
+        assert "mime or attributes" in data["error"]
+        mock_client.update_resource.assert_not_called()
+
+    def test_update_resource_ignores_non_field_keys(self, mock_client, mcp):
+        from evernote.edam.type.ttypes import ResourceAttributes
+
+        resource = MockResource()
+        resource.attributes = ResourceAttributes()
+        mock_client.get_resource.return_value = resource
+        register_resource_tools(mcp, mock_client)
+
+        attrs = json.dumps({"fileName": "new.png", "validate": 1, "bogus": 2})
+        result = mcp._tool_manager._tools["update_resource"].fn(
+            guid="res-guid", attributes=attrs
+        )
+
+        assert json.loads(result)["success"] is True
+        assert resource.attributes.fileName == "new.png"
+        assert callable(resource.attributes.validate)
+        assert not hasattr(resource.attributes, "bogus")
+
     def test_set_resource_application_data_entry(self, mock_client, mcp):
         register_resource_tools(mcp, mock_client)
 
@@ -40,10 +40,8 @@ class TestSearchTools:
         mock_result = MockNotesMetadataResult(notes=[mock_note], total=1)
         mock.find_notes.return_value = mock_result
 
-        mock_tag = MagicMock()
-        mock_tag.guid = "tag-1"
+        mock_tag = MagicMock(guid="tag-1", parentGuid=None)
         mock_tag.name = "test"
-        mock_tag.parentGuid = None
         mock.list_tags.return_value = [mock_tag]
 
         return mock
@@ -162,15 +160,11 @@ class TestSearchTools:
     def test_list_tags_multiple(self, mock_client, mcp):
         register_search_tools(mcp, mock_client)
 
-        tag1 = MagicMock()
-        tag1.guid = "tag-1"
+        tag1 = MagicMock(guid="tag-1", parentGuid=None)
         tag1.name = "important"
-        tag1.parentGuid = None
 
-        tag2 = MagicMock()
-        tag2.guid = "tag-2"
+        tag2 = MagicMock(guid="tag-2", parentGuid="tag-1")
         tag2.name = "work"
-        tag2.parentGuid = "tag-1"
 
         mock_client.list_tags.return_value = [tag1, tag2]
 
@@ -355,6 +355,18 @@ class TestSavedSearchToolsErrorHandling:
             assert data["success"] is False
             assert "error" in data
 
+    def test_failed_update_leaves_fetched_search_unchanged(self, mock_client, mcp):
+        from evernote.edam.type.ttypes import SavedSearch
+
+        search = SavedSearch(guid="search-guid", name="Cached", query="tag:old")
+        mock_client.get_search.return_value = search
+        mock_client.update_search.side_effect = Exception("rejected")
+        register_search_tools_extended(mcp, mock_client)
+
+        mcp._tool_manager._tools["update_search"].fn(guid="search-guid", query="tag:new")
+
+        assert (search.name, search.query) == ("Cached", "tag:old")
+
     def test_expunge_search_handles_error(self, mock_client, mcp):
         mock_client.list_searches.side_effect = None
         mock_client.expunge_search.side_effect = Exception("Delete failed")
@@ -0,0 +1,103 @@
+"""Unit tests for tool response serialization."""
+
+import base64
+import importlib
+import json
+
+import pytest
+
+from evernote_mcp.util import serialization
+from evernote_mcp.util.serialization import FieldPicker, b64_size, b64encode, dumps
+
+
+class TestDumps:
+    """Test compact JSON encoding of tool responses."""
+
+    def test_compact_output(self):
+        assert dumps({"success": True, "items": [1, 2]}) == '{"success":true,"items":[1,2]}'
+
+    def test_keeps_non_ascii(self):
+        assert dumps({"title": "笔记"}) == '{"title":"笔记"}'
+
+    def test_round_trips(self):
+        data = {"guid": "g1", "nested": {"n": None, "f": 1.5}, "list": ["a", "ü"]}
+
+        assert json.loads(dumps(data)) == data
+
+    def test_falls_back_for_wide_ints(self):
+        assert dumps({"n": 2**70}) == '{"n":%d}' % 2**70
+
+    def test_stdlib_encoder_without_orjson(self, monkeypatch):
+        data = {"title": "笔记", "usn": 3, "tags": None}
+        expected = dumps(data)
+        monkeypatch.setattr(serialization, "orjson", None)
+
+        assert dumps(data) == expected
+
+
+class TestPrettyMode:
+    """Test the EVERNOTE_MCP_PRETTY debug switch."""
+
+    @pytest.fixture
+    def pretty(self, monkeypatch):
+        monkeypatch.setenv("EVERNOTE_MCP_PRETTY", "true")
+        importlib.reload(serialization)
+        yield
+        monkeypatch.delenv("EVERNOTE_MCP_PRETTY")
+        importlib.reload(serialization)
+
+    def test_indents_when_enabled(self, pretty):
+        assert serialization.dumps({"a": [1]}) == '{\n  "a": [\n    1\n  ]\n}'
+
+    def test_stdlib_encoder_matches(self, pretty, monkeypatch):
+        data = {"title": "笔记", "items": [{"n": None}]}
+        expected = serialization.dumps(data)
+        monkeypatch.setattr(serialization, "orjson", None)
+
+        assert serialization.dumps(data) == expected
+
+    def test_error_json_indents_when_enabled(self, pretty):
+        from evernote_mcp.util.error_handler import error_json
+
+        assert error_json(ValueError("boom")) == '{\n  "success": false,\n  "error": "boom"\n}'
+
+
+class TestB64Encode:
+    """Test base64 encoding of binary payloads."""
+
+    def test_matches_stdlib(self):
+        data = bytes(range(256)) * 3
+
+        assert b64encode(data) == base64.b64encode(data).decode("ascii")
+
+    def test_empty(self):
+        assert b64encode(b"") == ""
+
+    def test_size_matches_encoded_length(self):
+        for n in range(10):
+            assert b64_size(n) == len(b64encode(b"x" * n))
+
+
+class TestFieldPicker:
+    """Test copying struct fields into dicts."""
+
+    def test_picks_and_renames_fields(self):
+        from evernote.edam.type.ttypes import Note
+
+        pick = FieldPicker(guid="guid", notebook_guid="notebookGuid")
+
+        assert pick(Note(guid="g1", notebookGuid="nb", title="t")) == {
+            "guid": "g1",
+            "notebook_guid": "nb",
+        }
+
+    def test_unset_fields_are_none(self):
+        from evernote.edam.type.ttypes import Note
+
+        pick = FieldPicker(guid="guid", title="title")
+
+        assert pick(Note(guid="g1")) == {"guid": "g1", "title": None}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
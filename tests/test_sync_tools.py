@@ -1,5 +1,6 @@
 """Integration tests for sync tools."""
 
+import asyncio
 import json
 from unittest.mock import MagicMock
 
@@ -53,11 +54,7 @@ class TestSyncTools:
         mock_counts = MockNoteCounts()
         mock.find_note_counts.return_value = mock_counts
 
-        mock_related = MagicMock()
-        mock_related.notes = []
-        mock_related.notebooks = []
-        mock_related.tags = []
-        mock_related.cacheKey = "cache-key-123"
+        mock_related = MagicMock(notes=[], notebooks=[], tags=[], cacheKey="cache-key-123")
         mock.find_related.return_value = mock_related
 
         return mock
@@ -130,6 +127,27 @@ class TestSyncTools:
             assert data["tag_counts"] == {"tag-1": 8, "tag-2": 3}
             assert data["trash_count"] == 2
 
+    def test_response_sent_as_text_only(self, mock_client, mcp):
+        register_sync_tools(mcp, mock_client)
+
+        content = asyncio.run(mcp.call_tool("get_sync_state", {}))
+
+        assert [c.type for c in content] == ["text"]
+        assert json.loads(content[0].text)["success"] is True
+
+    def test_find_note_counts_unset_maps(self, mock_client, mcp):
+        from evernote.edam.notestore.ttypes import NoteCollectionCounts
+
+        mock_client.find_note_counts.return_value = NoteCollectionCounts(
+            notebookCounts={"nb-1": 1}
+        )
+        register_sync_tools(mcp, mock_client)
+
+        data = json.loads(mcp._tool_manager._tools["find_note_counts"].fn())
+
+        assert data["notebook_counts"] == {"nb-1": 1}
+        assert data["tag_counts"] == {}
+
     def test_find_note_counts_with_query(self, mock_client, mcp):
         register_sync_tools(mcp, mock_client)
 
@@ -201,23 +219,20 @@ class TestSyncTools:
 
     def test_find_related_with_results(self, mock_client, mcp):
         # Set up related content
-        mock_note = MagicMock()
-        mock_note.guid = "related-note-1"
-        mock_note.title = "Related Note"
+        mock_note = MagicMock(guid="related-note-1", title="Related Note")
 
-        mock_nb = MagicMock()
-        mock_nb.guid = "related-nb-1"
+        mock_nb = MagicMock(guid="related-nb-1")
         mock_nb.name = "Related Notebook"
 
-        mock_tag = MagicMock()
-        mock_tag.guid = "related-tag-1"
+        mock_tag = MagicMock(guid="related-tag-1")
         mock_tag.name = "related-tag"
 
-        mock_related = MagicMock()
-        mock_related.notes = [mock_note]
-        mock_related.notebooks = [mock_nb]
-        mock_related.tags = [mock_tag]
-        mock_related.cacheKey = "cache-456"
+        mock_related = MagicMock(
+            notes=[mock_note],
+            notebooks=[mock_nb],
+            tags=[mock_tag],
+            cacheKey="cache-456",
+        )
         mock_client.find_related.return_value = mock_related
 
         register_sync_tools(mcp, mock_client)
@@ -0,0 +1,433 @@
+"""Unit tests for Thrift transport helpers."""
+
+import asyncio
+import http.client
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+from evernote.edam.error.ttypes import EDAMErrorCode, EDAMSystemException
+from evernote.edam.type.ttypes import Note, NoteAttributes
+from evernote_backup.evernote_client_api_http import RetryableMixin, TBinaryProtocolHotfix
+from thrift.transport.TTransport import TMemoryBuffer
+
+from evernote_mcp.transport import (
+    AcceleratedBinaryProtocol,
+    ConnectionPool,
+    KeepAliveHttpClient,
+    NoteStorePool,
+    RateLimitRetryMixin,
+    create_note_store,
+    get_ssl_context,
+)
+
+
+class TestNoteStorePool:
+    """Test the per-thread NoteStore client pool."""
+
+    def test_reuses_client_within_thread(self):
+        factory = MagicMock(side_effect=lambda: object())
+        pool = NoteStorePool(factory)
+
+        assert pool.get() is pool.get()
+        factory.assert_called_once()
+
+    def test_separate_client_per_thread(self):
+        pool = NoteStorePool(object)
+        main_store = pool.get()
+        seen = []
+
+        thread = threading.Thread(target=lambda: seen.append(pool.get()))
+        thread.start()
+        thread.join()
+
+        assert seen[0] is not main_store
+
+    def test_recycles_client_after_max_age(self):
+        pool = NoteStorePool(object, max_age=10.0)
+
+        with patch("evernote_mcp.transport.time.monotonic", return_value=100.0):
+            first = pool.get()
+        with patch("evernote_mcp.transport.time.monotonic", return_value=105.0):
+            assert pool.get() is first
+        with patch("evernote_mcp.transport.time.monotonic", return_value=111.0):
+            assert pool.get() is not first
+
+
+class TestCreateNoteStore:
+    """Test NoteStore client construction."""
+
+    def test_ssl_context_is_shared(self):
+        assert get_ssl_context(None) is get_ssl_context(None)
+
+    def test_transports_share_ssl_context(self):
+        stores = [
+            create_note_store(
+                url="https://www.evernote.com/edam/note/s1",
+                auth_token="test_token",
+                user_agent="test-agent",
+                cafile=None,
+                retry_max=1,
+            )
+            for _ in range(2)
+        ]
+
+        transports = [store._client._iprot.trans for store in stores]
+        assert transports[0] is not transports[1]
+        assert transports[0].context is transports[1].context is get_ssl_context(None)
+
+    def test_note_store_carries_token(self):
+        store = create_note_store(
+            url="https://www.evernote.com/edam/note/s1",
+            auth_token="test_token",
+            user_agent="test-agent",
+            cafile=None,
+            retry_max=1,
+        )
+
+        assert store.authenticationToken == "test_token"
+
+
+class TestAcceleratedBinaryProtocol:
+    """Test the C-accelerated binary protocol."""
+
+    @staticmethod
+    def _encode(protocol_class, struct):
+        buf = TMemoryBuffer()
+        struct.write(protocol_class(buf))
+        return buf.getvalue()
+
+    def test_uses_fast_encoder(self):
+        assert AcceleratedBinaryProtocol(TMemoryBuffer())._fast_encode is not None
+
+    def test_wire_format_matches_pure_python(self):
+        note = Note(
+            guid="g1",
+            title="Tïtle",
+            tagGuids=["t1", "t2"],
+            active=False,
+            attributes=NoteAttributes(reminderTime=1704067200000),
+        )
+
+        assert (self._encode(AcceleratedBinaryProtocol, note)
+                == self._encode(TBinaryProtocolHotfix, note))
+
+    def test_decode_replaces_invalid_utf8(self):
+        data = self._encode(TBinaryProtocolHotfix, Note(guid="g1", title="XXXX"))
+        note = Note()
+        note.read(AcceleratedBinaryProtocol(TMemoryBuffer(data.replace(b"XXXX", b"\xffXXX"))))
+
+        assert note.title == "\ufffdXXX"
+
+    def test_note_store_uses_accelerated_protocol(self):
+        store = create_note_store(
+            url="https://www.evernote.com/edam/note/s1",
+            auth_token="test_token",
+            user_agent="test-agent",
+            cafile=None,
+            retry_max=1,
+        )
+
+        assert isinstance(store._client._oprot, AcceleratedBinaryProtocol)
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    """Echo the POST body back and record the client port of each request."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.ports.append(self.client_address[1])
+        if self.server.drop_before_response:
+            self.close_connection = True
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        if self.server.close_after_response:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+        # Simulate an idle timeout: drop the socket without announcing it
+        self.close_connection = self.server.drop_after_response
+
+    def log_message(self, *args):
+        pass
+
+
+class TestKeepAliveHttpClient:
+    """Test connection reuse in the Thrift HTTP transport."""
+
+    @pytest.fixture
+    def server(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _EchoHandler)
+        server.ports = []
+        server.close_after_response = False
+        server.drop_after_response = False
+        server.drop_before_response = False
+        server.url = f"http://127.0.0.1:{server.server_port}/"
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    @staticmethod
+    def _round_trip(transport, payload):
+        transport.write(payload)
+        transport.flush()
+        return transport.read(len(payload))
+
+    def test_reuses_connection(self, server):
+        transport = KeepAliveHttpClient(server.url, pool=ConnectionPool())
+
+        assert self._round_trip(transport, b"one") == b"one"
+        assert self._round_trip(transport, b"two") == b"two"
+
+        assert len(server.ports) == 2
+        assert server.ports[0] == server.ports[1]
+
+    def test_honors_connection_close(self, server):
+        server.close_after_response = True
+        transport = KeepAliveHttpClient(server.url, pool=ConnectionPool())
+
+        self._round_trip(transport, b"one")
+        self._round_trip(transport, b"two")
+
+        assert server.ports[0] != server.ports[1]
+
+    def test_response_buffered_before_decoding(self, server):
+        transport = KeepAliveHttpClient(server.url, pool=ConnectionPool())
+
+        transport.write(b"unread")
+        transport.flush()
+        assert transport.cstringio_buf.getvalue() == b"unread"
+        assert self._round_trip(transport, b"two") == b"two"
+
+        # The previous body was drained at flush, so the connection is reused
+        assert server.ports[0] == server.ports[1]
+
+    def test_fast_decode_reads_from_response(self, server):
+        transport = KeepAliveHttpClient(server.url, pool=ConnectionPool())
+        protocol = AcceleratedBinaryProtocol(transport)
+        Note(guid="g1", title="Tïtle").write(protocol)
+        transport.flush()
+
+        note = Note()
+        with patch.object(protocol, "readStructBegin") as pure_python_read:
+            note.read(protocol)
+
+        pure_python_read.assert_not_called()
+        assert (note.guid, note.title) == ("g1", "Tïtle")
+
+    def test_transports_share_pooled_connection(self, server):
+        pool = ConnectionPool()
+        first = KeepAliveHttpClient(server.url, pool=pool)
+        second = KeepAliveHttpClient(server.url, pool=pool)
+
+        self._round_trip(first, b"one")
+        self._round_trip(second, b"two")
+
+        assert server.ports[0] == server.ports[1]
+
+    def test_resends_when_idle_connection_dropped(self, server):
+        server.drop_after_response = True
+        transport = KeepAliveHttpClient(server.url, pool=ConnectionPool())
+
+        self._round_trip(transport, b"one")
+        assert self._round_trip(transport, b"two") == b"two"
+
+        assert len(server.ports) == 2
+        assert server.ports[0] != server.ports[1]
+
+    def test_resend_skips_other_dropped_idle_connections(self, server):
+        server.drop_after_response = True
+        pool = ConnectionPool()
+        first = KeepAliveHttpClient(server.url, pool=pool)
+        second = KeepAliveHttpClient(server.url, pool=pool)
+
+        # Park two connections the server has since dropped
+        self._round_trip(first, b"one")
+        parked = pool.acquire(first._pool_key)
+        self._round_trip(second, b"two")
+        pool.release(first._pool_key, parked)
+
+        assert self._round_trip(first, b"three") == b"three"
+        assert len(set(server.ports)) == 3
+
+    def test_resends_when_send_fails_on_reused_connection(self, server):
+        transport = KeepAliveHttpClient(server.url, pool=ConnectionPool())
+        self._round_trip(transport, b"one")
+        real_send = http.client.HTTPConnection.send
+        failed = []
+
+        def send(conn, data):
+            if not failed:
+                failed.append(conn)
+                raise BrokenPipeError()
+            return real_send(conn, data)
+
+        with patch.object(http.client.HTTPConnection, "send", send):
+            assert self._round_trip(transport, b"two") == b"two"
+
+        assert len(server.ports) == 2
+        assert server.ports[0] != server.ports[1]
+
+    def test_dropped_after_send_not_resent(self, server):
+        transport = KeepAliveHttpClient(server.url, pool=ConnectionPool())
+        self._round_trip(transport, b"one")
+
+        # The server takes the request, then closes without answering
+        server.drop_before_response = True
+        with pytest.raises(http.client.RemoteDisconnected):
+            self._round_trip(transport, b"createNote")
+
+        assert len(server.ports) == 2
+
+
+class TestConnectionPool:
+    """Test the shared idle connection pool."""
+
+    @pytest.fixture
+    def sockets(self):
+        """A connected socket pair; the first end stands in for a pooled connection."""
+        local, remote = socket.socketpair()
+        yield local, remote
+        local.close()
+        remote.close()
+
+    def test_acquire_returns_released_connection(self, sockets):
+        pool = ConnectionPool()
+        conn = MagicMock(sock=sockets[0])
+
+        pool.release(("https", "host", 443), conn)
+
+        assert pool.acquire(("https", "other", 443)) is None
+        assert pool.acquire(("https", "host", 443)) is conn
+        assert pool.acquire(("https", "host", 443)) is None
+
+    def test_acquire_skips_connection_dropped_by_server(self, sockets):
+        pool = ConnectionPool()
+        live, dropped = MagicMock(sock=sockets[0]), MagicMock()
+        other_local, other_remote = socket.socketpair()
+        dropped.sock = other_local
+        other_remote.close()
+
+        pool.release(("k",), live)
+        pool.release(("k",), dropped)
+
+        assert pool.acquire(("k",)) is live
+        dropped.close.assert_called_once()
+        other_local.close()
+
+    def test_release_closes_connections_beyond_maxsize(self):
+        pool = ConnectionPool(maxsize=1)
+        kept, extra = MagicMock(), MagicMock()
+
+        pool.release(("k",), kept)
+        pool.release(("k",), extra)
+
+        extra.close.assert_called_once()
+        kept.close.assert_not_called()
+
+    def test_clear_closes_idle_connections(self):
+        pool = ConnectionPool()
+        conn = MagicMock()
+        pool.release(("k",), conn)
+
+        pool.clear()
+
+        conn.close.assert_called_once()
+        assert pool.acquire(("k",)) is None
+
+
+class _FakeStore(RateLimitRetryMixin, RetryableMixin):
+    """Stand-in NoteStore whose getNote replays ``results``."""
+
+    def __init__(self, results, retry_max=3):
+        super().__init__(retry_max=retry_max, retry_delay=0)
+        self._results = iter(results)
+        self._calls = 0
+
+    def getNote(self, guid):
+        self._calls += 1
+        result = next(self._results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def _rate_limited(duration):
+    return EDAMSystemException(
+        errorCode=EDAMErrorCode.RATE_LIMIT_REACHED, rateLimitDuration=duration
+    )
+
+
+class TestRateLimitRetry:
+    """Test waiting out RATE_LIMIT_REACHED errors."""
+
+    def test_sleeps_rate_limit_duration_then_retries(self):
+        store = _FakeStore([_rate_limited(2), _rate_limited(3), "note"])
+
+        with patch("evernote_mcp.transport.time.sleep") as sleep:
+            assert store.getNote("g") == "note"
+
+        assert [c.args[0] for c in sleep.call_args_list] == [2, 3]
+
+    def test_gives_up_after_retry_max(self):
+        error = _rate_limited(1)
+        store = _FakeStore([error] * 3, retry_max=2)
+
+        with patch("evernote_mcp.transport.time.sleep"):
+            with pytest.raises(EDAMSystemException) as exc_info:
+                store.getNote("g")
+
+        assert exc_info.value is error
+        assert store._calls == 3
+
+    def test_long_wait_raised_immediately(self):
+        store = _FakeStore([_rate_limited(3600), "note"])
+
+        with patch("evernote_mcp.transport.time.sleep") as sleep:
+            with pytest.raises(EDAMSystemException):
+                store.getNote("g")
+
+        sleep.assert_not_called()
+
+    def test_no_wait_on_event_loop_thread(self):
+        store = _FakeStore([_rate_limited(2), "note"])
+
+        async def call():
+            return store.getNote("g")
+
+        with patch("evernote_mcp.transport.time.sleep") as sleep:
+            with pytest.raises(EDAMSystemException):
+                asyncio.run(call())
+
+        sleep.assert_not_called()
+        assert store._calls == 1
+
+    def test_worker_thread_still_waits(self):
+        store = _FakeStore([_rate_limited(2), "note"])
+
+        async def call():
+            return await asyncio.to_thread(store.getNote, "g")
+
+        with patch("evernote_mcp.transport.time.sleep") as sleep:
+            assert asyncio.run(call()) == "note"
+
+        sleep.assert_called_once_with(2)
+
+    def test_other_system_errors_not_retried(self):
+        store = _FakeStore([EDAMSystemException(errorCode=EDAMErrorCode.INTERNAL_ERROR), "note"])
+
+        with pytest.raises(EDAMSystemException):
+            store.getNote("g")
+
+        assert store._calls == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
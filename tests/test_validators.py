@@ -10,6 +10,7 @@ from evernote_mcp.util.validators import (
     validate_search_query,
     validate_limit,
     validate_notebook_name,
+    validate_guid,
 )
 
 
@@ -58,6 +59,14 @@ class TestValidateContent:
         large_enml = "<en-note>" + "a" * (10 * 1024 * 1024) + "</en-note>"
         validate_content(large_enml, is_enml=True)  # Should not raise
 
+    def test_counts_utf8_bytes_not_characters(self):
+        """Test that multi-byte characters count by their encoded size."""
+        # 4MB characters, 12MB once encoded
+        cjk_content = "中" * (4 * 1024 * 1024)
+        with pytest.raises(ValidationError, match="too large"):
+            validate_content(cjk_content)
+        validate_content(cjk_content, is_enml=True)  # Should not raise
+
 
 class TestValidateTags:
     """Test tag validation."""
@@ -157,5 +166,34 @@ class TestValidateNotebookName:
             validate_notebook_name("a" * 101)
 
 
+
+class TestValidateGuid:
+    """Test GUID validation."""
+
+    @pytest.mark.parametrize("guid", [
+        "12345678-9abc-def0-1234-56789abcdef0",
+        "123456789abcdef0123456789abcdef0",
+    ])
+    def test_accepts_valid_guid(self, guid):
+        """Test that dashed and undashed hex GUIDs are accepted."""
+        validate_guid(guid)  # Should not raise
+
+    def test_rejects_empty_guid(self):
+        """Test that empty GUIDs are rejected."""
+        with pytest.raises(ValidationError, match="cannot be empty"):
+            validate_guid("", "note")
+
+    @pytest.mark.parametrize("guid", [
+        "12345678-9abc-def0-1234",
+        "12345678-9abc-def0-1234-56789abcdefg",
+        "12345678 9abc def0 1234 56789abcdef0",
+        "12345678-9abc-def0-1234-56789abcdef0a",
+    ])
+    def test_rejects_malformed_guid(self, guid):
+        """Test that wrong lengths and non-hex characters are rejected."""
+        with pytest.raises(ValidationError, match="Invalid note GUID format"):
+            validate_guid(guid, "note")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])